@@ -0,0 +1,14 @@
+"""
+Benchmarks of seekpath.
+
+The benchmarks follow the conventions of `asv`_ (``time_*`` and
+``peakmem_*`` methods of classes with ``params`` and ``setup``), and can be
+run either with asv (``asv run``, configured in ``asv.conf.json``), or
+offline, without any additional package, with::
+
+    python benchmarks/run.py
+
+(see ``python benchmarks/run.py --help``).
+
+.. _asv: https://asv.readthedocs.io
+"""
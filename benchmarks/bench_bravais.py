@@ -0,0 +1,67 @@
+"""Benchmarks on the example structures of all extended Bravais lattices."""
+
+from .common import EXT_BRAVAIS_LATTICES, get_band_path_structure, get_conventional
+
+
+class BravaisLattices:
+    """Time and peak memory of each stage, for each extended Bravais lattice."""
+
+    params = EXT_BRAVAIS_LATTICES
+    param_names = ('ext_bravais',)
+
+    def setup(self, ext_bravais):
+        from seekpath import getpaths
+
+        self.structure = get_band_path_structure(ext_bravais)
+        self.conventional, self.bravais_lattice = get_conventional(self.structure)
+        self.res = getpaths.get_path(self.structure)
+
+    def time_hpkot_get_path(self, ext_bravais):
+        from seekpath import hpkot
+
+        hpkot.get_path(self.structure)
+
+    def peakmem_hpkot_get_path(self, ext_bravais):
+        from seekpath import hpkot
+
+        hpkot.get_path(self.structure)
+
+    def time_get_primitive(self, ext_bravais):
+        from seekpath.hpkot.spg_mapping import get_primitive
+
+        get_primitive(self.conventional, self.bravais_lattice)
+
+    def time_get_explicit_from_implicit(self, ext_bravais):
+        from seekpath.getpaths import get_explicit_from_implicit
+
+        get_explicit_from_implicit(self.res, reference_distance=0.025)
+
+    def peakmem_get_explicit_from_implicit(self, ext_bravais):
+        from seekpath.getpaths import get_explicit_from_implicit
+
+        get_explicit_from_implicit(self.res, reference_distance=0.025)
+
+
+class BrillouinZone:
+    """Time of the construction of the Brillouin zone (requires scipy)."""
+
+    params = EXT_BRAVAIS_LATTICES
+    param_names = ('ext_bravais',)
+
+    def setup(self, ext_bravais):
+        from seekpath import getpaths
+
+        try:
+            from seekpath.brillouinzone.brillouinzone import BZ
+        except ImportError as exc:
+            # Skips the benchmark
+            raise NotImplementedError('scipy is not installed') from exc
+        self.bz_class = BZ
+        res = getpaths.get_path(get_band_path_structure(ext_bravais))
+        self.b_vectors = res['reciprocal_primitive_lattice']
+
+    def time_bz(self, ext_bravais):
+        self.bz_class(*self.b_vectors)
+
+    def peakmem_bz(self, ext_bravais):
+        self.bz_class(*self.b_vectors)
@@ -0,0 +1,62 @@
+"""Benchmarks of the scaling with the number of atoms."""
+
+from .common import SUPERCELL_FACTORS, get_conventional, get_supercell
+
+
+class SupercellScaling:
+    """
+    Time and peak memory of the stages that depend on the number of atoms,
+    for supercells from 1 to 10^4 atoms (see
+    :py:func:`~benchmarks.common.get_supercell`).
+    """
+
+    params = sorted(SUPERCELL_FACTORS)
+    param_names = ('num_atoms',)
+    # The largest supercell takes several seconds per call
+    timeout = 600
+
+    def setup_cache(self):
+        """Return the supercells and their conventional cells (computed once)."""
+        cache = {}
+        for num_atoms in self.params:
+            structure = get_supercell(num_atoms)
+            cache[num_atoms] = (structure,) + get_conventional(structure)
+        return cache
+
+    def setup(self, cache, num_atoms):
+        self.structure, self.conventional, self.bravais_lattice = cache[num_atoms]
+
+    def time_hpkot_get_path(self, cache, num_atoms):
+        from seekpath import hpkot
+
+        hpkot.get_path(self.structure)
+
+    def peakmem_hpkot_get_path(self, cache, num_atoms):
+        from seekpath import hpkot
+
+        hpkot.get_path(self.structure)
+
+    def time_get_primitive(self, cache, num_atoms):
+        from seekpath.hpkot.spg_mapping import get_primitive
+
+        get_primitive(self.conventional, self.bravais_lattice)
+
+    def peakmem_get_primitive(self, cache, num_atoms):
+        from seekpath.hpkot.spg_mapping import get_primitive
+
+        get_primitive(self.conventional, self.bravais_lattice)
+
+    def time_get_path_orig_cell(self, cache, num_atoms):
+        from seekpath import getpaths
+
+        getpaths.get_path_orig_cell(self.structure, diagnostics='collect')
+
+    def time_fingerprint(self, cache, num_atoms):
+        from seekpath import fingerprint
+
+        fingerprint(self.structure)
+
+    def peakmem_fingerprint(self, cache, num_atoms):
+        from seekpath import fingerprint
+
+        fingerprint(self.structure)
@@ -0,0 +1,73 @@
+"""Structures used by the benchmarks."""
+
+import glob
+import os
+
+import numpy as np
+
+import seekpath
+
+# The folder with the example structures of each extended Bravais lattice
+BAND_PATH_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(seekpath.__file__)), 'hpkot', 'band_path_data'
+)
+
+# The extended Bravais lattices with an example structure
+EXT_BRAVAIS_LATTICES = sorted(
+    name
+    for name in os.listdir(BAND_PATH_DATA)
+    if glob.glob(os.path.join(BAND_PATH_DATA, name, 'POSCAR_*'))
+)
+
+# Number of atoms of the supercells -> supercell factors along the axes
+SUPERCELL_FACTORS = {
+    1: (1, 1, 1),
+    10: (1, 2, 5),
+    100: (4, 5, 5),
+    1000: (10, 10, 10),
+    10000: (20, 25, 20),
+}
+
+
+def get_band_path_structure(ext_bravais):
+    """
+    Return the first example structure of an extended Bravais lattice
+    (``POSCAR_inversion`` if present).
+    """
+    from seekpath import io
+
+    paths = sorted(glob.glob(os.path.join(BAND_PATH_DATA, ext_bravais, 'POSCAR_*')))
+    return io.read_poscar(paths[0])
+
+
+def get_supercell(num_atoms):
+    """
+    Return a supercell with ``num_atoms`` atoms (a key of
+    :py:data:`SUPERCELL_FACTORS`) of a simple cubic cell with one atom,
+    where the first atom is replaced by a different species: the
+    primitive (and conventional) cell is therefore the whole supercell.
+    """
+    factors = np.array(SUPERCELL_FACTORS[num_atoms])
+    grid = np.stack(
+        np.meshgrid(*[np.arange(factor) for factor in factors], indexing='ij'),
+        axis=-1,
+    ).reshape(-1, 3)
+    cell = np.diag(3.0 * factors)
+    positions = grid / factors
+    numbers = np.ones(len(positions), dtype=int)
+    if num_atoms > 1:
+        numbers[0] = 2
+    return cell, positions, numbers
+
+
+def get_conventional(structure):
+    """
+    Return the standardized conventional cell of a structure (the input of
+    :py:func:`seekpath.hpkot.spg_mapping.get_primitive`) and its Bravais
+    lattice.
+    """
+    from seekpath import hpkot
+
+    res = hpkot.get_path(structure)
+    conventional = (res['conv_lattice'], res['conv_positions'], res['conv_types'])
+    return conventional, res['bravais_lattice']
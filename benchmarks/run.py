@@ -0,0 +1,198 @@
+"""
+Run the benchmarks offline, without asv or any other additional package::
+
+    python benchmarks/run.py                  # all benchmarks
+    python benchmarks/run.py -k SupercellScaling --quick
+    python benchmarks/run.py --json results.json
+
+The benchmarks of the ``benchmarks/bench_*.py`` modules are run with the
+conventions of asv: for each class, ``setup_cache`` (if defined) is called
+once, and ``setup`` before the benchmarks of each combination of
+``params`` (a ``NotImplementedError`` skips them). For ``time_*``
+methods, the best time per call over ``--repeat`` repetitions is reported.
+For ``peakmem_*`` methods, the peak of the memory allocated during the
+call, as traced by :py:mod:`tracemalloc` (Python objects and NumPy arrays,
+not the internal allocations of spglib or scipy), is reported. Note
+that asv reports instead the peak resident memory of the process.
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import sys
+import timeit
+import tracemalloc
+
+# The root of the repository, so that 'benchmarks' is importable
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Minimum total duration of the calls of each timing repetition, in seconds
+MIN_REPETITION_TIME = 0.2
+
+
+def iter_benchmark_classes():
+    """Iterate over the benchmark classes of the ``bench_*`` modules."""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    import benchmarks
+
+    for module_info in sorted(pkgutil.iter_modules(benchmarks.__path__)):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f'benchmarks.{module_info.name}')
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__:
+                yield cls
+
+
+def get_param_combinations(cls):
+    """Return the combinations of the parameters of a benchmark class."""
+    params = getattr(cls, 'params', [])
+    if not params:
+        return [()]
+    if len(getattr(cls, 'param_names', [])) > 1:
+        return list(itertools.product(*params))
+    return [(param,) for param in params]
+
+
+def measure_time(function, repeat, quick):
+    """Return the best time per call of ``function``, in seconds."""
+    timer = timeit.Timer(function)
+    if quick:
+        return timer.timeit(number=1)
+    number, total = timer.autorange()
+    times = [total / number]
+    # Do not repeat calls that take longer than a repetition
+    if number > 1 or total < MIN_REPETITION_TIME:
+        times += [time / number for time in timer.repeat(repeat - 1, number)]
+    return min(times)
+
+
+def measure_peak_memory(function):
+    """Return the peak memory (in bytes) traced during a call of ``function``."""
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def format_value(value, unit):
+    """Return a value in seconds or bytes with a readable unit."""
+    scales = (
+        [('s', 1.0), ('ms', 1e-3), ('us', 1e-6)]
+        if unit == 's'
+        else [('MiB', 2**20), ('KiB', 2**10), ('B', 1)]
+    )
+    for name, scale in scales:
+        if value >= scale:
+            return f'{value / scale:.3g} {name}'
+    return f'{value / scales[-1][1]:.3g} {scales[-1][0]}'
+
+
+def run(pattern=None, repeat=3, quick=False):
+    """
+    Run the benchmarks whose name ``Class.method`` contains ``pattern``.
+
+    :return: a list of dictionaries with keys ``benchmark``, ``params``
+        (as a dictionary), ``value``, ``unit`` (``'s'`` or ``'bytes'``) and
+        ``status`` (``'ok'``, ``'skipped'`` or ``'failed'``).
+    """
+    results = []
+    for cls in iter_benchmark_classes():
+        methods = sorted(
+            name
+            for name in dir(cls)
+            if name.startswith(('time_', 'peakmem_'))
+            and (pattern is None or pattern in f'{cls.__name__}.{name}')
+        )
+        if not methods:
+            continue
+        cache_args = ()
+        if hasattr(cls, 'setup_cache'):
+            cache_args = (cls().setup_cache(),)
+        param_names = getattr(cls, 'param_names', [])
+        for params in get_param_combinations(cls):
+            args = cache_args + params
+            instance = cls()
+            status = 'ok'
+            try:
+                if hasattr(instance, 'setup'):
+                    instance.setup(*args)
+            except NotImplementedError:
+                status = 'skipped'
+            except Exception as exc:  # noqa: BLE001
+                print(f'{cls.__name__}.setup{params}: {exc!r}', file=sys.stderr)
+                status = 'failed'
+
+            for name in methods:
+                method = getattr(instance, name)
+                unit = 's' if name.startswith('time_') else 'bytes'
+                result = {
+                    'benchmark': f'{cls.__name__}.{name}',
+                    'params': dict(zip(param_names, params)),
+                    'value': None,
+                    'unit': unit,
+                    'status': status,
+                }
+                if status == 'ok':
+                    try:
+                        if unit == 's':
+                            result['value'] = measure_time(
+                                lambda method=method, args=args: method(*args),
+                                repeat,
+                                quick,
+                            )
+                        else:
+                            result['value'] = measure_peak_memory(
+                                lambda method=method, args=args: method(*args)
+                            )
+                    except Exception as exc:  # noqa: BLE001
+                        print(f'{result["benchmark"]}: {exc!r}', file=sys.stderr)
+                        result['status'] = 'failed'
+                results.append(result)
+                params_string = ', '.join(
+                    f'{key}={value}' for key, value in result['params'].items()
+                )
+                value_string = (
+                    format_value(result['value'], unit)
+                    if result['status'] == 'ok'
+                    else result['status']
+                )
+                print(f'{result["benchmark"]:<50} {params_string:<20} {value_string}')
+                sys.stdout.flush()
+    return results
+
+
+def main(argv=None):
+    """Parse the arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description='Run the benchmarks of seekpath.')
+    parser.add_argument(
+        '-k', dest='pattern', help='run only the benchmarks containing PATTERN'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3, help='number of timing repetitions'
+    )
+    parser.add_argument(
+        '--quick', action='store_true', help='time a single call of each benchmark'
+    )
+    parser.add_argument('--json', help='write the results to a JSON file')
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error('--repeat must be a positive integer')
+
+    results = run(pattern=args.pattern, repeat=args.repeat, quick=args.quick)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+    return 1 if any(result['status'] == 'failed' for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
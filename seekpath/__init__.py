@@ -37,24 +37,63 @@ class SupercellWarning(UserWarning):
     """
 
 
+from .batch import get_path_batch, get_path_batch_shared_memory
+from .fingerprints import fingerprint
 from .getpaths import (
-    get_path,
     get_explicit_k_path,
-    get_path_orig_cell,
     get_explicit_k_path_orig_cell,
+    get_kpoint_transformation_orig_cell,
+    get_path,
+    get_path_orig_cell,
+    get_path_orig_cell_supercells,
 )
-
 from .hpkot import EdgeCaseWarning, SymmetryDetectionError
-from .brillouinzone import brillouinzone
+from .results import PathResult
+from .scan import scan_symprec
+from .serialization import from_jsonable, to_jsonable
+from .structures import StructureBatch
+from .trajectory import get_path_trajectory
+
+# Submodules that are imported only when first accessed, because they
+# depend on heavy (and optional) packages, e.g. scipy for brillouinzone
+_LAZY_SUBMODULES = {
+    'brillouinzone': '.brillouinzone.brillouinzone',
+}
+
+
+def __getattr__(name):
+    """Import lazily the submodules listed in ``_LAZY_SUBMODULES``."""
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        module = importlib.import_module(_LAZY_SUBMODULES[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
 
 
 __all__ = (
-    'get_path',
-    'get_explicit_k_path',
-    'get_path_orig_cell',
-    'get_explicit_k_path_orig_cell',
     'EdgeCaseWarning',
-    'SymmetryDetectionError',
+    'PathResult',
+    'StructureBatch',
     'SupercellWarning',
+    'SymmetryDetectionError',
     'brillouinzone',
+    'fingerprint',
+    'from_jsonable',
+    'get_explicit_k_path',
+    'get_explicit_k_path_orig_cell',
+    'get_kpoint_transformation_orig_cell',
+    'get_path',
+    'get_path_batch',
+    'get_path_batch_shared_memory',
+    'get_path_orig_cell',
+    'get_path_orig_cell_supercells',
+    'get_path_trajectory',
+    'scan_symprec',
+    'to_jsonable',
 )
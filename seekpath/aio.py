@@ -0,0 +1,135 @@
+"""
+asyncio interface to seekpath.
+
+The functions of :py:mod:`seekpath.getpaths` are CPU-bound and block for
+tens to hundreds of milliseconds on large cells. The coroutines of this
+module run them in an executor instead, so that the event loop stays
+responsive (e.g. to overlap the path computation with network I/O):
+
+- with the default executor of the loop (or any
+  :py:class:`concurrent.futures.ThreadPoolExecutor`), results are not
+  pickled, but the computation (including the spglib symmetry analysis)
+  holds the GIL, so that calls do not run in parallel; use
+  ``diagnostics='collect'`` to get the diagnostics in the results (see
+  :py:mod:`seekpath.diagnostics`);
+- with a :py:class:`concurrent.futures.ProcessPoolExecutor`, calls run in
+  parallel, at the cost of pickling structures and results. Warnings
+  issued in the worker processes are not propagated: use
+  ``diagnostics='collect'``.
+"""
+
+import asyncio
+import functools
+
+from . import getpaths
+
+
+async def _run(func, structure, executor, semaphore, kwargs):
+    """Run ``func(structure, **kwargs)`` in ``executor``."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, structure, **kwargs)
+    if semaphore is None:
+        return await loop.run_in_executor(executor, call)
+    async with semaphore:
+        return await loop.run_in_executor(executor, call)
+
+
+async def get_path(structure, executor=None, semaphore=None, **kwargs):
+    """
+    Coroutine running :py:func:`seekpath.get_path` in an executor.
+
+    :param structure: the structure, as for :py:func:`seekpath.get_path`.
+    :param executor: the :py:class:`concurrent.futures.Executor` to use
+        (None for the default executor of the running loop, i.e. a thread
+        pool).
+    :param semaphore: if not None, an :py:class:`asyncio.Semaphore` shared
+        among calls to limit the number of concurrent computations (e.g.
+        to the number of workers of ``executor``, so that requests queue in
+        the event loop rather than in the executor).
+    :param kwargs: the other parameters of :py:func:`seekpath.get_path`.
+
+    :return: the output of :py:func:`seekpath.get_path`.
+    """
+    return await _run(getpaths.get_path, structure, executor, semaphore, kwargs)
+
+
+async def get_explicit_k_path(structure, executor=None, semaphore=None, **kwargs):
+    """
+    Coroutine running :py:func:`seekpath.get_explicit_k_path` in an executor.
+
+    The parameters are the same as for :py:func:`get_path`, and ``kwargs``
+    are passed to :py:func:`seekpath.get_explicit_k_path`.
+
+    :return: the output of :py:func:`seekpath.get_explicit_k_path`.
+    """
+    return await _run(
+        getpaths.get_explicit_k_path, structure, executor, semaphore, kwargs
+    )
+
+
+async def get_paths_as_completed(
+    structures, explicit=False, executor=None, max_concurrency=4, **kwargs
+):
+    """
+    Asynchronous iterator computing the paths of many structures, that
+    yields the results as they complete.
+
+    At most ``max_concurrency`` computations are submitted to the executor
+    at any time: the following structures are submitted as the previous
+    ones complete (so ``structures`` can be a lazy iterable). If a
+    computation raises, the exception is propagated and the computations
+    that are still pending are cancelled; the same happens if the iteration
+    is stopped early.
+
+    :param structures: an iterable of structures, as for
+        :py:func:`seekpath.get_path`.
+    :param explicit: if True, run :py:func:`seekpath.get_explicit_k_path`
+        instead of :py:func:`seekpath.get_path`.
+    :param executor: the :py:class:`concurrent.futures.Executor` to use
+        (None for the default executor of the running loop).
+    :param max_concurrency: the maximum number of concurrent computations.
+    :param kwargs: the other parameters of :py:func:`seekpath.get_path` (or
+        :py:func:`seekpath.get_explicit_k_path`).
+
+    :return: an asynchronous iterator of tuples ``(index, result)``, where
+        ``index`` is the position of the structure in ``structures``, in
+        order of completion.
+    """
+    if max_concurrency < 1:
+        raise ValueError('max_concurrency must be a positive integer')
+
+    loop = asyncio.get_running_loop()
+    func = getpaths.get_explicit_k_path if explicit else getpaths.get_path
+    structures = enumerate(structures)
+    pending = {}
+
+    def submit():
+        """Submit the next structure; return False if there are none left."""
+        try:
+            idx, structure = next(structures)
+        except StopIteration:
+            return False
+        future = loop.run_in_executor(
+            executor, functools.partial(func, structure, **kwargs)
+        )
+        pending[future] = idx
+        return True
+
+    try:
+        while len(pending) < max_concurrency and submit():
+            pass
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Yield in input order among those completed at the same time
+            for future in sorted(done, key=pending.get):
+                idx = pending.pop(future)
+                result = future.result()
+                submit()
+                yield idx, result
+    finally:
+        for future in pending:
+            if future.done() and not future.cancelled():
+                # Retrieve the exception (if any), not to have it logged
+                future.exception()
+            else:
+                future.cancel()
@@ -0,0 +1,406 @@
+"""
+Batch front ends to :py:func:`seekpath.get_path`, to process many
+structures at once.
+"""
+
+import copy
+
+import numpy as np
+
+from .fingerprints import fingerprint, get_cell_key
+from .getpaths import _check_output, get_path
+from .structures import ARRAY_NAMES, StructureBatch
+
+# Per-atom outputs of get_path, that get_path_batch_shared_memory returns
+# through shared memory: (key, number of columns, dtype). The conventional
+# cell has at most 4 times as many atoms as the input cell (F centering)
+PER_ATOM_OUTPUTS = (
+    ('conv_positions', 3, np.float64),
+    ('conv_types', None, np.intc),
+    ('primitive_positions', 3, np.float64),
+    ('primitive_types', None, np.intc),
+)
+MAX_CONV_ATOMS_RATIO = 4
+
+# Shared arrays of the current worker process (see _init_shared_memory_worker)
+_worker_blocks = []
+_worker_arrays = {}
+
+
+def group_by_fingerprint(structures, symprec=1e-05):
+    """
+    Group structures by their :py:func:`~seekpath.fingerprints.fingerprint`.
+
+    Fingerprints are only computed for the structures that share the
+    quantized cell and the number of atoms (see
+    :py:func:`~seekpath.fingerprints.get_cell_key`) with another structure:
+    the others cannot have duplicates.
+
+    :param structures: an iterable of structures ``(cell, positions, numbers)``.
+    :param symprec: the symmetry precision used for the fingerprints.
+
+    :return: a tuple ``(representatives, group_indices)``: ``representatives``
+        is a list with the index (in ``structures``) of the first structure
+        of each group, in order of first appearance; ``group_indices`` is a
+        list with, for each input structure, the index of its group in
+        ``representatives``.
+    """
+    if symprec <= 0:
+        raise ValueError(f'symprec must be positive, got {symprec}')
+
+    if not isinstance(structures, StructureBatch):
+        structures = list(structures)
+    cell_keys = [get_cell_key(structure, symprec=symprec) for structure in structures]
+    cell_key_counts = {}
+    for cell_key in cell_keys:
+        cell_key_counts[cell_key] = cell_key_counts.get(cell_key, 0) + 1
+
+    group_of_fingerprint = {}
+    representatives = []
+    group_indices = []
+    for idx, structure in enumerate(structures):
+        if cell_key_counts[cell_keys[idx]] > 1:
+            key = fingerprint(structure, symprec=symprec)
+        else:
+            # The structure is unique
+            key = (idx,)
+        group = group_of_fingerprint.get(key)
+        if group is None:
+            group = len(representatives)
+            group_of_fingerprint[key] = group
+            representatives.append(idx)
+        group_indices.append(group)
+    return representatives, group_indices
+
+
+def get_path_batch(
+    structures,
+    with_time_reversal=True,
+    recipe='hpkot',
+    threshold=1.0e-7,
+    symprec=1e-05,
+    angle_tolerance=-1.0,
+    output='dict',
+    diagnostics='warn',
+    max_workers=1,
+    deduplicate=True,
+):
+    """
+    Run :py:func:`seekpath.get_path` on many structures, computing the path
+    only once for each group of duplicate structures.
+
+    Structures are grouped by their
+    :py:func:`~seekpath.fingerprints.fingerprint` (so, structures that only
+    differ by a permutation of the atoms, by a rigid translation or by the
+    wrapping of the coordinates, within ``symprec``, are duplicates).
+    ``get_path`` is called on the first structure of each group, and the
+    result is expanded back to the input order.
+
+    .. note:: all structures of a group get the result of the first one. For
+        duplicates that are permuted or translated copies, quantities that
+        depend on the atoms (e.g. ``conv_positions``) can therefore differ
+        from those of a direct ``get_path`` call by the order of the atoms
+        or by an equivalent choice of the origin.
+
+    The parameters are the same as for :py:func:`seekpath.get_path`, apart
+    from:
+
+    :param structures: a list (or any iterable) of structures, each in the
+        format ``(cell, positions, numbers)`` accepted by ``get_path``, or a
+        :py:class:`~seekpath.structures.StructureBatch`.
+    :param max_workers: the number of threads computing the paths of the
+        distinct structures. If 1 (default), they are computed sequentially
+        in the calling thread; otherwise, a
+        :py:class:`concurrent.futures.ThreadPoolExecutor` with
+        ``max_workers`` threads is used (None for the default number of
+        threads of the executor). Threads avoid the cost of pickling the
+        structures and the results (as a process pool would need), but the
+        computation (including the spglib symmetry analysis) holds the GIL:
+        the threads do not run it in parallel. For parallel processing, use
+        :py:func:`get_path_batch_shared_memory` (or a
+        :py:class:`concurrent.futures.ProcessPoolExecutor`) instead. The
+        results do not depend on ``max_workers``. Use
+        ``diagnostics='collect'`` to get the diagnostics of each structure
+        in its result, since warning filters (e.g.
+        ``warnings.catch_warnings``) are not thread-safe.
+    :param deduplicate: if True (default), duplicates are computed once.
+        Only structures that share the cell and the number of atoms with
+        another structure are fingerprinted, so the cost is negligible for
+        batches without such structures. If False, no fingerprint is
+        computed and ``get_path`` is called on every structure (e.g. when
+        duplicates are known to be absent).
+
+    :return: a dictionary with the following keys:
+
+        - ``results``: a list with the output of ``get_path`` for each input
+          structure, in the input order. Each element is an independent
+          (deep) copy, that can be modified without affecting the others;
+          with ``output='result'``, the read-only
+          :py:class:`~seekpath.results.PathResult` objects are instead shared
+          among the structures of a group.
+        - ``num_structures``: the number of input structures.
+        - ``num_unique``: the number of distinct structures, i.e. of calls
+          to ``get_path``.
+        - ``duplication_ratio``: ``num_structures / num_unique`` (1.0 if
+          there are no duplicates, or no structures at all); the fraction of
+          saved ``get_path`` calls is ``1 - 1 / duplication_ratio``.
+        - ``group_indices``: for each input structure, the index of its group
+          (groups are numbered in order of first appearance).
+    """
+    _check_output(output)
+    if max_workers is not None and max_workers < 1:
+        raise ValueError('max_workers must be a positive integer or None')
+
+    if not isinstance(structures, StructureBatch):
+        structures = list(structures)
+    if deduplicate:
+        representatives, group_indices = group_by_fingerprint(
+            structures, symprec=symprec
+        )
+    else:
+        representatives = list(range(len(structures)))
+        group_indices = list(representatives)
+
+    def compute(idx):
+        return get_path(
+            structures[idx],
+            with_time_reversal=with_time_reversal,
+            recipe=recipe,
+            threshold=threshold,
+            symprec=symprec,
+            angle_tolerance=angle_tolerance,
+            output=output,
+            diagnostics=diagnostics,
+        )
+
+    if max_workers == 1:
+        unique_results = [compute(idx) for idx in representatives]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Diagnostics are collected per thread (see seekpath.diagnostics),
+        # and the lattice cache of seekpath.hpkot.tools is protected by a lock
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            unique_results = list(executor.map(compute, representatives))
+
+    results = []
+    used = [False] * len(unique_results)
+    for group in group_indices:
+        res = unique_results[group]
+        # The first structure of each group gets the computed result, the
+        # others a copy (PathResult objects are read-only, and are shared)
+        if used[group] and output != 'result':
+            res = copy.deepcopy(res)
+        used[group] = True
+        results.append(res)
+
+    num_structures = len(structures)
+    num_unique = len(representatives)
+    return {
+        'results': results,
+        'num_structures': num_structures,
+        'num_unique': num_unique,
+        'duplication_ratio': num_structures / num_unique if num_unique else 1.0,
+        'group_indices': group_indices,
+    }
+
+
+def _create_shared_array(blocks, shape, dtype):
+    """
+    Create an array in a new shared memory block (appended to ``blocks``),
+    and return it with its specification ``(name, shape, dtype)``.
+    """
+    from multiprocessing import shared_memory
+
+    dtype = np.dtype(dtype)
+    # Blocks cannot be empty
+    size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    block = shared_memory.SharedMemory(create=True, size=size)
+    blocks.append(block)
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return array, (block.name, shape, dtype.str)
+
+
+def _init_shared_memory_worker(specs):
+    """
+    Initializer of the worker processes: attach the shared arrays, whose
+    specifications ``(name, shape, dtype)`` are given by key in ``specs``.
+    """
+    from multiprocessing import shared_memory
+
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        _worker_arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _get_path_shared_memory_chunk(start, stop, kwargs):
+    """
+    Run get_path on the structures ``start`` to ``stop`` (excluded) of the
+    shared input arrays, in a worker process.
+
+    The per-atom outputs are written in the shared output arrays; return,
+    for each structure, the rest of the output with the number of atoms of
+    the conventional and of the primitive cell.
+    """
+    arrays = _worker_arrays
+    offsets = arrays['offsets']
+    retlist = []
+    for idx in range(start, stop):
+        begin, end = offsets[idx], offsets[idx + 1]
+        res = get_path(
+            (
+                arrays['cells'][idx],
+                arrays['positions'][begin:end],
+                arrays['numbers'][begin:end],
+            ),
+            **kwargs,
+        )
+        num_conv = len(res['conv_types'])
+        num_prim = len(res['primitive_types'])
+        for key, _, _ in PER_ATOM_OUTPUTS:
+            if key.startswith('conv_'):
+                out_begin, num_out = MAX_CONV_ATOMS_RATIO * begin, num_conv
+            else:
+                out_begin, num_out = begin, num_prim
+            arrays[key][out_begin : out_begin + num_out] = res[key]
+            # Keep the key, so that the order of the keys is preserved
+            res[key] = None
+        retlist.append((res, num_conv, num_prim))
+    return retlist
+
+
+def get_path_batch_shared_memory(
+    structures,
+    with_time_reversal=True,
+    recipe='hpkot',
+    threshold=1.0e-7,
+    symprec=1e-05,
+    angle_tolerance=-1.0,
+    output='dict',
+    diagnostics='warn',
+    max_workers=None,
+    chunksize=None,
+    mp_context=None,
+):
+    """
+    Run :py:func:`seekpath.get_path` on many structures with a process
+    pool, exchanging the atoms through shared memory.
+
+    With a plain process pool, pickling the structures to the workers and
+    the per-atom outputs (``conv_positions``, ``primitive_positions``, ...)
+    back can cost more than the computation for large structures. Here,
+    instead, the input cells, positions and numbers are concatenated in
+    :py:mod:`multiprocessing.shared_memory` blocks, as ragged arrays with
+    offsets (and so are the per-atom outputs): only the indices of the
+    structures of each task, and the small outputs (lattices, special
+    points, path, ...) are pickled. If ``structures`` is a
+    :py:class:`~seekpath.structures.StructureBatch`, its arrays are copied
+    directly in the shared memory.
+
+    The parameters are the same as for :py:func:`seekpath.get_path`, apart
+    from:
+
+    :param structures: a list (or any iterable) of structures, each in the
+        format ``(cell, positions, numbers)`` accepted by ``get_path``, or a
+        :py:class:`~seekpath.structures.StructureBatch`.
+    :param max_workers: the number of worker processes (None for the
+        default of :py:class:`concurrent.futures.ProcessPoolExecutor`).
+    :param chunksize: the number of structures sent to a worker in each
+        task. If None, the structures are split in about four tasks per
+        worker.
+    :param mp_context: the multiprocessing context used to start the
+        workers (None for the default one).
+
+    :return: a list with the output of ``get_path`` for each structure, in
+        the input order. Per-atom arrays are copied out of the shared
+        memory, that is released before returning. Warnings are issued in
+        the worker processes: use ``diagnostics='collect'`` to get them in
+        the results.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    _check_output(output)
+    if chunksize is not None and chunksize < 1:
+        raise ValueError('chunksize must be a positive integer or None')
+
+    if not isinstance(structures, StructureBatch):
+        structures = StructureBatch.from_structures(structures)
+    if not len(structures):
+        return []
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = -(-len(structures) // (4 * max_workers))
+
+    kwargs = {
+        'with_time_reversal': with_time_reversal,
+        'recipe': recipe,
+        'threshold': threshold,
+        'symprec': symprec,
+        'angle_tolerance': angle_tolerance,
+        'output': 'dict' if output == 'dict' else 'numpy',
+        'diagnostics': diagnostics,
+    }
+
+    blocks = []
+    arrays = {}
+    specs = {}
+    try:
+        for key in ARRAY_NAMES:
+            value = getattr(structures, key)
+            arrays[key], specs[key] = _create_shared_array(
+                blocks, value.shape, value.dtype
+            )
+            arrays[key][...] = value
+        num_atoms = len(structures.positions)
+        for key, num_columns, dtype in PER_ATOM_OUTPUTS:
+            num_rows = num_atoms * (
+                MAX_CONV_ATOMS_RATIO if key.startswith('conv_') else 1
+            )
+            shape = (num_rows,) if num_columns is None else (num_rows, num_columns)
+            arrays[key], specs[key] = _create_shared_array(blocks, shape, dtype)
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_shared_memory_worker,
+            initargs=(specs,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _get_path_shared_memory_chunk,
+                    start,
+                    min(start + chunksize, len(structures)),
+                    kwargs,
+                )
+                for start in range(0, len(structures), chunksize)
+            ]
+            chunks = [future.result() for future in futures]
+
+        offsets = arrays['offsets']
+        results = []
+        for idx, (res, num_conv, num_prim) in enumerate(
+            item for chunk in chunks for item in chunk
+        ):
+            begin = offsets[idx]
+            for key, _, _ in PER_ATOM_OUTPUTS:
+                if key.startswith('conv_'):
+                    out_begin, num_out = MAX_CONV_ATOMS_RATIO * begin, num_conv
+                else:
+                    out_begin, num_out = begin, num_prim
+                res[key] = arrays[key][out_begin : out_begin + num_out].copy()
+            if output == 'result':
+                from .results import PathResult
+
+                res = PathResult(res)
+            results.append(res)
+    finally:
+        # The views must be released before closing the blocks
+        arrays.clear()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return results
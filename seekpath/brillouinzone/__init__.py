@@ -0,0 +1,8 @@
+"""Brillouin zone of a crystal (requires scipy)."""
+
+# Re-export the public API, so that ``seekpath.brillouinzone`` behaves in the
+# same way whether it resolves to this subpackage or (lazily, via
+# ``seekpath.__getattr__``) to the ``brillouinzone`` module inside it.
+from .brillouinzone import BZ, get_BZ
+
+__all__ = ('BZ', 'get_BZ')
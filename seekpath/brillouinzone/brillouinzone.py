@@ -7,6 +7,9 @@ from typing import Union
 import numpy as np
 from scipy.spatial import Voronoi, ConvexHull, Delaunay
 
+from ..lattice import Lattice
+from ..timings import timed
+
 
 def get_BZ(
     b1: Union[list, np.array], b2: Union[list, np.array], b3: Union[list, np.array]
@@ -43,6 +46,7 @@ def get_BZ(
 class BZ:
     """Class to compute the Brillouin zone of a crystal."""
 
+    @timed('BZ')
     def __init__(
         self,
         b1: Union[list, np.array],
@@ -131,20 +135,18 @@ class BZ:
 
         supercell_size = 3  # Is this enough?
 
-        # G-vectors
-        points3d = []
-        central_idx = None
-        for i in range(-supercell_size, supercell_size + 1):
-            for j in range(-supercell_size, supercell_size + 1):
-                for k in range(-supercell_size, supercell_size + 1):
-                    if i == 0 and j == 0 and k == 0:
-                        central_idx = len(points3d)
-                    points3d.append(
-                        i * np.array(b1) + j * np.array(b2) + k * np.array(b3)
-                    )
+        # G-vectors: all integer combinations i*b1 + j*b2 + k*b3, with i, j, k
+        # in [-supercell_size, supercell_size] (k is the fastest index)
+        grid_range = np.arange(-supercell_size, supercell_size + 1)
+        grid = np.stack(
+            np.meshgrid(grid_range, grid_range, grid_range, indexing='ij'), axis=-1
+        ).reshape(-1, 3)
+        points3d = Lattice(np.array([b1, b2, b3])).to_cartesian(grid)
+        # G=0 is in the middle of the grid
+        central_idx = len(grid) // 2
 
         # Get Voronois
-        vor3d = Voronoi(np.array(points3d))
+        vor3d = Voronoi(points3d)
         # Get the vertices of the central" Voronoi( around the origin G=0)
         central_voronoi_3d = np.array(
             [
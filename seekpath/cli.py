@@ -0,0 +1,322 @@
+"""
+Command-line interface of seekpath, installed as the ``seekpath`` command.
+
+Each subcommand runs one of the functions of :py:mod:`seekpath.getpaths`
+on all the structures of the given files (see
+:py:func:`seekpath.io.iter_file` for the supported formats), e.g.::
+
+    seekpath get-explicit-k-path --jobs 8 -o paths.jsonl 'relax/*/CONTCAR'
+
+With the default ``--format jsonl``, one JSON object is written per
+structure, with keys ``file``, ``index`` (of the structure in the file) and
+either ``result`` (see :py:func:`seekpath.to_jsonable`) or ``error``. With
+one of the formats of :py:mod:`seekpath.writers` (for the explicit
+commands), one k-points file ``<name>.<index>.<format>`` is written per
+structure in the ``--output`` directory, where ``<name>`` is the path of the
+input file relative to the common directory of all input files, with
+``__`` as separator (e.g. ``Si__POSCAR.0.vasp_line`` for ``Si/POSCAR``).
+
+Rerunning a command with the same output resumes it: structures with a
+result already in the output are skipped (use ``--overwrite`` to start
+again), while those that failed are computed again.
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import sys
+import time
+
+# Subcommand -> function of seekpath.getpaths
+COMMANDS = {
+    'get-path': 'get_path',
+    'get-explicit-k-path': 'get_explicit_k_path',
+    'get-path-orig-cell': 'get_path_orig_cell',
+    'get-explicit-k-path-orig-cell': 'get_explicit_k_path_orig_cell',
+}
+
+
+def _format_error(exc):
+    """Return the description of an exception."""
+    return f'{type(exc).__name__}: {exc}'
+
+
+def _process_file(
+    path,
+    name,
+    done,
+    function_name,
+    kwargs,
+    input_format,
+    output_format,
+    output_dir,
+    compact,
+):
+    """
+    Compute the paths of the structures of a file (possibly in a worker
+    process).
+
+    :param path: the path of the file.
+    :param name: the name of the file in the output files.
+    :param done: the indices of the structures to skip.
+    :return: a list of tuples ``(status, line)``, with ``status`` one of
+        ``'ok'``, ``'skipped'`` and ``'error'``, and ``line`` the JSON line
+        to write (None if nothing has to be written).
+    """
+    from . import getpaths, io, writers
+    from .serialization import to_jsonable
+
+    function = getattr(getpaths, function_name)
+    try:
+        structures = list(io.iter_file(path, format=input_format))
+    except Exception as exc:  # noqa: BLE001
+        error = {'file': path, 'index': None, 'error': _format_error(exc)}
+        return [('error', json.dumps(error))]
+
+    records = []
+    for index, structure in enumerate(structures):
+        if output_format != 'jsonl':
+            target = os.path.join(output_dir, f'{name}.{index}.{output_format}')
+            if os.path.exists(target):
+                records.append(('skipped', None))
+                continue
+        elif index in done:
+            records.append(('skipped', None))
+            continue
+
+        record = {'file': path, 'index': index}
+        try:
+            res = function(structure, diagnostics='collect', **kwargs)
+            if output_format == 'jsonl':
+                record['result'] = to_jsonable(res, compact=compact)
+            else:
+                # Written to a temporary file first, so that an interrupted
+                # run does not leave incomplete files (that would be skipped)
+                writers.write_kpoints(res, f'{target}.tmp', output_format)
+                os.replace(f'{target}.tmp', target)
+        except Exception as exc:  # noqa: BLE001
+            record['error'] = _format_error(exc)
+            records.append(('error', json.dumps(record)))
+            continue
+        records.append(('ok', json.dumps(record) if output_format == 'jsonl' else None))
+    return records
+
+
+def _read_done(output):
+    """
+    Return the structures with a result in an existing JSON-lines output,
+    as a dictionary file -> set of indices.
+    """
+    done = {}
+    if not os.path.exists(output):
+        return done
+    with open(output, encoding='utf-8') as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # E.g. the last line of an interrupted run
+                continue
+            if 'result' in record:
+                done.setdefault(record['file'], set()).add(record['index'])
+    return done
+
+
+def _get_output_names(paths):
+    """
+    Return the names of the files in the output files: their paths relative
+    to their common directory, with ``__`` as separator.
+    """
+    if not paths:
+        return []
+    paths = [os.path.abspath(path) for path in paths]
+    common = os.path.commonpath([os.path.dirname(path) for path in paths])
+    return [os.path.relpath(path, common).replace(os.sep, '__') for path in paths]
+
+
+def get_parser():
+    """Return the :py:class:`argparse.ArgumentParser` of the command."""
+    from . import __version__, io, writers
+
+    parser = argparse.ArgumentParser(
+        prog='seekpath',
+        description='Compute the k-paths of the structures of many files.',
+    )
+    parser.add_argument('--version', action='version', version=__version__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for command, function_name in COMMANDS.items():
+        subparser = subparsers.add_parser(
+            command, help=f'run seekpath.{function_name} on each structure'
+        )
+        subparser.add_argument(
+            'sources',
+            nargs='+',
+            help='files, directories (all their files) or glob patterns',
+        )
+        subparser.add_argument(
+            '-j',
+            '--jobs',
+            type=int,
+            default=1,
+            help='number of worker processes (0 for one per CPU; default: 1)',
+        )
+        subparser.add_argument(
+            '-o',
+            '--output',
+            default='-',
+            help='output file for --format jsonl (default: standard output), '
+            'or output directory for the other formats',
+        )
+        output_formats = ['jsonl']
+        if 'explicit' in command:
+            output_formats += list(writers.FORMATS)
+        subparser.add_argument(
+            '--format',
+            choices=output_formats,
+            default='jsonl',
+            help='output format (default: jsonl)',
+        )
+        subparser.add_argument(
+            '--input-format',
+            choices=io.FORMATS,
+            help='format of the input files (default: guessed from the names)',
+        )
+        subparser.add_argument(
+            '--overwrite',
+            action='store_true',
+            help='compute again the structures already in the output',
+        )
+        subparser.add_argument(
+            '--lists',
+            action='store_true',
+            help='write arrays as lists of values, rather than base64 buffers',
+        )
+        subparser.add_argument(
+            '-q', '--quiet', action='store_true', help='do not print the summary'
+        )
+        subparser.add_argument('--symprec', type=float, default=1e-05)
+        subparser.add_argument('--angle-tolerance', type=float, default=-1.0)
+        subparser.add_argument('--threshold', type=float, default=1.0e-7)
+        subparser.add_argument(
+            '--no-time-reversal',
+            dest='with_time_reversal',
+            action='store_false',
+            help='do not assume time-reversal symmetry',
+        )
+        if 'explicit' in command:
+            subparser.add_argument('--reference-distance', type=float, default=0.025)
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the command-line interface.
+
+    :param argv: the arguments (default: ``sys.argv[1:]``).
+    :return: the exit status: 0 on success, 1 if any structure failed.
+    """
+    from . import io
+
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    try:
+        paths = io._expand_sources(args.sources)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.jobs < 0:
+        parser.error('--jobs must be a non-negative integer')
+    if args.format != 'jsonl' and args.output == '-':
+        parser.error(f'--output must be a directory for --format {args.format}')
+
+    kwargs = {
+        'with_time_reversal': args.with_time_reversal,
+        'threshold': args.threshold,
+        'symprec': args.symprec,
+        'angle_tolerance': args.angle_tolerance,
+    }
+    if 'explicit' in args.command:
+        kwargs['reference_distance'] = args.reference_distance
+
+    done = {}
+    handle = None
+    if args.format == 'jsonl':
+        if args.output == '-':
+            handle = sys.stdout
+        elif not args.overwrite:
+            done = _read_done(args.output)
+    else:
+        if args.overwrite and os.path.isdir(args.output):
+            for name in os.listdir(args.output):
+                if name.endswith(f'.{args.format}'):
+                    os.remove(os.path.join(args.output, name))
+        os.makedirs(args.output, exist_ok=True)
+
+    process = functools.partial(
+        _process_file,
+        function_name=COMMANDS[args.command],
+        kwargs=kwargs,
+        input_format=args.input_format,
+        output_format=args.format,
+        output_dir=args.output,
+        compact=not args.lists,
+    )
+    counts = {'ok': 0, 'skipped': 0, 'error': 0}
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        if args.format == 'jsonl' and args.output != '-':
+            # The file is closed on exit (but not sys.stdout)
+            handle = stack.enter_context(
+                open(args.output, 'a' if done else 'w', encoding='utf-8')
+            )
+        executor = None
+        futures = []
+        try:
+            names = _get_output_names(paths)
+            dones = [done.get(path, set()) for path in paths]
+            if args.jobs == 1:
+                results = map(process, paths, names, dones)
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+
+                executor = ProcessPoolExecutor(max_workers=args.jobs or None)
+                futures = [
+                    executor.submit(process, path, name, path_done)
+                    for path, name, path_done in zip(paths, names, dones)
+                ]
+                results = (future.result() for future in futures)
+            for path, records in zip(paths, results):
+                for status, line in records:
+                    counts[status] += 1
+                    if line is not None and handle is not None:
+                        handle.write(line + '\n')
+                    elif status == 'error':
+                        print(
+                            f'seekpath: error in {path}: {json.loads(line)["error"]}',
+                            file=sys.stderr,
+                        )
+                if handle is not None:
+                    handle.flush()
+        finally:
+            if executor is not None:
+                # E.g. on KeyboardInterrupt, do not wait for the pending files
+                for future in futures:
+                    future.cancel()
+                executor.shutdown()
+
+    elapsed = time.perf_counter() - start
+    if not args.quiet:
+        print(
+            f'seekpath: {sum(counts.values())} structures from {len(paths)} files '
+            f'in {elapsed:.2f} s ({counts["ok"] / elapsed if elapsed else 0.0:.1f} '
+            f'structures/s): {counts["ok"]} computed, {counts["skipped"]} '
+            f'skipped, {counts["error"]} failed',
+            file=sys.stderr,
+        )
+    return 1 if counts['error'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,591 @@
+"""
+Columnar storage of the results of many structures, e.g. the ``results``
+of :py:func:`seekpath.get_path_batch`, in NPZ or (if ``h5py`` is installed)
+HDF5 files.
+
+Rather than one dictionary per structure, the results are stored as one
+array per quantity (a *column*):
+
+- one value per structure (:py:data:`STRUCTURE_COLUMNS`): the space group,
+  the extended Bravais lattice as an integer code (an index into
+  :py:data:`BRAVAIS_LATTICES_EXTENDED`), and the lattices and matrices as
+  :math:`M \\times 3 \\times 3` arrays;
+- one value per special point (:py:data:`POINT_COLUMNS`), concatenated for
+  all structures: the coordinates and the label, as an index into a
+  dictionary of labels; the points of each structure are delimited by the
+  ``num_points`` column;
+- one value per segment of the path (:py:data:`SEGMENT_COLUMNS`),
+  concatenated for all structures: the pairs of indices into the points of
+  the structure; the segments of each structure are delimited by the
+  ``num_path_segments`` column.
+
+The per-atom arrays (positions and types of the standardized cells) and the
+explicit k-points are not stored.
+
+Results are appended in chunks by :py:class:`ColumnarWriter`, and read back
+(column by column, or structure by structure) by
+:py:class:`ColumnarReader`:
+
+- in NPZ files, each chunk is stored as uncompressed ``.npy`` members,
+  ``<chunk>/<column>.npy``, so that it can be memory-mapped on read and that
+  appending does not rewrite the existing chunks; the file can also be read
+  with :py:func:`numpy.load`;
+- in HDF5 files, each column is a resizable dataset extended in place, and
+  the datasets are read lazily by ``h5py``.
+"""
+
+import os
+import re
+import struct
+import zipfile
+
+import numpy as np
+
+from .getpaths import _get_points_and_path
+
+# Accepted values of the ``format`` parameter
+FORMATS = ('npz', 'hdf5')
+
+# Default number of structures buffered before writing a chunk
+DEFAULT_CHUNKSIZE = 1024
+
+# The extended Bravais lattices of the HPKOT paper: the code of each
+# lattice in the 'bravais_lattice_code' column is its index in this tuple
+BRAVAIS_LATTICES_EXTENDED = (
+    'aP2',
+    'aP3',
+    'cF1',
+    'cF2',
+    'cI1',
+    'cP1',
+    'cP2',
+    'hP1',
+    'hP2',
+    'hR1',
+    'hR2',
+    'mC1',
+    'mC2',
+    'mC3',
+    'mP1',
+    'oA1',
+    'oA2',
+    'oC1',
+    'oC2',
+    'oF1',
+    'oF2',
+    'oF3',
+    'oI1',
+    'oI2',
+    'oI3',
+    'oP1',
+    'tI1',
+    'tI2',
+    'tP1',
+)
+
+# Columns with one value per structure: name -> (shape of a value, dtype)
+STRUCTURE_COLUMNS = {
+    'spacegroup_number': ((), np.int32),
+    'spacegroup_international': ((), 'S16'),
+    'bravais_lattice_code': ((), np.int8),
+    'has_inversion_symmetry': ((), np.bool_),
+    'augmented_path': ((), np.bool_),
+    'volume_original_wrt_conv': ((), np.float64),
+    'volume_original_wrt_prim': ((), np.float64),
+    'conv_lattice': ((3, 3), np.float64),
+    'primitive_lattice': ((3, 3), np.float64),
+    'reciprocal_primitive_lattice': ((3, 3), np.float64),
+    'primitive_transformation_matrix': ((3, 3), np.float64),
+    'inverse_primitive_transformation_matrix': ((3, 3), np.int32),
+    'transformation_matrix': ((3, 3), np.float64),
+    'rotation_matrix': ((3, 3), np.float64),
+    'num_points': ((), np.int32),
+    'num_path_segments': ((), np.int32),
+}
+
+# Columns with one value per special point
+POINT_COLUMNS = {
+    'point_label_ids': ((), np.int32),
+    'point_coords': ((3,), np.float64),
+}
+
+# Columns with one value per segment of the path
+SEGMENT_COLUMNS = {
+    'path': ((2,), np.int32),
+}
+
+# Data type of the dictionary of point labels
+LABEL_DTYPE = 'S16'
+
+# Keys of the results copied unchanged to the columns with the same name
+_COPIED_KEYS = tuple(
+    name
+    for name in STRUCTURE_COLUMNS
+    if name not in ('bravais_lattice_code', 'num_points', 'num_path_segments')
+)
+
+_CHUNK_MEMBER_RE = re.compile(r'^(\d+)/(\w+)\.npy$')
+
+
+def _get_format(path, format):  # pylint: disable=redefined-builtin
+    """Return the format of ``path``, guessed from its extension if None."""
+    if format is None:
+        extension = os.path.splitext(str(path))[1].lower()
+        format = 'hdf5' if extension in ('.h5', '.hdf5', '.hdf') else 'npz'
+    if format not in FORMATS:
+        raise ValueError(
+            f"value '{format}' for 'format' not recognized. Accepted values: "
+            f'{", ".join(FORMATS)}'
+        )
+    return format
+
+
+def _empty_columns(columns, length=0):
+    """Return empty arrays for ``columns``, with ``length`` rows."""
+    return {
+        name: np.empty((length,) + shape, dtype=dtype)
+        for name, (shape, dtype) in columns.items()
+    }
+
+
+class ColumnarWriter:
+    """
+    Writer of the results of many structures in a columnar file.
+
+    Results are buffered and written in chunks of ``chunksize`` structures;
+    the last (partial) chunk is written by :py:meth:`close`, called
+    automatically when the writer is used as a context manager::
+
+        with ColumnarWriter('paths.npz') as writer:
+            writer.extend(seekpath.get_path_batch(structures)['results'])
+    """
+
+    def __init__(self, path, format=None, mode='w', chunksize=DEFAULT_CHUNKSIZE):  # pylint: disable=redefined-builtin
+        """
+        :param path: the path of the file.
+        :param format: ``'npz'`` or ``'hdf5'`` (requires ``h5py``). If None,
+            it is guessed from the extension of ``path`` (``.h5``, ``.hdf5``
+            and ``.hdf`` for HDF5, NPZ otherwise).
+        :param mode: ``'w'`` (default) to create a new file (overwriting an
+            existing one), ``'a'`` to append to an existing file (or create
+            it).
+        :param chunksize: the number of structures written at once.
+        """
+        if mode not in ('w', 'a'):
+            raise ValueError(
+                f"value '{mode}' for 'mode' not recognized: use 'w' or 'a'"
+            )
+        if chunksize < 1:
+            raise ValueError('chunksize must be a positive integer')
+        self.path = path
+        self.format = _get_format(path, format)
+        self.chunksize = chunksize
+
+        self._buffer = []
+        # Dictionary of labels: with NPZ there is one per chunk, with HDF5
+        # a global one, extended as needed
+        self._labels = {}
+        self._zip = None
+        self._h5file = None
+        if self.format == 'npz':
+            self._zip = zipfile.ZipFile(
+                path, mode=mode, compression=zipfile.ZIP_STORED, allowZip64=True
+            )
+            chunk_indices = [
+                int(match.group(1))
+                for match in map(_CHUNK_MEMBER_RE.match, self._zip.namelist())
+                if match
+            ]
+            self._next_chunk = max(chunk_indices, default=-1) + 1
+        else:
+            import h5py
+
+            self._h5file = h5py.File(path, mode)
+            if 'labels' in self._h5file:
+                self._labels = {
+                    label.decode(): idx
+                    for idx, label in enumerate(self._h5file['labels'][()])
+                }
+            else:
+                self._h5file.create_dataset(
+                    'labels', shape=(0,), maxshape=(None,), dtype=LABEL_DTYPE
+                )
+            for columns in (STRUCTURE_COLUMNS, POINT_COLUMNS, SEGMENT_COLUMNS):
+                for name, (shape, dtype) in columns.items():
+                    if name not in self._h5file:
+                        self._h5file.create_dataset(
+                            name,
+                            shape=(0,) + shape,
+                            maxshape=(None,) + shape,
+                            dtype=dtype,
+                            chunks=(chunksize,) + shape,
+                        )
+
+    def append(self, seekpath_output):
+        """
+        Append the result of a structure.
+
+        :param seekpath_output: the output of :py:func:`seekpath.get_path`
+            or of :py:func:`seekpath.get_explicit_k_path`, in any ``output``
+            format.
+        """
+        if self._zip is None and self._h5file is None:
+            raise ValueError('the writer is closed')
+        self._buffer.append(seekpath_output)
+        if len(self._buffer) >= self.chunksize:
+            self.flush()
+
+    def extend(self, results):
+        """Append the results of an iterable of structures."""
+        for seekpath_output in results:
+            self.append(seekpath_output)
+
+    def _get_chunk_columns(self, results):
+        """Return the columns of ``results``, and the new point labels."""
+        columns = _empty_columns(STRUCTURE_COLUMNS, len(results))
+        bravais_codes = {
+            name: idx for idx, name in enumerate(BRAVAIS_LATTICES_EXTENDED)
+        }
+        points = []
+        segments = []
+        new_labels = []
+        for idx, seekpath_output in enumerate(results):
+            for name in _COPIED_KEYS:
+                columns[name][idx] = seekpath_output[name]
+            columns['bravais_lattice_code'][idx] = bravais_codes[
+                seekpath_output['bravais_lattice_extended']
+            ]
+            labels, coords, path_indices = _get_points_and_path(seekpath_output)
+            label_ids = np.empty(len(labels), dtype=np.int32)
+            for point_idx, label in enumerate(labels):
+                if label not in self._labels:
+                    self._labels[label] = len(self._labels)
+                    new_labels.append(label)
+                label_ids[point_idx] = self._labels[label]
+            columns['num_points'][idx] = len(labels)
+            columns['num_path_segments'][idx] = len(path_indices)
+            points.append((label_ids, coords))
+            segments.append(path_indices)
+
+        columns['point_label_ids'] = np.concatenate(
+            [label_ids for label_ids, _ in points] + [np.empty(0, dtype=np.int32)]
+        )
+        columns['point_coords'] = np.concatenate(
+            [coords for _, coords in points] + [np.empty((0, 3))]
+        )
+        columns['path'] = np.concatenate(
+            segments + [np.empty((0, 2), dtype=np.int32)]
+        ).astype(np.int32)
+        return columns, new_labels
+
+    def flush(self):
+        """Write the buffered results."""
+        if not self._buffer:
+            return
+        columns, new_labels = self._get_chunk_columns(self._buffer)
+        self._buffer = []
+
+        if self._zip is not None:
+            columns['labels'] = np.array(list(self._labels), dtype=LABEL_DTYPE)
+            # Each NPZ chunk has its own dictionary of labels
+            self._labels = {}
+            for name, values in columns.items():
+                with self._zip.open(
+                    f'{self._next_chunk:06d}/{name}.npy', 'w', force_zip64=True
+                ) as handle:
+                    np.lib.format.write_array(
+                        handle, np.ascontiguousarray(values), allow_pickle=False
+                    )
+            self._next_chunk += 1
+        else:
+            columns['labels'] = np.array(new_labels, dtype=LABEL_DTYPE)
+            for name, values in columns.items():
+                dataset = self._h5file[name]
+                start = len(dataset)
+                dataset.resize(start + len(values), axis=0)
+                dataset[start:] = values
+
+    def close(self):
+        """Write the buffered results, and close the file."""
+        if self._zip is None and self._h5file is None:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+            if self._h5file is not None:
+                self._h5file.close()
+                self._h5file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _read_npz_member(path, zip_file, info, mmap):
+    """
+    Return the array of the ``.npy`` member ``info`` of the NPZ file at
+    ``path``, memory-mapped if ``mmap`` is True and the member is not
+    compressed.
+    """
+    if mmap and info.compress_type == zipfile.ZIP_STORED:
+        with open(path, 'rb') as handle:
+            # The data of the member follow its local header, whose 'extra'
+            # field can differ from the one of the central directory
+            handle.seek(info.header_offset)
+            local_header = handle.read(30)
+            if local_header[:4] != b'PK\x03\x04':
+                raise ValueError(f'invalid local header for {info.filename}')
+            name_length, extra_length = struct.unpack('<HH', local_header[26:30])
+            handle.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(handle)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(
+                    handle
+                )
+            elif version == (2, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(
+                    handle
+                )
+            else:
+                shape = ()
+            offset = handle.tell()
+        if shape and all(shape) and not dtype.hasobject:
+            return np.memmap(
+                path,
+                dtype=dtype,
+                mode='r',
+                shape=shape,
+                order='F' if fortran_order else 'C',
+                offset=offset,
+            )
+    with zip_file.open(info) as handle:
+        return np.lib.format.read_array(handle, allow_pickle=False)
+
+
+class ColumnarReader:
+    """
+    Reader of the files written by :py:class:`ColumnarWriter`.
+
+    The reader is a sequence of the results of the structures (see
+    :py:meth:`get_result`), and each column can be read with
+    :py:meth:`column`::
+
+        with ColumnarReader('paths.npz') as reader:
+            spacegroups = reader.column('spacegroup_number')
+            first = reader[0]
+    """
+
+    def __init__(self, path, format=None, mmap=True):  # pylint: disable=redefined-builtin
+        """
+        :param path: the path of the file.
+        :param format: ``'npz'`` or ``'hdf5'``; if None, it is guessed from
+            the extension of ``path``, as in :py:class:`ColumnarWriter`.
+        :param mmap: for NPZ files, if True (default) the arrays are
+            memory-mapped rather than read in memory. HDF5 datasets are
+            always read lazily.
+        """
+        self.path = path
+        self.format = _get_format(path, format)
+        self._h5file = None
+        # List of the chunks, each a dictionary of arrays (or of h5py
+        # datasets) and of the labels of its 'point_label_ids'
+        self._chunks = []
+
+        if self.format == 'npz':
+            with zipfile.ZipFile(path) as zip_file:
+                members = {}
+                for info in zip_file.infolist():
+                    match = _CHUNK_MEMBER_RE.match(info.filename)
+                    if match:
+                        members.setdefault(int(match.group(1)), {})[match.group(2)] = (
+                            info
+                        )
+                for chunk_index in sorted(members):
+                    self._chunks.append(
+                        {
+                            name: _read_npz_member(path, zip_file, info, mmap)
+                            for name, info in members[chunk_index].items()
+                        }
+                    )
+        else:
+            import h5py
+
+            self._h5file = h5py.File(path, 'r')
+            self._chunks.append({name: self._h5file[name] for name in self._h5file})
+
+        self.labels = []
+        label_index = {}
+        self._label_maps = []
+        for chunk in self._chunks:
+            chunk_labels = [label.decode() for label in chunk['labels'][()]]
+            for label in chunk_labels:
+                if label not in label_index:
+                    label_index[label] = len(self.labels)
+                    self.labels.append(label)
+            self._label_maps.append(
+                np.array([label_index[label] for label in chunk_labels], dtype=np.int32)
+            )
+
+        # Offsets of the structures, and of their points and segments, in
+        # each chunk (small arrays, read in memory)
+        self._structure_offsets = np.zeros(len(self._chunks) + 1, dtype=np.int64)
+        self._point_offsets = []
+        self._segment_offsets = []
+        for idx, chunk in enumerate(self._chunks):
+            for name, offsets in [
+                ('num_points', self._point_offsets),
+                ('num_path_segments', self._segment_offsets),
+            ]:
+                counts = np.asarray(chunk[name][()], dtype=np.int64)
+                offsets.append(np.concatenate([[0], np.cumsum(counts)]))
+            self._structure_offsets[idx + 1] = self._structure_offsets[idx] + len(
+                chunk['num_points']
+            )
+
+    def column(self, name):
+        """
+        Return a column, for all structures.
+
+        For memory-mapped NPZ files with a single chunk, the array is
+        memory-mapped; otherwise the chunks are read and concatenated (HDF5
+        files have a single chunk, read in memory). The ``point_label_ids``
+        are indices into :py:attr:`labels`.
+
+        :param name: the name of the column, in :py:data:`STRUCTURE_COLUMNS`,
+            :py:data:`POINT_COLUMNS` or :py:data:`SEGMENT_COLUMNS`.
+        """
+        for columns in (STRUCTURE_COLUMNS, POINT_COLUMNS, SEGMENT_COLUMNS):
+            if name in columns:
+                break
+        else:
+            raise ValueError(f"'{name}' is not a column")
+        if not self._chunks:
+            return _empty_columns(columns)[name]
+        arrays = [chunk[name][()] for chunk in self._chunks]
+        if name == 'point_label_ids':
+            arrays = [
+                label_map[array] for array, label_map in zip(arrays, self._label_maps)
+            ]
+        return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    @property
+    def point_offsets(self):
+        """
+        The offsets of the points of each structure in the point columns (a
+        length-:math:`M + 1` array).
+        """
+        return self._get_offsets(self._point_offsets)
+
+    @property
+    def path_offsets(self):
+        """
+        The offsets of the segments of each structure in the ``path`` column
+        (a length-:math:`M + 1` array).
+        """
+        return self._get_offsets(self._segment_offsets)
+
+    def _get_offsets(self, chunk_offsets):
+        """Return the global offsets from the offsets of each chunk."""
+        offsets = [np.zeros(1, dtype=np.int64)]
+        for chunk_offset in chunk_offsets:
+            offsets.append(chunk_offset[1:] + offsets[-1][-1])
+        return np.concatenate(offsets)
+
+    def get_result(self, index):
+        """
+        Return the result of a structure, as a dictionary with the keys of
+        the ``'numpy'`` output of :py:func:`seekpath.get_path` that are
+        stored (the special points as the ``point_labels`` tuple and the
+        ``point_coords`` array, and the ``path`` as an array of indices).
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('ColumnarReader index out of range')
+        chunk_idx = (
+            int(np.searchsorted(self._structure_offsets, index, side='right')) - 1
+        )
+        chunk = self._chunks[chunk_idx]
+        row = index - self._structure_offsets[chunk_idx]
+
+        res = {}
+        for name in _COPIED_KEYS:
+            value = chunk[name][row]
+            if name == 'spacegroup_international':
+                value = value.decode()
+            elif STRUCTURE_COLUMNS[name][0]:
+                value = np.array(value)
+            else:
+                value = value.item()
+            res[name] = value
+        bravais_lattice_extended = BRAVAIS_LATTICES_EXTENDED[
+            chunk['bravais_lattice_code'][row]
+        ]
+        res['bravais_lattice'] = bravais_lattice_extended[:2]
+        res['bravais_lattice_extended'] = bravais_lattice_extended
+
+        point_start, point_stop = self._point_offsets[chunk_idx][row : row + 2]
+        segment_start, segment_stop = self._segment_offsets[chunk_idx][row : row + 2]
+        label_ids = self._label_maps[chunk_idx][
+            chunk['point_label_ids'][point_start:point_stop]
+        ]
+        res['point_labels'] = tuple(self.labels[label_id] for label_id in label_ids)
+        res['point_coords'] = np.array(chunk['point_coords'][point_start:point_stop])
+        res['path'] = np.array(chunk['path'][segment_start:segment_stop])
+        return res
+
+    def __len__(self):
+        return int(self._structure_offsets[-1])
+
+    def __getitem__(self, index):
+        """Return the result of the structure at ``index``."""
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError('ColumnarReader indices must be integers')
+        return self.get_result(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.get_result(index)
+
+    def close(self):
+        """Close the file (for HDF5 files)."""
+        if self._h5file is not None:
+            self._h5file.close()
+            self._h5file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def write_columnar(results, path, format=None, mode='w', chunksize=DEFAULT_CHUNKSIZE):  # pylint: disable=redefined-builtin
+    """
+    Write the results of many structures in a columnar file; see
+    :py:class:`ColumnarWriter` for the parameters.
+
+    :param results: an iterable of outputs of :py:func:`seekpath.get_path`
+        (e.g. the ``results`` of :py:func:`seekpath.get_path_batch`).
+    :return: the number of results written.
+    """
+    num_results = 0
+    with ColumnarWriter(path, format=format, mode=mode, chunksize=chunksize) as writer:
+        for seekpath_output in results:
+            writer.append(seekpath_output)
+            num_results += 1
+    return num_results
+
+
+def read_columnar(path, format=None, mmap=True):  # pylint: disable=redefined-builtin
+    """
+    Open a columnar file; see :py:class:`ColumnarReader` for the parameters.
+
+    :return: a :py:class:`ColumnarReader`.
+    """
+    return ColumnarReader(path, format=format, mmap=mmap)
@@ -0,0 +1,65 @@
+"""
+Diagnostics (edge cases, supercells, ...) issued while computing the paths.
+
+By default they are issued as Python warnings
+(:py:exc:`~seekpath.hpkot.EdgeCaseWarning`,
+:py:exc:`~seekpath.SupercellWarning`). Warning filters and
+``warnings.catch_warnings`` are process-global and not thread-safe, so
+diagnostics can instead be collected, per thread, with
+:py:func:`collect_diagnostics` (or with ``diagnostics='collect'`` in the
+functions of :py:mod:`seekpath.getpaths`).
+"""
+
+import contextlib
+import threading
+import warnings
+
+DIAGNOSTICS_MODES = ('warn', 'collect')
+
+_local = threading.local()
+
+
+def warn(message, category):
+    """
+    Issue a diagnostic: collect it if :py:func:`collect_diagnostics` is
+    active in the current thread, otherwise issue a warning.
+
+    :param message: the message (a string).
+    :param category: the warning class (e.g.
+        :py:exc:`~seekpath.hpkot.EdgeCaseWarning`).
+    """
+    collector = getattr(_local, 'collector', None)
+    if collector is None:
+        # stacklevel=2: report the line of the caller, as a direct call would
+        warnings.warn(message, category, stacklevel=2)
+    else:
+        collector.append({'category': category.__name__, 'message': str(message)})
+
+
+@contextlib.contextmanager
+def collect_diagnostics():
+    """
+    Context manager that collects the diagnostics issued in the current
+    thread, instead of issuing warnings.
+
+    It yields the list to which the diagnostics are appended, as
+    dictionaries with keys ``category`` (the name of the warning class,
+    e.g. ``'EdgeCaseWarning'``) and ``message``. Other threads are not
+    affected.
+    """
+    previous = getattr(_local, 'collector', None)
+    collector = []
+    _local.collector = collector
+    try:
+        yield collector
+    finally:
+        _local.collector = previous
+
+
+def check_diagnostics_mode(diagnostics):
+    """Raise a ValueError if ``diagnostics`` is not a valid mode."""
+    if diagnostics not in DIAGNOSTICS_MODES:
+        raise ValueError(
+            f"value '{diagnostics}' for 'diagnostics' not recognized. "
+            f'Accepted values: {", ".join(DIAGNOSTICS_MODES)}'
+        )
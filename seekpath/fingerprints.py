@@ -0,0 +1,304 @@
+"""
+Fast, tolerance-aware fingerprints of crystal structures, to deduplicate
+inputs and to cache the results of :py:func:`seekpath.get_path`.
+"""
+
+import hashlib
+
+import numpy as np
+
+# Bump this if the encoding changes, so that stored fingerprints are not reused
+FINGERPRINT_VERSION = 3
+
+# Amplitude of the Fourier components, relative to the number of atoms,
+# below which they are considered zero (numerical noise)
+PHASE_AMPLITUDE_FLOOR = 1e-8
+
+# Reciprocal lattice vectors (one for each pair of opposite vectors) of the
+# Fourier components used to rank the candidate origins
+SCORE_VECTORS = np.array(
+    [
+        (h, k, l)
+        for h in (-1, 0, 1)
+        for k in (-1, 0, 1)
+        for l in (-1, 0, 1)
+        if (h, k, l) > (0, 0, 0)
+    ]
+)
+
+# The number of bins along each lattice vector is a multiple of this number
+# (the least common multiple of the denominators of the coordinates of the
+# special positions), so that atoms related by a fraction of a lattice
+# vector, e.g. 1/2 or 1/3, do not fall on the boundary of a bin
+BIN_MULTIPLE = 24
+
+# Maximum number of atoms processed at once when computing the Fourier
+# components, and stored to find the symmetries of the candidates, to bound
+# the memory
+CHUNK_NUM_ATOMS = 2**18
+
+
+def _get_origin_phases(origins, n_bins):
+    """
+    Return, for each lattice vector, the smallest order ``h`` of a Fourier
+    component of the atoms ``origins`` whose phase is well defined (or the
+    one with the largest amplitude, if none is), and the origin ``t`` in
+    ``[0, 1/h)`` where its phase vanishes.
+
+    The phase is considered well defined if the amplitude of the component
+    is larger than the one that displacements of the atoms by about one bin
+    (``1 / n_bins``) could typically produce. The amplitudes do not depend
+    on the order of the atoms and on translations, while ``t`` follows the
+    translations modulo ``1/h``.
+
+    :return: a tuple ``(orders, offsets)`` of two length-3 arrays.
+    """
+    num_origins = len(origins)
+    # Exact zeros up to h = num_origins - 1 mean equally spaced atoms, whose
+    # component of order num_origins has the maximum amplitude
+    max_order = max(num_origins, 1)
+    max_block_size = max(1, CHUNK_NUM_ATOMS // (3 * num_origins))
+    orders = np.ones(3, dtype=np.int64)
+    offsets = np.zeros(3)
+    best_amplitudes = np.full(3, -1.0)
+    axes = [0, 1, 2]
+    # Typically h = 1: start with small blocks of orders
+    start, block_size = 1, 4
+    while axes and start <= max_order:
+        h = np.arange(start, min(start + block_size, max_order + 1))
+        start += block_size
+        block_size = min(2 * block_size, max_block_size)
+        # Shape (len(h), len(axes))
+        components = np.exp(
+            2j * np.pi * h[:, np.newaxis, np.newaxis] * origins[np.newaxis, :, axes]
+        ).sum(axis=1)
+        amplitudes = np.abs(components)
+        thresholds = np.maximum(
+            8 * np.pi * np.sqrt(num_origins) * h[:, np.newaxis] / n_bins[axes],
+            PHASE_AMPLITUDE_FLOOR * num_origins,
+        )
+        for column, axis in enumerate(list(axes)):
+            large = np.flatnonzero(amplitudes[:, column] > thresholds[:, column])
+            idx = large[0] if len(large) else np.argmax(amplitudes[:, column])
+            if amplitudes[idx, column] > best_amplitudes[axis]:
+                best_amplitudes[axis] = amplitudes[idx, column]
+                orders[axis] = h[idx]
+                phase = np.angle(components[idx, column]) / (2 * np.pi)
+                offsets[axis] = (phase % 1.0) / h[idx]
+            if len(large):
+                axes.remove(axis)
+    return orders, offsets
+
+
+def _get_best_shifts(positions, numbers, shifts):
+    """
+    Return a boolean array, True for the shifts (candidate origins) with the
+    largest score.
+
+    The score is the real part of a sum of Fourier components (with the
+    vectors :py:data:`SCORE_VECTORS`) of all the atoms, weighted by
+    species, with the phase relative to the shift: it follows the
+    translations of the structure, and it is equal for shifts related by a
+    translation that leaves the structure unchanged. Scores within the
+    numerical noise are considered equal.
+    """
+    golden_ratio = (1 + np.sqrt(5)) / 2
+    weights = np.exp(2j * np.pi * ((numbers * golden_ratio) % 1.0))
+    components = np.exp(2j * np.pi * (positions @ SCORE_VECTORS.T)).T @ weights
+    scores = (np.exp(-2j * np.pi * (shifts @ SCORE_VECTORS.T)) @ components).real
+    return scores >= scores.max() - PHASE_AMPLITUDE_FLOOR * len(positions)
+
+
+def _get_candidate(positions, numbers, n_bins, shift):
+    """
+    Return the candidate canonical form of the atoms for the origin
+    ``shift``, as an integer array of shape ``(N, 4)``.
+    """
+    # The shift is applied before quantizing, so that relative positions
+    # (and not absolute ones) are rounded
+    shifted = np.rint((positions - shift) * n_bins).astype(np.int64) % n_bins
+    # Sort the atoms by (number, q0, q1, q2)
+    order = np.lexsort((shifted[:, 2], shifted[:, 1], shifted[:, 0], numbers))
+    return np.concatenate([numbers[order, np.newaxis], shifted[order]], axis=1)
+
+
+def _is_smaller(candidate, other):
+    """Return True if ``candidate`` is lexicographically smaller than ``other``."""
+    different = np.flatnonzero(candidate.ravel() != other.ravel())
+    return bool(len(different)) and (
+        candidate.ravel()[different[0]] < other.ravel()[different[0]]
+    )
+
+
+def _get_canonical_atoms(positions, numbers, n_bins):
+    """
+    Return the canonical form of the atoms of a structure, as an integer
+    array of shape ``(N, 4)`` with rows ``(number, q0, q1, q2)``, and the
+    number of bins along each lattice vector.
+
+    The origin is fixed, along each lattice vector, by the phase of a
+    Fourier component of the atoms of the least frequent species (see
+    :py:func:`_get_origin_phases`): a component of order ``h`` fixes it up
+    to a multiple of ``1/h``. For each candidate origin, the scaled
+    coordinates relative to the origin are quantized on a grid with
+    ``n_bins[i]`` bins (rounded up to a multiple of :py:data:`BIN_MULTIPLE`
+    and of the order ``h``) along the i-th lattice vector and wrapped with
+    integer (modular) arithmetic, so that coordinates close to 0 and to 1
+    end up in the same bin; the atoms are then sorted, and the
+    lexicographically smallest result is returned. The result is therefore
+    independent of the order of the atoms, of rigid translations and of
+    lattice translations.
+
+    Typically ``h = 1``, and there is a single candidate. Larger orders
+    come from atoms equally spaced along a lattice vector, e.g. in
+    supercells. In that case, only the candidates with the largest score
+    (see :py:func:`_get_best_shifts`) are kept; moreover, the shifts between
+    candidates that leave the structure unchanged (i.e., give the same
+    candidate) are collected into a group, and only one candidate per coset
+    is computed: for a supercell, only a few candidates are computed, rather
+    than one per cell.
+    """
+    species, counts = np.unique(numbers, return_counts=True)
+    # Least frequent species; ties are broken by the smallest number
+    origin_species = species[np.argmin(counts)]
+    orders, offsets = _get_origin_phases(positions[numbers == origin_species], n_bins)
+    # The candidate origins are shifted by multiples of 1/h, and the atoms
+    # of supercells are equally spaced by (multiples of) 1/h: these
+    # fractions must be multiples of the bin size
+    multiples = np.lcm(orders, BIN_MULTIPLE)
+    n_bins = -(-n_bins // multiples) * multiples
+
+    if np.all(orders == 1):
+        return _get_candidate(positions, numbers, n_bins, offsets), n_bins
+
+    # Candidates are indexed by the grid of the shifts (k0, k1, k2) / orders
+    grid_shape = tuple(orders)
+    symmetries = np.zeros(grid_shape, dtype=bool)
+    symmetries[0, 0, 0] = True
+    grid = np.stack(np.indices(grid_shape), axis=-1).reshape(-1, 3)
+    covered = ~_get_best_shifts(positions, numbers, offsets + grid / orders).reshape(
+        grid_shape
+    )
+    # Coset representatives, and the candidates stored to find symmetries
+    representatives = []
+    stored = []
+    best = None
+    while not covered.all():
+        index = np.unravel_index(np.argmin(covered), grid_shape)
+        candidate = _get_candidate(
+            positions, numbers, n_bins, offsets + np.array(index) / orders
+        )
+        symmetry = None
+        for stored_index, stored_candidate in stored:
+            if np.array_equal(candidate, stored_candidate):
+                symmetry = tuple(np.subtract(index, stored_index) % orders)
+                break
+        if symmetry is None:
+            representatives.append(index)
+            if len(stored) * len(positions) < CHUNK_NUM_ATOMS:
+                stored.append((index, candidate))
+            covered |= np.roll(symmetries, index, axis=(0, 1, 2))
+            if best is None or _is_smaller(candidate, best):
+                best = candidate
+        else:
+            # Close the group with the new symmetry, and update the cosets
+            while True:
+                extended = symmetries | np.roll(symmetries, symmetry, axis=(0, 1, 2))
+                if np.array_equal(extended, symmetries):
+                    break
+                symmetries = extended
+            for representative in representatives:
+                covered |= np.roll(symmetries, representative, axis=(0, 1, 2))
+    return best, n_bins
+
+
+def get_cell_key(structure, symprec=1e-05):
+    """
+    Return a cheap key of a structure (its cell quantized as in
+    :py:func:`fingerprint`, and its number of atoms): structures with
+    different keys have different fingerprints.
+
+    :param structure: the crystal structure, as a tuple
+        ``(cell, positions, numbers)``.
+    :param symprec: the symmetry precision, as passed to :py:func:`fingerprint`.
+    :return: a bytes object.
+    """
+    quantized_cell = np.rint(np.asarray(structure[0], dtype=float) / symprec)
+    return (
+        np.int64(len(structure[1])).tobytes()
+        + quantized_cell.astype(np.int64).tobytes()
+    )
+
+
+def fingerprint(structure, symprec=1e-05):
+    r"""
+    Return a fingerprint (a hexadecimal string) of a crystal structure.
+
+    Two structures with the same fingerprint give the same results when
+    passed to :py:func:`seekpath.get_path` with the same ``symprec``, so
+    the fingerprint can be used to deduplicate inputs and as a cache key.
+    The fingerprint does not change if:
+
+    - the atoms are permuted;
+    - all atoms are translated rigidly (the standardized structure can
+      differ only by an equivalent choice of the origin);
+    - the scaled coordinates are wrapped (i.e., shifted by lattice vectors).
+
+    Cartesian cell vectors are quantized in units of ``symprec``, and scaled
+    coordinates on a grid of spacing (approximately) ``symprec`` along each
+    lattice vector. The number of bins is a multiple of
+    :py:data:`BIN_MULTIPLE` and of the period of supercells, so that atoms
+    related by fractions of the lattice vectors (e.g. 1/2 or 1/3) are
+    always at the center of bins relative to each other. Structures that
+    differ by much less than ``symprec`` therefore typically share the
+    same fingerprint (two generic values can still fall on opposite sides
+    of a bin boundary). The cell is not reduced nor
+    rotated: since the output of ``get_path`` (e.g. ``rotation_matrix`` or
+    ``transformation_matrix``) depends on the input cell, different cells
+    of the same crystal have different fingerprints.
+
+    No symmetry analysis is performed: computing the fingerprint only costs
+    a few vectorized NumPy operations, and for typical structures
+    (including supercells) its time and memory grow almost linearly with
+    the number of atoms.
+
+    :param structure: the crystal structure, as a tuple
+        ``(cell, positions, numbers)`` (see :py:func:`seekpath.get_path`).
+    :param symprec: the symmetry precision, as passed to ``get_path``. It
+        sets the quantization step, and it is part of the fingerprint.
+
+    :return: a string with the hexadecimal digest.
+    """
+    if symprec <= 0:
+        raise ValueError(f'symprec must be positive, got {symprec}')
+
+    cell = np.asarray(structure[0], dtype=float)
+    positions = np.asarray(structure[1], dtype=float)
+    numbers = np.asarray(structure[2], dtype=np.int64)
+    if cell.shape != (3, 3):
+        raise ValueError(f'The cell must have shape (3, 3), got {cell.shape}')
+    if positions.ndim != 2 or positions.shape[1] != 3:
+        raise ValueError(f'The positions must have shape (N, 3), got {positions.shape}')
+    if numbers.shape != (len(positions),):
+        raise ValueError(
+            f'Expected {len(positions)} atomic numbers, got {numbers.shape}'
+        )
+
+    quantized_cell = np.rint(cell / symprec).astype(np.int64)
+    # One bin per symprec along each lattice vector; computed from the
+    # quantized cell, so that it is determined by the fingerprint itself
+    n_bins = np.maximum(
+        np.linalg.norm(quantized_cell, axis=1).astype(np.int64), 1
+    ).astype(np.int64)
+
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(
+        np.array([FINGERPRINT_VERSION, len(positions)], dtype=np.int64).tobytes()
+    )
+    hasher.update(np.float64(symprec).tobytes())
+    hasher.update(quantized_cell.tobytes())
+    if len(positions):
+        canonical_atoms, n_bins = _get_canonical_atoms(positions, numbers, n_bins)
+        hasher.update(n_bins.tobytes())
+        hasher.update(np.ascontiguousarray(canonical_atoms).tobytes())
+    return hasher.hexdigest()
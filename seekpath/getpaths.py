@@ -2,18 +2,86 @@
 This module contains the main functions to get a path and an explicit path.
 """
 
+import contextlib
+
 import numpy as np
-import warnings
 from . import SupercellWarning
+from .timings import timed
 
+# Accepted values of the ``output`` parameter of ``get_path`` and
+# ``get_explicit_k_path``
+OUTPUT_TYPES = ('dict', 'numpy', 'result')
 
-def get_explicit_from_implicit(seekpath_output, reference_distance):
+# Accepted values of the ``output`` parameter of ``get_path_orig_cell`` and
+# ``get_explicit_k_path_orig_cell``
+ORIG_CELL_OUTPUT_TYPES = ('dict', 'numpy')
+
+
+def _check_output(output, output_types=OUTPUT_TYPES):
+    """Raise a ValueError if ``output`` is not one of ``output_types``."""
+    if output not in output_types:
+        raise ValueError(
+            f"value '{output}' for 'output' not recognized. Accepted values: "
+            f'{", ".join(output_types)}'
+        )
+
+
+def _get_diagnostics_context(diagnostics):
+    """
+    Return the context manager for the ``diagnostics`` parameter: it yields
+    the list of collected diagnostics if ``diagnostics == 'collect'``, and
+    None (diagnostics are issued as warnings) if ``diagnostics == 'warn'``.
+    """
+    from .diagnostics import check_diagnostics_mode, collect_diagnostics
+
+    check_diagnostics_mode(diagnostics)
+    if diagnostics == 'collect':
+        return collect_diagnostics()
+    return contextlib.nullcontext()
+
+
+def _get_points_and_path(seekpath_output):
+    r"""
+    Return the special points and the path from the output of ``get_path``,
+    either in the ``'dict'`` or in the ``'numpy'`` format.
+
+    :return: a tuple ``(labels, coords, path_indices)``, where ``labels`` is
+        a tuple with the point labels, ``coords`` is a :math:`n \times 3`
+        array with the point coordinates and ``path_indices`` is a
+        :math:`m \times 2` integer array with indices into ``labels``.
     """
+    point_coords = seekpath_output['point_coords']
+    if 'point_labels' in seekpath_output:
+        labels = tuple(seekpath_output['point_labels'])
+        coords = np.asarray(point_coords, dtype=float).reshape(-1, 3)
+        path_indices = np.asarray(seekpath_output['path'], dtype=int).reshape(-1, 2)
+    else:
+        labels = tuple(point_coords)
+        coords = np.array(
+            [point_coords[label] for label in labels], dtype=float
+        ).reshape(-1, 3)
+        label_index = {label: idx for idx, label in enumerate(labels)}
+        path_indices = np.array(
+            [
+                (label_index[start_label], label_index[stop_label])
+                for start_label, stop_label in seekpath_output['path']
+            ],
+            dtype=int,
+        ).reshape(-1, 2)
+    return labels, coords, path_indices
+
+
+@timed('getpaths.get_explicit_from_implicit')
+def get_explicit_from_implicit(seekpath_output, reference_distance):
+    r"""
     Given the output of ``get_path`` by seekpath, compute an "explicit" path,
     i.e. instead of just giving the endpoints and their coordinates, compute
     a full list of kpoints
 
     :param seekpath_output: a dictionary, the output of ``seekpath.get_path``
+        (both the ``'dict'`` and the ``'numpy'`` output formats are accepted;
+        in the latter case, ``segments`` is returned as a
+        :math:`m \times 2` integer array)
 
     :param reference_distance: a reference target distance between neighboring
         k-points in the path, in units of 1/ang. The actual value will be as
@@ -22,59 +90,61 @@ def get_explicit_from_implicit(seekpath_output, reference_distance):
     """
     retdict = {}
 
+    labels, coords, path_indices = _get_points_and_path(seekpath_output)
+    reciprocal_lattice = np.asarray(
+        seekpath_output['reciprocal_primitive_lattice'], dtype=float
+    )
+    coords_abs = np.dot(coords, reciprocal_lattice)
+
     kpoints_rel = []
     kpoints_labels = []
     kpoints_linearcoord = []
     previous_linearcoord = 0.0
     segments = []
-    for start_label, stop_label in seekpath_output['path']:
-        start_coord = np.array(seekpath_output['point_coords'][start_label])
-        stop_coord = np.array(seekpath_output['point_coords'][stop_label])
-        start_coord_abs = np.dot(
-            start_coord, seekpath_output['reciprocal_primitive_lattice']
-        )
-        stop_coord_abs = np.dot(
-            stop_coord, seekpath_output['reciprocal_primitive_lattice']
-        )
-        segment_length = np.linalg.norm(stop_coord_abs - start_coord_abs)
+    for start_idx, stop_idx in path_indices:
+        start_label = labels[start_idx]
+        stop_label = labels[stop_idx]
+        start_coord = coords[start_idx]
+        stop_coord = coords[stop_idx]
+        segment_length = np.linalg.norm(coords_abs[stop_idx] - coords_abs[start_idx])
         num_points = max(2, int(segment_length / reference_distance))
         segment_linearcoord = np.linspace(0.0, segment_length, num_points)
+        steps = np.arange(num_points, dtype=float)[:, None]
+        segment_kpoints = start_coord + (stop_coord - start_coord) * steps / float(
+            num_points - 1
+        )
+        segment_labels = [start_label] + [''] * (num_points - 2) + [stop_label]
         segment_start = len(kpoints_labels)
-        for i in range(num_points):
-            # Skip the first point if it's the same as the last one of
-            # the previous segment
-            if i == 0:
-                if kpoints_labels:
-                    if kpoints_labels[-1] == start_label:
-                        segment_start -= 1
-                        continue
-
-            kpoints_rel.append(
-                start_coord
-                + (stop_coord - start_coord) * float(i) / float(num_points - 1)
-            )
-            if i == 0:
-                kpoints_labels.append(start_label)
-            elif i == num_points - 1:
-                kpoints_labels.append(stop_label)
-            else:
-                kpoints_labels.append('')
-            kpoints_linearcoord.append(previous_linearcoord + segment_linearcoord[i])
+        # Skip the first point if it's the same as the last one of
+        # the previous segment
+        first = 0
+        if kpoints_labels and kpoints_labels[-1] == start_label:
+            segment_start -= 1
+            first = 1
+        kpoints_rel.append(segment_kpoints[first:])
+        kpoints_labels.extend(segment_labels[first:])
+        kpoints_linearcoord.append(previous_linearcoord + segment_linearcoord[first:])
         previous_linearcoord += segment_length
         segment_end = len(kpoints_labels)
         segments.append((segment_start, segment_end))
 
-    retdict['kpoints_rel'] = np.array(kpoints_rel)
-    retdict['kpoints_linearcoord'] = np.array(kpoints_linearcoord)
+    if kpoints_rel:
+        retdict['kpoints_rel'] = np.concatenate(kpoints_rel)
+        retdict['kpoints_linearcoord'] = np.concatenate(kpoints_linearcoord)
+    else:
+        retdict['kpoints_rel'] = np.zeros((0, 3))
+        retdict['kpoints_linearcoord'] = np.zeros(0)
     retdict['kpoints_labels'] = kpoints_labels
-    retdict['kpoints_abs'] = np.dot(
-        retdict['kpoints_rel'], seekpath_output['reciprocal_primitive_lattice']
-    )
-    retdict['segments'] = segments
+    retdict['kpoints_abs'] = np.dot(retdict['kpoints_rel'], reciprocal_lattice)
+    if 'point_labels' in seekpath_output:
+        retdict['segments'] = np.array(segments, dtype=int).reshape(-1, 2)
+    else:
+        retdict['segments'] = segments
 
     return retdict
 
 
+@timed('getpaths.get_path')
 def get_path(
     structure,
     with_time_reversal=True,
@@ -82,6 +152,8 @@ def get_path(
     threshold=1.0e-7,
     symprec=1e-05,
     angle_tolerance=-1.0,
+    output='dict',
+    diagnostics='warn',
 ):
     r"""
     Return the kpoint path information for band structure given a
@@ -129,6 +201,24 @@ def get_path(
 
     :param angle_tolerance: the angle_tolerance used internally by SPGLIB
 
+    :param output: the type of the returned object: ``'dict'`` (default) for
+        a dictionary; ``'numpy'`` for a dictionary where lattices are float64
+        arrays, the special points are given as a tuple of labels
+        (``point_labels``) and a :math:`n \times 3` array (``point_coords``),
+        and the path as a :math:`m \times 2` integer array of indices into
+        ``point_labels`` (see :py:func:`seekpath.hpkot.get_path`); ``'result'``
+        for a read-only and memory-efficient
+        :py:class:`~seekpath.results.PathResult` mapping, with the same keys
+        as the ``'dict'`` output and where derived quantities are computed on
+        first access.
+
+    :param diagnostics: ``'warn'`` (default) to issue the diagnostics
+        (e.g. :py:exc:`~seekpath.hpkot.EdgeCaseWarning`) as warnings;
+        ``'collect'`` to return them instead in the ``diagnostics`` key, as
+        a list of dictionaries with keys ``category`` and ``message``,
+        without issuing any warning. Unlike warning filters, collection is
+        thread-safe (see :py:mod:`seekpath.diagnostics`).
+
 
     :return: a dictionary with the following
       keys:
@@ -165,6 +255,11 @@ def get_path(
         - ``inverse_primitive_transformation_matrix``: the inverse of the matrix :math:`P`
           (the determinant is integer and gives the ratio in volume between
           the conventional and primitive cells)
+        - ``transformation_matrix``: the matrix :math:`T` (with the same
+          convention as spglib) relating scaled coordinates of the input cell
+          to those of the crystallographic conventional cell,
+          :math:`x_{conv}^T = T x^T`. For ``aP`` lattices, it also includes the
+          Niggli reduction and the changes of basis of the HPKOT paper.
         - ``volume_original_wrt_conv``: volume ratio of the user-provided cell
           with respect to the the crystallographic conventional cell
         - ``volume_original_wrt_prim``: volume ratio of the user-provided cell
@@ -175,25 +270,37 @@ def get_path(
         orthorhombic systems). In this case, still one of the valid cases
         is picked.
     """
-    if recipe == 'hpkot':
-        from . import hpkot
+    _check_output(output)
+
+    with _get_diagnostics_context(diagnostics) as collected:
+        if recipe == 'hpkot':
+            from . import hpkot
+
+            res = hpkot.get_path(
+                structure=structure,
+                with_time_reversal=with_time_reversal,
+                threshold=threshold,
+                symprec=symprec,
+                angle_tolerance=angle_tolerance,
+                output='dict' if output == 'dict' else 'numpy',
+            )
 
-        res = hpkot.get_path(
-            structure=structure,
-            with_time_reversal=with_time_reversal,
-            threshold=threshold,
-            symprec=symprec,
-            angle_tolerance=angle_tolerance,
-        )
+        else:
+            raise ValueError(
+                "value for 'recipe' not recognized. The only value "
+                "currently accepted is 'hpkot'."
+            )
+    if collected is not None:
+        res['diagnostics'] = collected
 
-    else:
-        raise ValueError(
-            "value for 'recipe' not recognized. The only value "
-            "currently accepted is 'hpkot'."
-        )
+    if output == 'result':
+        from .results import PathResult
+
+        return PathResult(res)
     return res
 
 
+@timed('getpaths.get_explicit_k_path')
 def get_explicit_k_path(
     structure,
     with_time_reversal=True,
@@ -202,6 +309,8 @@ def get_explicit_k_path(
     threshold=1.0e-7,
     symprec=1e-05,
     angle_tolerance=-1.0,
+    output='dict',
+    diagnostics='warn',
 ):
     r"""
     Return the kpoint path for band structure (in scaled and absolute
@@ -260,6 +369,24 @@ def get_explicit_k_path(
 
     :param angle_tolerance: the angle_tolerance used internally by SPGLIB
 
+    :param output: the type of the returned object: ``'dict'`` (default) for
+        a dictionary; ``'numpy'`` for a dictionary where lattices are float64
+        arrays, the special points are given as a tuple of labels
+        (``point_labels``) and a :math:`n \times 3` array (``point_coords``),
+        and the path as a :math:`m \times 2` integer array of indices into
+        ``point_labels`` (see :py:func:`seekpath.hpkot.get_path`); ``'result'``
+        for a read-only and memory-efficient
+        :py:class:`~seekpath.results.PathResult` mapping, with the same keys
+        as the ``'dict'`` output and where derived quantities are computed on
+        first access.
+
+    :param diagnostics: ``'warn'`` (default) to issue the diagnostics
+        (e.g. :py:exc:`~seekpath.hpkot.EdgeCaseWarning`) as warnings;
+        ``'collect'`` to return them instead in the ``diagnostics`` key, as
+        a list of dictionaries with keys ``category`` and ``message``,
+        without issuing any warning. Unlike warning filters, collection is
+        thread-safe (see :py:mod:`seekpath.diagnostics`).
+
     .. versionchanged:: 1.8
         The key ``segments`` has been renamed ``explicit_segments``
         for consistency.
@@ -303,22 +430,34 @@ def get_explicit_k_path(
           and typically in a graphical representation they are shown at the
           same coordinate, with a label ``R|X``).
     """
-    if recipe == 'hpkot':
-        from . import hpkot
+    _check_output(output)
+
+    with _get_diagnostics_context(diagnostics) as collected:
+        if recipe == 'hpkot':
+            from . import hpkot
+
+            res = hpkot.get_path(
+                structure=structure,
+                with_time_reversal=with_time_reversal,
+                threshold=threshold,
+                symprec=symprec,
+                angle_tolerance=angle_tolerance,
+                output='dict' if output == 'dict' else 'numpy',
+            )
 
-        res = hpkot.get_path(
-            structure=structure,
-            with_time_reversal=with_time_reversal,
-            threshold=threshold,
-            symprec=symprec,
-            angle_tolerance=angle_tolerance,
-        )
+        else:
+            raise ValueError(
+                "value for 'recipe' not recognized. The only value "
+                "currently accepted is 'hpkot'."
+            )
+    if collected is not None:
+        res['diagnostics'] = collected
 
-    else:
-        raise ValueError(
-            "value for 'recipe' not recognized. The only value "
-            "currently accepted is 'hpkot'."
-        )
+    if output == 'result':
+        from .results import PathResult
+
+        # The explicit path is computed only when first accessed
+        return PathResult(res, reference_distance=reference_distance)
 
     explicit_res = get_explicit_from_implicit(
         res, reference_distance=reference_distance
@@ -328,6 +467,42 @@ def get_explicit_k_path(
     return res
 
 
+def get_kpoint_transformation_orig_cell(seekpath_output, cell):
+    r"""
+    Return the :math:`3 \times 3` matrix :math:`M` that converts k-points from
+    scaled coordinates of the standardized primitive reciprocal lattice
+    (i.e., the coordinates of the output of :py:func:`get_path`) to scaled
+    coordinates of the reciprocal lattice of the original cell:
+    :math:`k_{orig} = k_{std} M`, with k-points as rows.
+
+    It combines the three steps (conversion to Cartesian coordinates,
+    rotation from the standardized to the original orientation, conversion
+    to scaled coordinates of the original cell) in a single operator, so it
+    can be applied to arrays of any number of k-points (e.g., uniform meshes)
+    with a single matrix product: ``kpoints_orig = kpoints_std @ M``.
+
+    :param seekpath_output: the output of :py:func:`get_path` (any format)
+        for the given cell; only ``reciprocal_primitive_lattice`` and
+        ``rotation_matrix`` are used.
+    :param cell: the original cell (:math:`3 \times 3`, vectors as rows), or
+        its :py:class:`~seekpath.lattice.Lattice`.
+    """
+    from .lattice import Lattice
+
+    if not isinstance(cell, Lattice):
+        cell = Lattice(cell)
+
+    # k_cart = k_std * B_prim; k_cart_orig = k_cart * R;
+    # k_orig = k_cart_orig * A_orig^T / (2 pi)
+    return cell.kpoints_to_fractional(
+        np.dot(
+            np.asarray(seekpath_output['reciprocal_primitive_lattice'], dtype=float),
+            seekpath_output['rotation_matrix'],
+        )
+    )
+
+
+@timed('getpaths.get_path_orig_cell')
 def get_path_orig_cell(
     structure,
     with_time_reversal=True,
@@ -335,6 +510,8 @@ def get_path_orig_cell(
     threshold=1.0e-7,
     symprec=1e-05,
     angle_tolerance=-1.0,
+    output='dict',
+    diagnostics='warn',
 ):
     r"""
     Return the kpoint path information for band structure given a
@@ -391,6 +568,18 @@ def get_path_orig_cell(
 
     :param angle_tolerance: the angle_tolerance used internally by SPGLIB
 
+    :param output: ``'dict'`` (default) or ``'numpy'``. In the latter case,
+        the special points are given as a tuple of labels (``point_labels``)
+        and a :math:`n \times 3` array (``point_coords``), and the path as a
+        :math:`m \times 2` integer array of indices into ``point_labels``.
+
+    :param diagnostics: ``'warn'`` (default) to issue the diagnostics
+        (e.g. :py:exc:`~seekpath.hpkot.EdgeCaseWarning`) as warnings;
+        ``'collect'`` to return them instead in the ``diagnostics`` key, as
+        a list of dictionaries with keys ``category`` and ``message``,
+        without issuing any warning. Unlike warning filters, collection is
+        thread-safe (see :py:mod:`seekpath.diagnostics`).
+
 
     :return: a dictionary with the following
       keys:
@@ -405,6 +594,12 @@ def get_path_orig_cell(
           with_time_reversal=False in the input)
         - ``is_supercell``: True if the input unit cell is a supercell of
           a smaller primitive cell.
+        - ``kpoint_transformation_matrix``: the :math:`3 \times 3` matrix
+          :math:`M` converting k-points from scaled coordinates of the
+          standardized primitive reciprocal lattice to those of the original
+          reciprocal lattice (:math:`k_{orig} = k_{std} M`, see
+          :py:func:`get_kpoint_transformation_orig_cell`). It can be used to
+          map any additional array of k-points to the original cell.
 
     :note: An :py:exc:`~seekpath.hpkot.EdgeCaseWarning` is issued for
         edge cases (e.g. if ``a==b==c`` for
@@ -412,47 +607,162 @@ def get_path_orig_cell(
         is picked.
     """
 
-    res = get_path(
+    from .lattice import Lattice
+
+    return _get_path_orig_cell(
         structure=structure,
+        orig_lattice=Lattice(structure[0]),
         with_time_reversal=with_time_reversal,
+        recipe=recipe,
         threshold=threshold,
         symprec=symprec,
         angle_tolerance=angle_tolerance,
-        recipe=recipe,
+        output=output,
+        diagnostics=diagnostics,
     )
 
-    is_supercell = abs(res['volume_original_wrt_prim'] - 1) > 0.1
 
-    if is_supercell:
-        warnings.warn(
-            'The provided cell is a supercell: the returned k-path is the '
-            'standard k-path of the associated primitive cell in the basis of '
-            'the supercell reciprocal lattice.',
-            SupercellWarning,
+@timed('getpaths.get_path_orig_cell_supercells')
+def get_path_orig_cell_supercells(
+    seekpath_output, supercell_matrices, parent_cell, output='dict'
+):
+    r"""
+    Return the k-point path information (as in :py:func:`get_path_orig_cell`)
+    for many supercells of the same parent structure, without running any
+    symmetry analysis on the supercells.
+
+    The path of the parent structure is computed only once (with
+    :py:func:`get_path`), and then expressed in the basis of the reciprocal
+    lattice of each supercell with pure linear algebra: if the supercell
+    lattice is :math:`A_S = S A` (vectors as rows, :math:`S` an integer
+    matrix), the k-points in scaled coordinates of the supercell are
+    :math:`k_S = k_{std} M S^T`, where :math:`M` is the operator returned by
+    :py:func:`get_kpoint_transformation_orig_cell` for the parent cell.
+
+    As for :py:func:`get_path_orig_cell`, the labels of the points lose their
+    meaning for supercells, since the points are not at the high-symmetry
+    points of the first BZ of the supercell; however, since the supercells
+    are explicitly requested, no :py:exc:`~seekpath.SupercellWarning` is
+    issued.
+
+    :param seekpath_output: the output of :py:func:`get_path` (any format)
+        for the parent structure.
+    :param supercell_matrices: the integer supercell matrices, as a list
+        of :math:`3 \times 3` matrices or an array of shape ``(N, 3, 3)``. A
+        single :math:`3 \times 3` matrix is also accepted.
+    :param parent_cell: the cell (:math:`3 \times 3`, vectors as rows) of
+        the parent structure, as passed to :py:func:`get_path`, or its
+        :py:class:`~seekpath.lattice.Lattice`.
+    :param output: ``'dict'`` (default) or ``'numpy'``, as in
+        :py:func:`get_path_orig_cell`.
+
+    :return: a list with one dictionary per supercell matrix, with the
+        same keys of :py:func:`get_path_orig_cell`.
+    """
+    _check_output(output, ORIG_CELL_OUTPUT_TYPES)
+
+    supercell_matrices = np.asarray(supercell_matrices)
+    if supercell_matrices.ndim == 2:
+        supercell_matrices = supercell_matrices[np.newaxis]
+    if supercell_matrices.ndim != 3 or supercell_matrices.shape[1:] != (3, 3):
+        raise ValueError(
+            'The supercell matrices must have shape (3, 3) or (N, 3, 3), '
+            f'got {supercell_matrices.shape}'
         )
+    int_matrices = np.rint(supercell_matrices).astype(int)
+    if not np.array_equal(int_matrices, supercell_matrices):
+        raise ValueError('The supercell matrices must be integer matrices')
+    determinants = np.rint(np.linalg.det(int_matrices)).astype(int)
+    if np.any(determinants == 0):
+        raise ValueError('The supercell matrices must be non-singular')
+
+    labels, coords, path_indices = _get_points_and_path(seekpath_output)
+    kpoint_transformation = get_kpoint_transformation_orig_cell(
+        seekpath_output, parent_cell
+    )
+    # (N, 3, 3) stack of operators, and (N, n, 3) stack of points
+    operators = np.matmul(kpoint_transformation, np.swapaxes(int_matrices, -1, -2))
+    points = np.matmul(coords, operators)
+    volumes_wrt_prim = (
+        np.abs(determinants) * seekpath_output['volume_original_wrt_prim']
+    )
+
+    if output == 'dict':
+        path = [(labels[start], labels[stop]) for start, stop in path_indices]
+    else:
+        path = path_indices
+
+    retlist = []
+    for supercell_points, operator, volume in zip(points, operators, volumes_wrt_prim):
+        res_orig = {
+            'point_coords': supercell_points,
+            'path': path,
+            'augmented_path': seekpath_output['augmented_path'],
+            'is_supercell': bool(abs(volume - 1) > 0.1),
+            'has_inversion_symmetry': seekpath_output['has_inversion_symmetry'],
+            'bravais_lattice': seekpath_output['bravais_lattice'],
+            'bravais_lattice_extended': seekpath_output['bravais_lattice_extended'],
+            'spacegroup_number': seekpath_output['spacegroup_number'],
+            'spacegroup_international': seekpath_output['spacegroup_international'],
+            'kpoint_transformation_matrix': operator,
+        }
+        if output == 'numpy':
+            res_orig['point_labels'] = labels
+        else:
+            res_orig['point_coords'] = dict(zip(labels, supercell_points.tolist()))
+            res_orig['path'] = list(path)
+        retlist.append(res_orig)
+
+    return retlist
+
+
+def _get_path_orig_cell(
+    structure,
+    orig_lattice,
+    with_time_reversal,
+    recipe,
+    threshold,
+    symprec,
+    angle_tolerance,
+    output,
+    diagnostics,
+):
+    """
+    Implementation of :py:func:`get_path_orig_cell`.
+
+    :param orig_lattice: the :py:class:`~seekpath.lattice.Lattice` of the
+        input structure, so that callers can reuse its cached quantities.
+    """
+    from .diagnostics import warn
 
-    # points in the output of get_path are in scaled coordinates of the
-    # standardized primitive lattice
-    points_scaled_standard = res['point_coords']
+    _check_output(output, ORIG_CELL_OUTPUT_TYPES)
 
-    # Convert points from scaled coordinates of the standardiced primitive
-    # lattice to Cartesian coordinates
-    points_cartesian = {}
-    for pointname, coords in points_scaled_standard.items():
-        points_cartesian[pointname] = coords @ np.array(
-            res['reciprocal_primitive_lattice']
+    with _get_diagnostics_context(diagnostics) as collected:
+        res = get_path(
+            structure=structure,
+            with_time_reversal=with_time_reversal,
+            threshold=threshold,
+            symprec=symprec,
+            angle_tolerance=angle_tolerance,
+            recipe=recipe,
+            output='numpy',
         )
 
-    # Rotate points in Cartesian space
-    for pointname, coords in points_cartesian.items():
-        points_cartesian[pointname] = coords @ res['rotation_matrix']
+        is_supercell = abs(res['volume_original_wrt_prim'] - 1) > 0.1
+
+        if is_supercell:
+            warn(
+                'The provided cell is a supercell: the returned k-path is the '
+                'standard k-path of the associated primitive cell in the basis '
+                'of the supercell reciprocal lattice.',
+                SupercellWarning,
+            )
 
-    # Convert points from Cartesian coordinates to the scaled coordinates
-    # of the original lattice
-    points_scaled_original = {}
-    cell_orig = np.array(structure[0])
-    for pointname, coords in points_cartesian.items():
-        points_scaled_original[pointname] = list(coords @ cell_orig.T / np.pi / 2)
+    # Points in the output of get_path are in scaled coordinates of the
+    # standardized primitive lattice: convert all of them at once to the
+    # scaled coordinates of the original lattice
+    kpoint_transformation = get_kpoint_transformation_orig_cell(res, orig_lattice)
+    points_scaled_original = np.dot(res['point_coords'], kpoint_transformation)
 
     res_orig = {
         'point_coords': points_scaled_original,
@@ -464,11 +774,26 @@ def get_path_orig_cell(
         'bravais_lattice_extended': res['bravais_lattice_extended'],
         'spacegroup_number': res['spacegroup_number'],
         'spacegroup_international': res['spacegroup_international'],
+        'kpoint_transformation_matrix': kpoint_transformation,
     }
+    if collected is not None:
+        res_orig['diagnostics'] = collected
+
+    if output == 'numpy':
+        res_orig['point_labels'] = res['point_labels']
+    else:
+        res_orig['point_coords'] = dict(
+            zip(res['point_labels'], points_scaled_original.tolist())
+        )
+        res_orig['path'] = [
+            (res['point_labels'][start], res['point_labels'][stop])
+            for start, stop in res['path']
+        ]
 
     return res_orig
 
 
+@timed('getpaths.get_explicit_k_path_orig_cell')
 def get_explicit_k_path_orig_cell(
     structure,
     with_time_reversal=True,
@@ -477,6 +802,8 @@ def get_explicit_k_path_orig_cell(
     threshold=1.0e-7,
     symprec=1e-05,
     angle_tolerance=-1.0,
+    output='dict',
+    diagnostics='warn',
 ):
     r"""
     Return the kpoint path for band structure (in scaled and absolute
@@ -538,6 +865,18 @@ def get_explicit_k_path_orig_cell(
 
     :param angle_tolerance: the angle_tolerance used internally by SPGLIB
 
+    :param output: ``'dict'`` (default) or ``'numpy'``. In the latter case,
+        the special points are given as a tuple of labels (``point_labels``)
+        and a :math:`n \times 3` array (``point_coords``), and the path as a
+        :math:`m \times 2` integer array of indices into ``point_labels``.
+
+    :param diagnostics: ``'warn'`` (default) to issue the diagnostics
+        (e.g. :py:exc:`~seekpath.hpkot.EdgeCaseWarning`) as warnings;
+        ``'collect'`` to return them instead in the ``diagnostics`` key, as
+        a list of dictionaries with keys ``category`` and ``message``,
+        without issuing any warning. Unlike warning filters, collection is
+        thread-safe (see :py:mod:`seekpath.diagnostics`).
+
     .. versionchanged:: 1.8
         The key ``segments`` has been renamed ``explicit_segments``
         for consistency.
@@ -581,20 +920,24 @@ def get_explicit_k_path_orig_cell(
           and typically in a graphical representation they are shown at the
           same coordinate, with a label ``R|X``).
     """
-    from .hpkot.tools import get_reciprocal_cell_rows
+    from .lattice import Lattice
 
-    res = get_path_orig_cell(
+    orig_lattice = Lattice(structure[0])
+    res = _get_path_orig_cell(
         structure=structure,
+        orig_lattice=orig_lattice,
         with_time_reversal=with_time_reversal,
+        recipe=recipe,
         threshold=threshold,
         symprec=symprec,
         angle_tolerance=angle_tolerance,
-        recipe=recipe,
+        output=output,
+        diagnostics=diagnostics,
     )
 
     # Set reciprocal_primitive_lattice as the reciprocal lattice of the original
     # cell. To be used only in the get_explicit_from_implicit function.
-    res['reciprocal_primitive_lattice'] = get_reciprocal_cell_rows(structure[0])
+    res['reciprocal_primitive_lattice'] = orig_lattice.reciprocal
 
     explicit_res = get_explicit_from_implicit(
         res, reference_distance=reference_distance
@@ -13,6 +13,8 @@ Licence: MIT License, see LICENSE.txt
   the Materials Project (https://materialsproject.org).
 """
 
+from ..timings import stage, timed
+
 
 class EdgeCaseWarning(RuntimeWarning):
     """
@@ -27,12 +29,14 @@ class SymmetryDetectionError(Exception):
     """
 
 
+@timed('hpkot.get_path')
 def get_path(
     structure,
     with_time_reversal=True,
     threshold=1.0e-7,
     symprec=1e-05,
     angle_tolerance=-1.0,
+    output='dict',
 ):
     r"""
     Return the kpoint path information for band structure given a
@@ -80,6 +84,18 @@ def get_path(
 
     :param angle_tolerance: the angle_tolerance used internally by SPGLIB
 
+    :param output: ``'dict'`` (default) or ``'numpy'``. In the latter case,
+        the format of some keys changes (the other keys are unchanged):
+
+        - ``point_labels``: (additional key) a tuple with the labels of the
+          special points
+        - ``point_coords``: an :math:`n \times 3` float array with the scaled
+          coordinates of the points, in the same order as ``point_labels``
+        - ``path``: an :math:`m \times 2` integer array, with the indices
+          (in ``point_labels``) of the starting and ending point of each
+          section
+        - ``reciprocal_primitive_lattice``: a :math:`3 \times 3` float array
+
 
     :return: a dictionary with the following
       keys:
@@ -116,6 +132,11 @@ def get_path(
         - ``inverse_primitive_transformation_matrix``: the inverse of the matrix :math:`P`
           (the determinant is integer and gives the ratio in volume between
           the conventional and primitive cells)
+        - ``transformation_matrix``: the matrix :math:`T` (with the same
+          convention as spglib) relating scaled coordinates of the input cell
+          to those of the crystallographic conventional cell,
+          :math:`x_{conv}^T = T x^T`. For ``aP`` lattices, it also includes the
+          Niggli reduction and the changes of basis of the HPKOT paper.
         - ``rotation_matrix``: rotation matrix in Cartesian space from the input
           cell to the standardized cell
         - ``volume_original_wrt_conv``: volume ratio of the user-provided cell
@@ -128,50 +149,102 @@ def get_path(
         orthorhombic systems). In this case, still one of the valid cases
         is picked.
     """
-    import copy
-    from math import sqrt
-    import warnings
+    if output not in ('dict', 'numpy'):
+        raise ValueError(
+            f"value '{output}' for 'output' not recognized. Accepted values: "
+            'dict, numpy'
+        )
 
-    import numpy as np
+    dataset = get_symmetry_dataset(
+        structure, symprec=symprec, angle_tolerance=angle_tolerance
+    )
 
-    from .tools import (
-        check_spglib_version,
-        extend_kparam,
-        eval_expr,
-        eval_expr_simple,
-        get_cell_params,
-        get_dot_access_dataset,
-        get_path_data,
-        get_reciprocal_cell_rows,
-        get_real_cell_from_reciprocal_rows,
+    return get_path_from_dataset(
+        dataset,
+        with_time_reversal=with_time_reversal,
+        threshold=threshold,
+        output=output,
     )
-    from .spg_mapping import get_spgroup_data, get_primitive
+
+
+def get_symmetry_dataset(structure, symprec=1e-05, angle_tolerance=-1.0):
+    """
+    Return the spglib symmetry dataset (with dot access) of a structure.
+
+    :param structure: the crystal structure, as a tuple
+        ``(cell, positions, numbers)`` (see :py:func:`get_path`).
+    :param symprec: the symmetry precision used internally by SPGLIB
+    :param angle_tolerance: the angle_tolerance used internally by SPGLIB
+
+    :raise SymmetryDetectionError: if spglib could not detect the symmetry.
+    """
+    import numpy as np
+
+    from .tools import check_spglib_version, get_dot_access_dataset
 
     # I check if the SPGlib version is recent enough (raises ValueError)
     # otherwise
     spglib = check_spglib_version()
 
+    # No copy here for arrays (e.g. views of a StructureBatch): spglib makes
+    # its own C-contiguous copy
     structure_internal = (
-        np.array(structure[0]),
-        np.array(structure[1]),
-        np.array(structure[2]),
+        np.asarray(structure[0]),
+        np.asarray(structure[1]),
+        np.asarray(structure[2]),
     )
 
     # Symmetry analysis by SPGlib, get crystallographic lattice,
     # and cell parameters for this lattice
-    dataset = get_dot_access_dataset(
-        spglib.get_symmetry_dataset(
-            structure_internal, symprec=symprec, angle_tolerance=angle_tolerance
+    with stage('hpkot.spglib'):
+        dataset = get_dot_access_dataset(
+            spglib.get_symmetry_dataset(
+                structure_internal, symprec=symprec, angle_tolerance=angle_tolerance
+            )
         )
-    )
     if dataset is None:
         raise SymmetryDetectionError(
             'Spglib could not detect the symmetry of the system'
         )
+    return dataset
+
+
+def get_path_from_dataset(
+    dataset, with_time_reversal=True, threshold=1.0e-7, output='dict'
+):
+    """
+    Return the kpoint path information from the result of the symmetry
+    analysis of a structure, i.e. all the steps of :py:func:`get_path` after
+    the call to ``spglib.get_symmetry_dataset``.
+
+    :param dataset: the spglib symmetry dataset (with dot access), or any
+        object with the same ``std_lattice``, ``std_positions``,
+        ``std_types``, ``std_rotation_matrix``, ``transformation_matrix``,
+        ``number`` and ``international`` attributes.
+
+    The other parameters and the return value are the same as for
+    :py:func:`get_path`.
+    """
+    from math import sqrt
+
+    import numpy as np
+
+    from ..diagnostics import warn
+    from .tools import check_spglib_version, get_points_and_path
+    from ..lattice import Lattice
+    from .spg_mapping import get_spgroup_data, get_primitive
+
+    if output not in ('dict', 'numpy'):
+        raise ValueError(
+            f"value '{output}' for 'output' not recognized. Accepted values: "
+            'dict, numpy'
+        )
+
     conv_lattice = dataset.std_lattice
     conv_positions = dataset.std_positions
     conv_types = dataset.std_types
-    a, b, c, cosalpha, cosbeta, cosgamma = get_cell_params(conv_lattice)
+    conv_lattice_obj = Lattice(conv_lattice)
+    a, b, c, cosalpha, cosbeta, cosgamma = conv_lattice_obj.cell_params
     spgrp_num = dataset.number
     # This is the transformation from the original to the crystallographic
     # conventional (called std in spglib)
@@ -211,7 +284,7 @@ def get_path(
         ext_bravais = 'tP1'
     elif bravais_lattice == 'tI':
         if abs(c - a) < threshold:
-            warnings.warn('tI lattice, but a almost equal to c', EdgeCaseWarning)
+            warn('tI lattice, but a almost equal to c', EdgeCaseWarning)
         if c <= a:
             ext_bravais = 'tI1'
         else:
@@ -220,13 +293,9 @@ def get_path(
         ext_bravais = 'oP1'
     elif bravais_lattice == 'oF':
         if abs(1.0 / (a**2) - (1.0 / (b**2) + 1.0 / (c**2))) < threshold:
-            warnings.warn(
-                'oF lattice, but 1/a^2 almost equal to 1/b^2 + 1/c^2', EdgeCaseWarning
-            )
+            warn('oF lattice, but 1/a^2 almost equal to 1/b^2 + 1/c^2', EdgeCaseWarning)
         if abs(1.0 / (c**2) - (1.0 / (a**2) + 1.0 / (b**2))) < threshold:
-            warnings.warn(
-                'oF lattice, but 1/c^2 almost equal to 1/a^2 + 1/b^2', EdgeCaseWarning
-            )
+            warn('oF lattice, but 1/c^2 almost equal to 1/a^2 + 1/b^2', EdgeCaseWarning)
         if 1.0 / (a**2) > 1.0 / (b**2) + 1.0 / (c**2):
             ext_bravais = 'oF1'
         elif 1.0 / (c**2) > 1.0 / (a**2) + 1.0 / (b**2):
@@ -237,7 +306,7 @@ def get_path(
         # Sort a,b,c, first is the largest
         sorted_vectors = sorted([(c, 1, 'c'), (b, 3, 'b'), (a, 2, 'a')])[::-1]
         if abs(sorted_vectors[0][0] - sorted_vectors[1][0]) < threshold:
-            warnings.warn(
+            warn(
                 f'oI lattice, but the two longest vectors {sorted_vectors[0][2]} and {sorted_vectors[1][2]} '
                 'have almost the same length',
                 EdgeCaseWarning,
@@ -245,14 +314,14 @@ def get_path(
         ext_bravais = f'{bravais_lattice}{sorted_vectors[0][1]}'
     elif bravais_lattice == 'oC':
         if abs(b - a) < threshold:
-            warnings.warn('oC lattice, but a almost equal to b', EdgeCaseWarning)
+            warn('oC lattice, but a almost equal to b', EdgeCaseWarning)
         if a <= b:
             ext_bravais = 'oC1'
         else:
             ext_bravais = 'oC2'
     elif bravais_lattice == 'oA':
         if abs(b - c) < threshold:
-            warnings.warn('oA lattice, but b almost equal to c', EdgeCaseWarning)
+            warn('oA lattice, but b almost equal to c', EdgeCaseWarning)
         if b <= c:
             ext_bravais = 'oA1'
         else:
@@ -280,9 +349,7 @@ def get_path(
             ext_bravais = 'hP2'
     elif bravais_lattice == 'hR':
         if abs(sqrt(3.0) * a - sqrt(2.0) * c) < threshold:
-            warnings.warn(
-                'hR lattice, but sqrt(3)a almost equal to sqrt(2)c', EdgeCaseWarning
-            )
+            warn('hR lattice, but sqrt(3)a almost equal to sqrt(2)c', EdgeCaseWarning)
         if sqrt(3.0) * a <= sqrt(2.0) * c:
             ext_bravais = 'hR1'
         else:
@@ -291,9 +358,7 @@ def get_path(
         ext_bravais = 'mP1'
     elif bravais_lattice == 'mC':
         if abs(b - a * sqrt(1.0 - cosbeta**2)) < threshold:
-            warnings.warn(
-                'mC lattice, but b almost equal to a*sin(beta)', EdgeCaseWarning
-            )
+            warn('mC lattice, but b almost equal to a*sin(beta)', EdgeCaseWarning)
         if b < a * sqrt(1.0 - cosbeta**2):
             ext_bravais = 'mC1'
         else:
@@ -301,7 +366,7 @@ def get_path(
                 abs(-a * cosbeta / c + a**2 * (1.0 - cosbeta**2) / b**2 - 1.0)
                 < threshold
             ):
-                warnings.warn(
+                warn(
                     'mC lattice, but -a*cos(beta)/c + '
                     'a^2*sin(beta)^2/b^2 almost equal to 1',
                     EdgeCaseWarning,
@@ -312,112 +377,120 @@ def get_path(
             else:
                 ext_bravais = 'mC3'
     elif bravais_lattice == 'aP':
-        # First step: cell that is Niggli reduced in reciprocal space
-        # I use the default eps here, this could be changed
-        reciprocal_cell_orig = get_reciprocal_cell_rows(conv_lattice)
-        ## This is Niggli-reduced
-        reciprocal_cell2 = spglib.niggli_reduce(reciprocal_cell_orig)
-        real_cell2 = get_real_cell_from_reciprocal_rows(reciprocal_cell2)
-        # TODO: get transformation matrix?
-
-        ka2, kb2, kc2, coskalpha2, coskbeta2, coskgamma2 = get_cell_params(
-            reciprocal_cell2
-        )
-
-        conditions = np.array(
-            [
-                abs(kb2 * kc2 * coskalpha2),
-                abs(kc2 * ka2 * coskbeta2),
-                abs(ka2 * kb2 * coskgamma2),
-            ]
-        )
-        M2_matrices = [
-            np.array([[0, 0, 1], [1, 0, 0], [0, 1, 0]]),
-            np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]]),
-            np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
-        ]
-        # TODO: manage edge cases
-        smallest_condition = np.argsort(conditions)[0]
-        M2 = M2_matrices[smallest_condition]
-        # First change of vectors to have |ka3 kb3 cosgamma3| smallest
-        real_cell3 = np.dot(np.array(real_cell2).T, M2).T
-        reciprocal_cell3 = get_reciprocal_cell_rows(real_cell3)
-        _, _, _, coskalpha3, coskbeta3, coskgamma3 = get_cell_params(reciprocal_cell3)
-        if abs(coskalpha3) < threshold:
-            warnings.warn(
-                'aP lattice, but the k_alpha3 angle is almost equal to 90 degrees',
-                EdgeCaseWarning,
-            )
-        if abs(coskbeta3) < threshold:
-            warnings.warn(
-                'aP lattice, but the k_beta3 angle is almost equal to 90 degrees',
-                EdgeCaseWarning,
-            )
-        if abs(coskgamma3) < threshold:
-            warnings.warn(
-                'aP lattice, but the k_gamma3 angle is almost equal to 90 degrees',
-                EdgeCaseWarning,
-            )
-        # Make them all-acute or all-obtuse with the additional conditions
-        # explained in HPKOT
-        # Note: cos > 0 => angle < 90deg
-
-        # pylint: disable=chained-comparison
-        if coskalpha3 > 0.0 and coskbeta3 > 0.0 and coskgamma3 > 0.0:  # 1a
-            M3 = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
-        elif coskalpha3 <= 0.0 and coskbeta3 <= 0.0 and coskgamma3 <= 0.0:  # 1b
-            M3 = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
-        elif coskalpha3 > 0.0 and coskbeta3 <= 0.0 and coskgamma3 <= 0.0:  # 2a
-            M3 = np.array([[1, 0, 0], [0, -1, 0], [0, 0, -1]])
-        elif coskalpha3 <= 0.0 and coskbeta3 > 0.0 and coskgamma3 > 0.0:  # 2b
-            M3 = np.array([[1, 0, 0], [0, -1, 0], [0, 0, -1]])
-        elif coskalpha3 <= 0.0 and coskbeta3 > 0.0 and coskgamma3 <= 0.0:  # 3a
-            M3 = np.array([[-1, 0, 0], [0, 1, 0], [0, 0, -1]])
-        elif coskalpha3 > 0.0 and coskbeta3 <= 0.0 and coskgamma3 > 0.0:  # 3b
-            M3 = np.array([[-1, 0, 0], [0, 1, 0], [0, 0, -1]])
-        elif coskalpha3 <= 0.0 and coskbeta3 <= 0.0 and coskgamma3 > 0.0:  # 4a
-            M3 = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, 1]])
-        elif coskalpha3 > 0.0 and coskbeta3 > 0.0 and coskgamma3 <= 0.0:  # 4b
-            M3 = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, 1]])
-        else:
-            raise ValueError(
-                'Problem identifying M3 matrix in aP lattice!'
-                f'Sign of cosines: cos(kalpha3){">=" if coskalpha3 >= 0 else "<"}0, '
-                f'cos(kbeta3){">=" if coskbeta3 >= 0 else "<"}0, cos(kgamma3){">=" if coskgamma3 >= 0 else "<"}0'
-            )
-        # pylint: enable=chained-comparison
-
-        real_cell_final = np.dot(real_cell3.T, M3).T
-        reciprocal_cell_final = get_reciprocal_cell_rows(real_cell_final)
-        _, _, _, coskalpha, coskbeta, coskgamma = get_cell_params(reciprocal_cell_final)
-
-        if coskalpha <= 0.0 and coskbeta <= 0.0 and coskgamma <= 0.0:
-            # all-obtuse
-            ext_bravais = 'aP2'
-        elif coskalpha >= 0.0 and coskbeta >= 0.0 and coskgamma >= 0.0:
-            # all-acute
-            ext_bravais = 'aP3'
-        else:
-            raise ValueError(
-                'Unexpected aP triclinic lattice, it neither '
-                'all-obtuse nor all-acute! Sign of cosines: cos(kalpha)'
-                f'{">=" if coskalpha >= 0 else "<"}0, '
-                f'cos(kbeta){">=" if coskbeta >= 0 else "<"}0, cos(kgamma)'
-                f'{">=" if coskgamma >= 0 else "<"}0'
+        with stage('hpkot.niggli'):
+            # First step: cell that is Niggli reduced in reciprocal space
+            # I use the default eps here, this could be changed
+            reciprocal_cell_orig = conv_lattice_obj.reciprocal
+            ## This is Niggli-reduced
+            spglib = check_spglib_version()
+            reciprocal_cell2 = spglib.niggli_reduce(reciprocal_cell_orig)
+            lattice2 = Lattice.from_reciprocal(reciprocal_cell2)
+
+            ka2, kb2, kc2, coskalpha2, coskbeta2, coskgamma2 = (
+                lattice2.reciprocal_cell_params
             )
 
-        # Get absolute positions
-        conv_pos_abs = np.dot(conv_positions, conv_lattice)
-        # Replace conv_lattice with the new conv_lattice
-        conv_lattice = np.array(real_cell_final)
-        # Store the relative coords with respect to the new vectors
-        # TODO: decide if we want to do %1. for the fractional coordinates
-        conv_positions = np.dot(conv_pos_abs, np.linalg.inv(conv_lattice))
-        # TODO: implement the correct one (probably we need the matrix
-        # out from niggli, and then we can combine it with M2 and M3??)
-        # We set it to None for the time being to avoid confusion
+            conditions = np.array(
+                [
+                    abs(kb2 * kc2 * coskalpha2),
+                    abs(kc2 * ka2 * coskbeta2),
+                    abs(ka2 * kb2 * coskgamma2),
+                ]
+            )
+            M2_matrices = [
+                np.array([[0, 0, 1], [1, 0, 0], [0, 1, 0]]),
+                np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]]),
+                np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
+            ]
+            # TODO: manage edge cases
+            smallest_condition = np.argsort(conditions)[0]
+            M2 = M2_matrices[smallest_condition]
+            # First change of vectors to have |ka3 kb3 cosgamma3| smallest
+            real_cell3 = np.dot(lattice2.cell.T, M2).T
+            _, _, _, coskalpha3, coskbeta3, coskgamma3 = Lattice(
+                real_cell3
+            ).reciprocal_cell_params
+            if abs(coskalpha3) < threshold:
+                warn(
+                    'aP lattice, but the k_alpha3 angle is almost equal to 90 degrees',
+                    EdgeCaseWarning,
+                )
+            if abs(coskbeta3) < threshold:
+                warn(
+                    'aP lattice, but the k_beta3 angle is almost equal to 90 degrees',
+                    EdgeCaseWarning,
+                )
+            if abs(coskgamma3) < threshold:
+                warn(
+                    'aP lattice, but the k_gamma3 angle is almost equal to 90 degrees',
+                    EdgeCaseWarning,
+                )
+            # Make them all-acute or all-obtuse with the additional conditions
+            # explained in HPKOT
+            # Note: cos > 0 => angle < 90deg
+
+            # pylint: disable=chained-comparison
+            if coskalpha3 > 0.0 and coskbeta3 > 0.0 and coskgamma3 > 0.0:  # 1a
+                M3 = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+            elif coskalpha3 <= 0.0 and coskbeta3 <= 0.0 and coskgamma3 <= 0.0:  # 1b
+                M3 = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+            elif coskalpha3 > 0.0 and coskbeta3 <= 0.0 and coskgamma3 <= 0.0:  # 2a
+                M3 = np.array([[1, 0, 0], [0, -1, 0], [0, 0, -1]])
+            elif coskalpha3 <= 0.0 and coskbeta3 > 0.0 and coskgamma3 > 0.0:  # 2b
+                M3 = np.array([[1, 0, 0], [0, -1, 0], [0, 0, -1]])
+            elif coskalpha3 <= 0.0 and coskbeta3 > 0.0 and coskgamma3 <= 0.0:  # 3a
+                M3 = np.array([[-1, 0, 0], [0, 1, 0], [0, 0, -1]])
+            elif coskalpha3 > 0.0 and coskbeta3 <= 0.0 and coskgamma3 > 0.0:  # 3b
+                M3 = np.array([[-1, 0, 0], [0, 1, 0], [0, 0, -1]])
+            elif coskalpha3 <= 0.0 and coskbeta3 <= 0.0 and coskgamma3 > 0.0:  # 4a
+                M3 = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, 1]])
+            elif coskalpha3 > 0.0 and coskbeta3 > 0.0 and coskgamma3 <= 0.0:  # 4b
+                M3 = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, 1]])
+            else:
+                raise ValueError(
+                    'Problem identifying M3 matrix in aP lattice!'
+                    f'Sign of cosines: cos(kalpha3){">=" if coskalpha3 >= 0 else "<"}0, '
+                    f'cos(kbeta3){">=" if coskbeta3 >= 0 else "<"}0, cos(kgamma3){">=" if coskgamma3 >= 0 else "<"}0'
+                )
+            # pylint: enable=chained-comparison
+
+            real_cell_final = np.dot(real_cell3.T, M3).T
+            _, _, _, coskalpha, coskbeta, coskgamma = Lattice(
+                real_cell_final
+            ).reciprocal_cell_params
+
+            if coskalpha <= 0.0 and coskbeta <= 0.0 and coskgamma <= 0.0:
+                # all-obtuse
+                ext_bravais = 'aP2'
+            elif coskalpha >= 0.0 and coskbeta >= 0.0 and coskgamma >= 0.0:
+                # all-acute
+                ext_bravais = 'aP3'
+            else:
+                raise ValueError(
+                    'Unexpected aP triclinic lattice, it neither '
+                    'all-obtuse nor all-acute! Sign of cosines: cos(kalpha)'
+                    f'{">=" if coskalpha >= 0 else "<"}0, '
+                    f'cos(kbeta){">=" if coskbeta >= 0 else "<"}0, cos(kgamma)'
+                    f'{">=" if coskgamma >= 0 else "<"}0'
+                )
 
-        # transformation_matrix = None
+            # Integer matrix N such that real_cell_final = N * conv_lattice
+            # (vectors are rows). It combines the Niggli reduction with M2 and M3,
+            # so it is unimodular: we round it to get rid of numerical noise.
+            niggli_matrix = np.rint(
+                np.dot(real_cell_final, conv_lattice_obj.inverse)
+            ).astype(int)
+            inv_niggli_matrix = np.rint(np.linalg.inv(niggli_matrix)).astype(int)
+            # Replace conv_lattice with the new conv_lattice
+            conv_lattice = np.dot(niggli_matrix, conv_lattice)
+            # Store the relative coords with respect to the new vectors:
+            # r = x * L = (x * N^-1) * (N * L)
+            # TODO: decide if we want to do %1. for the fractional coordinates
+            conv_positions = np.dot(conv_positions, inv_niggli_matrix)
+            # Combine with the spglib transformation matrix, so that it
+            # goes from the original cell to the final aP cell:
+            # x_final^T = N^-T * x_std^T = N^-T * P * x_orig^T
+            transf_matrix = np.dot(inv_niggli_matrix.T, transf_matrix)
 
     else:
         raise ValueError(
@@ -427,60 +500,28 @@ def get_path(
     # NOTE: we simply use spglib.find_primitive, because the
     # find_primitive of spglib follows a different convention for mC
     # and oA as explained in the HPKOT paper
-    (prim_lattice, prim_pos, prim_types), (P, invP), _ = get_primitive(
-        structure=(conv_lattice, conv_positions, conv_types),
-        bravais_lattice=bravais_lattice,
-    )
-
-    # Get the path data (k-parameters definitions, defition of the points,
-    # suggested path)
-    kparam_def, points_def, path = get_path_data(ext_bravais)
-
-    # Get the actual numerical values of the k-parameters
-    # Note: at each step, I pass kparam and store the new
-    # parameter in the same dictionary. This allows to have
-    # some parameters defined implicitly in terms of previous
-    # parameters, as far as they are returned in the
-    kparam = {}
-    for kparam_name, kparam_expr in kparam_def:
-        kparam[kparam_name] = eval_expr(
-            kparam_expr, a, b, c, cosalpha, cosbeta, cosgamma, kparam
+    with stage('hpkot.get_primitive'):
+        (prim_lattice, prim_pos, prim_types), (P, invP), _ = get_primitive(
+            structure=(conv_lattice, conv_positions, conv_types),
+            bravais_lattice=bravais_lattice,
         )
 
-    # Extend kparam with additional simple expressions (like 1-a, ...)
-    kparam_extended = extend_kparam(kparam)
-
-    # Now I have evaluated all needed kparams; I can compute the actual
-    # coordinates of the relevant kpoints, using eval_expr_simple
-    points = {}
-    for pointname, coords_def in points_def.items():
-        coords = [eval_expr_simple(_, kparam_extended) for _ in coords_def]
-        points[pointname] = coords
+    reciprocal_primitive_lattice = Lattice(prim_lattice).reciprocal
 
     # If there is no inversion symmetry nor time-reversal symmetry, add
     # additional path
     augmented_path = not has_inv and not with_time_reversal
 
-    if augmented_path:
-        for pointname, coords in list(points.items()):
-            if pointname == 'GAMMA':
-                continue
-            points[f"{pointname}'"] = [-coords[0], -coords[1], -coords[2]]
-            points[f"{pointname}'"] = [-coords[0], -coords[1], -coords[2]]
-        old_path = copy.deepcopy(path)
-        for start_p, end_p in old_path:
-            if start_p == 'GAMMA':
-                new_start_p = start_p
-            else:
-                new_start_p = f"{start_p}'"
-            if end_p == 'GAMMA':
-                new_end_p = end_p
-            else:
-                new_end_p = f"{end_p}'"
-                new_end_p = f"{end_p}'"
-            path.append((new_start_p, new_end_p))
+    # Special points and suggested path (memoized for repeated lattices)
+    with stage('hpkot.points_and_path'):
+        points, path = get_points_and_path(
+            ext_bravais,
+            (a, b, c, cosalpha, cosbeta, cosgamma),
+            with_time_reversal=with_time_reversal,
+            has_inv=has_inv,
+        )
 
-    return {
+    res = {
         'point_coords': points,
         'path': path,
         'has_inversion_symmetry': has_inv,
@@ -493,17 +534,33 @@ def get_path(
         'primitive_lattice': prim_lattice,
         'primitive_positions': prim_pos,
         'primitive_types': prim_types,
-        'reciprocal_primitive_lattice': get_reciprocal_cell_rows(prim_lattice),
+        'reciprocal_primitive_lattice': (
+            reciprocal_primitive_lattice.tolist()
+            if output == 'dict'
+            else reciprocal_primitive_lattice
+        ),
         # The following: between conv and primitive, see docstring of
         # spg_mapping.get_P_matrix
         'inverse_primitive_transformation_matrix': invP,
         'primitive_transformation_matrix': P,
-        # For the time being disabled, not valid for aP lattices
-        # (for which we would need the transformation matrix from niggli)
-        #'transformation_matrix': transf_matrix,
+        'transformation_matrix': transf_matrix,
         'volume_original_wrt_conv': volume_conv_wrt_original,
         'volume_original_wrt_prim': volume_conv_wrt_original * np.linalg.det(invP),
         'spacegroup_number': dataset.number,
         'spacegroup_international': dataset.international,
         'rotation_matrix': dataset.std_rotation_matrix,
     }
+
+    if output == 'numpy':
+        point_labels = tuple(points)
+        label_index = {label: idx for idx, label in enumerate(point_labels)}
+        res['point_labels'] = point_labels
+        res['point_coords'] = np.array(
+            [points[label] for label in point_labels], dtype=float
+        )
+        res['path'] = np.array(
+            [(label_index[start_p], label_index[end_p]) for start_p, end_p in path],
+            dtype=int,
+        ).reshape(-1, 2)
+
+    return res
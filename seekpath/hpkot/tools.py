@@ -1,17 +1,44 @@
 """Various utilities."""
 
-import numpy
-import numpy.linalg
+import copy
+import functools
+import threading
+from collections import OrderedDict
 from math import sqrt
 
-import sys
-from packaging.version import Version
+from ..timings import stage, timed
 
-# Use importlib.metadata for version retrieval based on Python version
-if sys.version_info < (3, 8):
-    from importlib_metadata import version  # For Python < 3.8
-else:
-    from importlib.metadata import version
+# Maximum number of lattices in the memo of get_points_and_path (0 to disable)
+LATTICE_CACHE_MAXSIZE = 4096
+# Number of decimals used to quantize the lattice parameters (lengths, in
+# the units of the cell, and cosines of the angles) in the memo key
+LATTICE_CACHE_DECIMALS = 8
+
+_lattice_cache = OrderedDict()
+_lattice_cache_lock = threading.Lock()
+_lattice_cache_stats = {'hits': 0, 'misses': 0}
+
+
+@functools.lru_cache(maxsize=None)
+def get_spglib_version():
+    """
+    Return the installed spglib version as a ``packaging.version.Version``.
+
+    ``packaging`` and ``importlib.metadata`` are imported only here (and
+    the result is cached), since they are relatively slow to import and
+    to query.
+    """
+    import sys
+
+    from packaging.version import Version
+
+    # Use importlib.metadata for version retrieval based on Python version
+    if sys.version_info < (3, 8):
+        from importlib_metadata import version  # For Python < 3.8
+    else:
+        from importlib.metadata import version
+
+    return Version(version('spglib'))
 
 
 def eval_expr_simple(expr, kparam):  # pylint=disable: too-many-return-statements
@@ -230,7 +257,9 @@ def check_spglib_version():
             'of the k-paths, but it could not be imported'
         ) from exc
 
-    spg_version = Version(version('spglib'))
+    from packaging.version import Version
+
+    spg_version = get_spglib_version()
 
     min_version = Version('1.9.4')
     warning_version = Version('1.13')
@@ -261,9 +290,9 @@ def get_dot_access_dataset(dataset):
     if dataset is None:
         return None
 
-    spg_version = Version(version('spglib'))
+    from packaging.version import Version
 
-    if spg_version < Version('2.5.0'):
+    if get_spglib_version() < Version('2.5.0'):
         from types import SimpleNamespace
 
         return SimpleNamespace(**dataset)
@@ -276,19 +305,16 @@ def get_cell_params(cell):
     Return (a,b,c,cosalpha,cosbeta,cosgamma) given a :math:`3\times 3` cell
 
     .. note:: Rows are vectors: ``v1 = cell[0]``, ``v2 = cell[1]``, ``v3 = cell[3]``
+
+    .. note:: If you need other quantities of the same cell, use directly
+        :py:class:`seekpath.lattice.Lattice`, that caches them.
     """
-    v1, v2, v3 = numpy.array(cell)
-    a = sqrt(sum(v1**2))
-    b = sqrt(sum(v2**2))
-    c = sqrt(sum(v3**2))
-    cosalpha = numpy.dot(v2, v3) / b / c
-    cosbeta = numpy.dot(v1, v3) / a / c
-    cosgamma = numpy.dot(v1, v2) / a / b
+    from ..lattice import Lattice
 
-    return (a, b, c, cosalpha, cosbeta, cosgamma)
+    return Lattice(cell).cell_params
 
 
-def get_reciprocal_cell_rows(real_space_cell):
+def get_reciprocal_cell_rows(real_space_cell, as_list=True):
     r"""
     Given the cell in real space (3x3 matrix, vectors as rows,
     return the reciprocal-space cell where again the G vectors are
@@ -296,14 +322,21 @@ def get_reciprocal_cell_rows(real_space_cell):
     ``dot(real_space_cell, reciprocal_space_cell.T)`` = :math:`2 \pi I`,
     where :math:`I` is the :math:`3\times 3` identity matrix.
 
+    :param as_list: if True (default), return a list of lists, otherwise
+        a (C-contiguous) :math:`3\times 3` float64 array.
+
     :return: the :math:`3\times 3` list of reciprocal lattice vectors where each row is
         one vector.
     """
-    reciprocal_space_columns = 2.0 * numpy.pi * numpy.linalg.inv(real_space_cell)
-    return (reciprocal_space_columns.T).tolist()
+    from ..lattice import Lattice
+
+    reciprocal_space_rows = Lattice(real_space_cell).reciprocal
+    if as_list:
+        return reciprocal_space_rows.tolist()
+    return reciprocal_space_rows
 
 
-def get_real_cell_from_reciprocal_rows(reciprocal_space_rows):
+def get_real_cell_from_reciprocal_rows(reciprocal_space_rows, as_list=True):
     r"""
     Given the cell in reciprocal space (3x3 matrix, G vectors as rows,
     return the real-space cell where again the R vectors are
@@ -313,13 +346,16 @@ def get_real_cell_from_reciprocal_rows(reciprocal_space_rows):
 
     .. note::  This is actually the same as :py:func:`get_reciprocal_cell_rows`.
 
+    :param as_list: if True (default), return a list of lists, otherwise
+        a (C-contiguous) :math:`3\times 3` float64 array.
+
     :return: the :math:`3\times 3` list of real lattice vectors where each row is
         one vector.
     """
-    real_space_columns = 2.0 * numpy.pi * numpy.linalg.inv(reciprocal_space_rows)
-    return (real_space_columns.T).tolist()
+    return get_reciprocal_cell_rows(reciprocal_space_rows, as_list=as_list)
 
 
+@timed('hpkot.get_path_data')
 def get_path_data(ext_bravais):
     """
     Given an extended Bravais symbol among those defined in the HPKOT paper
@@ -384,3 +420,148 @@ def get_path_data(ext_bravais):
             )
 
     return (kparam_def, points_def, path)
+
+
+def evaluate_points_and_path(ext_bravais, cell_params, augmented_path):
+    """
+    Evaluate the coordinates of the special points and the suggested path
+    for the given extended Bravais lattice.
+
+    :param ext_bravais: the extended Bravais lattice (like ``cF1``).
+    :param cell_params: the tuple ``(a, b, c, cosalpha, cosbeta, cosgamma)``
+        of the crystallographic conventional cell.
+    :param augmented_path: if True, add the :math:`-k` points and path.
+    :return: a tuple ``(points, path)``, with the dictionary of the points
+        (label -> list of scaled coordinates) and the list of the segments.
+    """
+    a, b, c, cosalpha, cosbeta, cosgamma = cell_params
+
+    # Get the path data (k-parameters definitions, defition of the points,
+    # suggested path)
+    kparam_def, points_def, path = get_path_data(ext_bravais)
+
+    # Get the actual numerical values of the k-parameters
+    # Note: at each step, I pass kparam and store the new
+    # parameter in the same dictionary. This allows to have
+    # some parameters defined implicitly in terms of previous
+    # parameters, as far as they are returned in the
+    with stage('hpkot.kparams'):
+        kparam = {}
+        for kparam_name, kparam_expr in kparam_def:
+            kparam[kparam_name] = eval_expr(
+                kparam_expr, a, b, c, cosalpha, cosbeta, cosgamma, kparam
+            )
+
+        # Extend kparam with additional simple expressions (like 1-a, ...)
+        kparam_extended = extend_kparam(kparam)
+
+        # Now I have evaluated all needed kparams; I can compute the actual
+        # coordinates of the relevant kpoints, using eval_expr_simple
+        points = {}
+        for pointname, coords_def in points_def.items():
+            coords = [eval_expr_simple(_, kparam_extended) for _ in coords_def]
+            points[pointname] = coords
+
+    # If there is no inversion symmetry nor time-reversal symmetry, add
+    # additional path
+    if augmented_path:
+        with stage('hpkot.augment_path'):
+            for pointname, coords in list(points.items()):
+                if pointname == 'GAMMA':
+                    continue
+                points[f"{pointname}'"] = [-coords[0], -coords[1], -coords[2]]
+                points[f"{pointname}'"] = [-coords[0], -coords[1], -coords[2]]
+            old_path = copy.deepcopy(path)
+            for start_p, end_p in old_path:
+                if start_p == 'GAMMA':
+                    new_start_p = start_p
+                else:
+                    new_start_p = f"{start_p}'"
+                if end_p == 'GAMMA':
+                    new_end_p = end_p
+                else:
+                    new_end_p = f"{end_p}'"
+                    new_end_p = f"{end_p}'"
+                path.append((new_start_p, new_end_p))
+
+    return points, path
+
+
+def get_lattice_cache_key(ext_bravais, cell_params, with_time_reversal, has_inv):
+    """
+    Return the key of the memo of :py:func:`get_points_and_path`, with the
+    cell parameters quantized to ``LATTICE_CACHE_DECIMALS`` decimals.
+    """
+    return (
+        ext_bravais,
+        tuple(round(float(param), LATTICE_CACHE_DECIMALS) for param in cell_params),
+        bool(with_time_reversal),
+        bool(has_inv),
+    )
+
+
+def get_points_and_path(ext_bravais, cell_params, with_time_reversal, has_inv):
+    """
+    Return the special points and the suggested path, as
+    :py:func:`evaluate_points_and_path`, memoizing the result.
+
+    The memo is keyed on the extended Bravais lattice, on the quantized
+    cell parameters (see :py:func:`get_lattice_cache_key`) and on the
+    symmetry flags: structures that share the conventional lattice (e.g.
+    alloy configurations or magnetic orderings) skip the evaluation of the
+    k-parameters and of the points. For lattices that differ by less than
+    the quantization, the points of the first evaluated lattice are reused.
+
+    Each call returns new objects, that can be modified by the caller.
+    """
+    key = get_lattice_cache_key(ext_bravais, cell_params, with_time_reversal, has_inv)
+    with _lattice_cache_lock:
+        cached = _lattice_cache.get(key)
+        if cached is not None:
+            _lattice_cache.move_to_end(key)
+            _lattice_cache_stats['hits'] += 1
+        else:
+            _lattice_cache_stats['misses'] += 1
+
+    if cached is None:
+        points, path = evaluate_points_and_path(
+            ext_bravais,
+            cell_params,
+            augmented_path=not has_inv and not with_time_reversal,
+        )
+        cached = (
+            tuple((label, tuple(coords)) for label, coords in points.items()),
+            tuple(path),
+        )
+        with _lattice_cache_lock:
+            if LATTICE_CACHE_MAXSIZE > 0:
+                _lattice_cache[key] = cached
+                while len(_lattice_cache) > LATTICE_CACHE_MAXSIZE:
+                    _lattice_cache.popitem(last=False)
+        return points, path
+
+    cached_points, cached_path = cached
+    return {label: list(coords) for label, coords in cached_points}, list(cached_path)
+
+
+def clear_lattice_cache():
+    """Empty the memo of :py:func:`get_points_and_path`, and reset its statistics."""
+    with _lattice_cache_lock:
+        _lattice_cache.clear()
+        _lattice_cache_stats['hits'] = 0
+        _lattice_cache_stats['misses'] = 0
+
+
+def get_lattice_cache_info():
+    """
+    Return a dictionary with the statistics of the memo of
+    :py:func:`get_points_and_path`: ``hits``, ``misses``, ``size`` and
+    ``maxsize``.
+    """
+    with _lattice_cache_lock:
+        return {
+            'hits': _lattice_cache_stats['hits'],
+            'misses': _lattice_cache_stats['misses'],
+            'size': len(_lattice_cache),
+            'maxsize': LATTICE_CACHE_MAXSIZE,
+        }
@@ -0,0 +1,632 @@
+"""
+Streaming readers of crystal structures, yielding ``(cell, positions,
+numbers)`` tuples that can be passed directly to :py:func:`seekpath.get_path`.
+
+Supported formats (see :py:data:`FORMATS`):
+
+- ``poscar``: VASP POSCAR/CONTCAR (VASP 5 format, with the species line);
+- ``xdatcar``: VASP XDATCAR, with fixed or variable cell (multiple frames);
+- ``extxyz``: extended XYZ (multiple frames, with a ``Lattice`` entry);
+- ``cif``: basic CIF (multiple data blocks, cell parameters, fractional
+  coordinates and, if present, the symmetry operations to expand the
+  asymmetric unit).
+
+In all cases, ``cell`` is a :math:`3 \\times 3` array (vectors as rows),
+``positions`` an :math:`N \\times 3` array of scaled coordinates and
+``numbers`` a length-:math:`N` array of atomic numbers, obtained from the
+chemical symbols with :py:data:`seekpath.util.atoms_num_dict`.
+"""
+
+import contextlib
+import glob
+import os
+import re
+
+import numpy as np
+
+from .util import atoms_num_dict
+
+# Accepted values of the ``format`` parameter
+FORMATS = ('poscar', 'xdatcar', 'extxyz', 'cif')
+
+# Number of structures read in advance by the background thread of
+# iter_structures
+DEFAULT_PREFETCH = 16
+
+# Leading chemical symbol of a species or site label (e.g. 'Fe' in 'Fe_pv',
+# 'Fe2+', 'Fe1' or 'FE')
+_SYMBOL_RE = re.compile(r'[A-Za-z]{1,2}')
+# Trailing comment of a line of the header of a VASP file (e.g. '1.0 ! scale')
+_VASP_COMMENT_RE = re.compile(r'[!#].*')
+# A CIF token: quoted string, or any sequence of non-blank characters
+_CIF_TOKEN_RE = re.compile(r"'[^']*'(?=\s|$)|\"[^\"]*\"(?=\s|$)|\S+")
+# Numerical CIF value, possibly with the standard uncertainty, e.g. 5.431(2)
+_CIF_UNCERTAINTY_RE = re.compile(r'\([0-9]+\)$')
+
+
+def _get_atomic_number(symbol):
+    """
+    Return the atomic number of a chemical symbol or species label (e.g.
+    ``'Fe'``, ``'FE'``, ``'Fe_pv'``, ``'Fe1'``, ``'Fe2+'``).
+    """
+    match = _SYMBOL_RE.match(symbol.strip())
+    if match is not None:
+        candidate = match.group().capitalize()
+        # Labels as 'C1' or 'Ca' are resolved greedily: two letters first
+        for element in (candidate, candidate[0]):
+            if element in atoms_num_dict:
+                return atoms_num_dict[element]
+    raise ValueError(f"Unknown chemical symbol '{symbol}'")
+
+
+def symbols_to_numbers(symbols):
+    """
+    Return the array of the atomic numbers of an array of chemical symbols
+    (or species labels, see :py:func:`_get_atomic_number`).
+
+    Each distinct symbol is looked up only once in
+    :py:data:`seekpath.util.atoms_num_dict`, and the result is expanded
+    with a vectorized indexing, so that large structures are mapped in
+    :math:`O(N \\log N)` NumPy operations rather than :math:`N` dictionary
+    lookups.
+
+    :raise ValueError: if a symbol is not recognized.
+    """
+    symbols = np.asarray(symbols, dtype=str)
+    if symbols.size == 0:
+        return np.zeros(symbols.shape, dtype=int)
+    unique, inverse = np.unique(symbols, return_inverse=True)
+    unique_numbers = np.array([_get_atomic_number(symbol) for symbol in unique])
+    return unique_numbers[inverse.reshape(symbols.shape)]
+
+
+@contextlib.contextmanager
+def _open(source):
+    """Open ``source`` (a path), or yield it if it is already a file object."""
+    if hasattr(source, 'read'):
+        yield source
+    else:
+        with open(source, encoding='utf-8') as handle:
+            yield handle
+
+
+def _read_lines(handle, num_lines):
+    """Read ``num_lines`` lines, raising ValueError if the file ends before."""
+    lines = [handle.readline() for _ in range(num_lines)]
+    if num_lines and not lines[-1]:
+        raise ValueError('Unexpected end of file')
+    return lines
+
+
+def _parse_floats(lines, num_columns=3):
+    """
+    Parse the first ``num_columns`` values of each line into a float array
+    of shape ``(len(lines), num_columns)``, with a single conversion.
+    """
+    try:
+        return np.array(
+            [line.split()[:num_columns] for line in lines], dtype=float
+        ).reshape(len(lines), num_columns)
+    except ValueError as exc:
+        raise ValueError(f'Invalid numerical data: {exc}') from exc
+
+
+def _read_vasp_header(handle, first_line=None):
+    """
+    Read the header of a POSCAR or XDATCAR (from the comment line to the
+    line with the numbers of atoms). Trailing comments (after ``!`` or
+    ``#``) of the following lines are ignored.
+
+    :param first_line: the comment line, if already read.
+    :return: ``(cell, numbers, scale)``, where ``scale`` is the length-3
+        array of the scaling factors of the Cartesian directions, or None at
+        the end of the file.
+    """
+    if first_line is None:
+        first_line = handle.readline()
+    if not first_line.strip():
+        return None
+
+    lines = [_VASP_COMMENT_RE.sub('', line) for line in _read_lines(handle, 6)]
+    scale = np.array(lines[0].split()[:3], dtype=float)
+    cell = _parse_floats(lines[1:4])
+    if len(scale) == 1 and scale[0] < 0:
+        # Negative scale factor: the volume of the cell
+        scale = (-scale / abs(np.linalg.det(cell))) ** (1.0 / 3.0)
+    # One scale factor, or one for each Cartesian direction
+    scale = np.broadcast_to(scale, (3,))
+    cell = cell * scale
+
+    species = lines[4].split()
+    if not species or species[0].isdigit():
+        raise ValueError(
+            'The species line is missing: only the VASP 5 format (with the '
+            'chemical symbols before the numbers of atoms) is supported'
+        )
+    counts = np.array(lines[5].split(), dtype=int)
+    if len(counts) != len(species):
+        raise ValueError('The numbers of species and of atom counts differ')
+    numbers = np.repeat(symbols_to_numbers(species), counts)
+    return cell, numbers, scale
+
+
+def _read_poscar(handle):
+    """Read a POSCAR from a file object (see :py:func:`read_poscar`)."""
+    header = _read_vasp_header(handle)
+    if header is None:
+        raise ValueError('Empty POSCAR file')
+    cell, numbers, scale = header
+
+    mode = handle.readline().strip()
+    if mode.lower().startswith('s'):
+        # Selective dynamics
+        mode = handle.readline().strip()
+    positions = _parse_floats(_read_lines(handle, len(numbers)))
+    if mode.lower().startswith(('c', 'k')):
+        # Cartesian coordinates, scaled as the cell
+        positions = np.linalg.solve(cell.T, (positions * scale).T).T
+    return cell, positions, numbers
+
+
+def read_poscar(source):
+    """
+    Read a VASP POSCAR (or CONTCAR) file.
+
+    Both direct and Cartesian coordinates, the selective dynamics line and
+    all forms of the scaling factor (a scale, a volume, or three scales)
+    are supported. The species line (VASP 5 format) is required.
+
+    :param source: a path or a (text) file object.
+    :return: the structure ``(cell, positions, numbers)``.
+    """
+    with _open(source) as handle:
+        return _read_poscar(handle)
+
+
+def iter_xdatcar(source):
+    """
+    Iterate over the frames of a VASP XDATCAR file (with fixed or variable
+    cell), reading them lazily.
+
+    :param source: a path or a (text) file object.
+    :return: an iterator over the structures ``(cell, positions, numbers)``
+        of each frame. The same ``cell`` and ``numbers`` arrays are shared
+        among frames with the same header.
+    """
+    with _open(source) as handle:
+        header = _read_vasp_header(handle)
+        if header is None:
+            return
+        cell, numbers, _ = header
+        while True:
+            line = handle.readline()
+            if not line:
+                return
+            if not line.strip():
+                continue
+            if not line.lower().lstrip().startswith('direct configuration'):
+                # Variable cell: a new header precedes each configuration
+                header = _read_vasp_header(handle, first_line=line)
+                if header is None:
+                    return
+                cell, numbers, _ = header
+                continue
+            positions = _parse_floats(_read_lines(handle, len(numbers)))
+            yield cell, positions, numbers
+
+
+def _parse_extxyz_comment(comment):
+    """
+    Return the ``key=value`` pairs of the comment line of an extended XYZ
+    frame, as a dictionary with lowercase keys.
+    """
+    pairs = re.findall(r'(\w+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|(\S+))', comment)
+    return {
+        key.lower(): double_quoted or single_quoted or unquoted
+        for key, double_quoted, single_quoted, unquoted in pairs
+    }
+
+
+def iter_extxyz(source):
+    """
+    Iterate over the frames of an extended XYZ file, reading them lazily.
+
+    Each frame must have a ``Lattice`` entry in its comment line. The
+    species and the (Cartesian) positions are taken from the ``species``
+    and ``pos`` columns of the ``Properties`` entry (by default,
+    ``species:S:1:pos:R:3``).
+
+    :param source: a path or a (text) file object.
+    :return: an iterator over the structures ``(cell, positions, numbers)``.
+    """
+    with _open(source) as handle:
+        while True:
+            line = handle.readline()
+            if not line:
+                return
+            if not line.strip():
+                continue
+            num_atoms = int(line)
+            info = _parse_extxyz_comment(handle.readline())
+            if 'lattice' not in info:
+                raise ValueError('Extended XYZ frame without a Lattice entry')
+            cell = np.array(info['lattice'].split(), dtype=float).reshape(3, 3)
+
+            properties = info.get('properties', 'species:S:1:pos:R:3').split(':')
+            columns = {}
+            column = 0
+            for name, _, width in zip(
+                properties[::3], properties[1::3], properties[2::3]
+            ):
+                columns[name.lower()] = column
+                column += int(width)
+            if 'species' not in columns or 'pos' not in columns:
+                raise ValueError('The species and pos properties are required')
+
+            rows = [line.split() for line in _read_lines(handle, num_atoms)]
+            species = [row[columns['species']] for row in rows]
+            pos_column = columns['pos']
+            cartesian = np.array(
+                [row[pos_column : pos_column + 3] for row in rows], dtype=float
+            ).reshape(num_atoms, 3)
+            positions = np.linalg.solve(cell.T, cartesian.T).T
+            yield cell, positions, symbols_to_numbers(species)
+
+
+def _cif_value(token):
+    """Return a CIF token without quotes."""
+    if len(token) >= 2 and token[0] == token[-1] and token[0] in '\'"':
+        return token[1:-1]
+    return token
+
+
+def _cif_float(token):
+    """Return the float value of a CIF token (e.g. ``5.431(2)``)."""
+    return float(_CIF_UNCERTAINTY_RE.sub('', token))
+
+
+def _iter_cif_blocks(handle):
+    """
+    Iterate over the data blocks of a CIF file; yield, for each, a tuple
+    ``(items, loops)``: a dictionary of the (lowercase) tags with their
+    values, and a list of loops, each a dictionary of tags to lists of
+    values.
+    """
+    items = None
+    loops = []
+    loop_tags = None
+    loop_values = []
+    text_field = None
+
+    def close_loop():
+        """Store the loop being read, if any."""
+        if loop_tags:
+            num_tags = len(loop_tags)
+            loops.append(
+                {tag: loop_values[idx::num_tags] for idx, tag in enumerate(loop_tags)}
+            )
+
+    pending_tag = None
+    for line in handle:
+        if text_field is not None:
+            # Semicolon-delimited text field
+            if line.startswith(';'):
+                value = '\n'.join(text_field)
+                text_field = None
+                if pending_tag is not None:
+                    items[pending_tag] = value
+                    pending_tag = None
+                elif loop_tags is not None:
+                    loop_values.append(value)
+            else:
+                text_field.append(line.rstrip('\n'))
+            continue
+        if line.startswith(';'):
+            text_field = [line[1:].rstrip('\n')]
+            continue
+
+        for token in _CIF_TOKEN_RE.findall(line.partition(' #')[0]):
+            if token.startswith('#'):
+                break
+            lower = token.lower()
+            if lower.startswith('data_'):
+                close_loop()
+                if items is not None:
+                    yield items, loops
+                items, loops, loop_tags, loop_values = {}, [], None, []
+                pending_tag = None
+            elif items is None:
+                continue
+            elif lower == 'loop_':
+                close_loop()
+                loop_tags, loop_values = [], []
+                pending_tag = None
+            elif token.startswith('_'):
+                if loop_tags is not None and not loop_values:
+                    loop_tags.append(lower)
+                else:
+                    close_loop()
+                    loop_tags = None
+                    pending_tag = lower
+            elif pending_tag is not None:
+                items[pending_tag] = _cif_value(token)
+                pending_tag = None
+            elif loop_tags is not None:
+                loop_values.append(_cif_value(token))
+
+    close_loop()
+    if items is not None:
+        yield items, loops
+
+
+def _parse_symmetry_operation(operation):
+    """
+    Parse a symmetry operation as ``'-y,x-y,z+1/3'`` into the rotation
+    (:math:`3 \\times 3` array) and the translation (length-3 array) acting
+    on scaled coordinates.
+    """
+    rotation = np.zeros((3, 3))
+    translation = np.zeros(3)
+    components = operation.replace(' ', '').lower().split(',')
+    if len(components) != 3:
+        raise ValueError(f"Invalid symmetry operation '{operation}'")
+    for row, component in enumerate(components):
+        for sign, term in re.findall(r'([+-]?)([^+-]+)', component):
+            value = -1.0 if sign == '-' else 1.0
+            if term in 'xyz':
+                rotation[row, 'xyz'.index(term)] = value
+            else:
+                numerator, _, denominator = term.partition('/')
+                translation[row] += value * float(numerator) / float(denominator or 1.0)
+    return rotation, translation
+
+
+def _get_cif_structure(items, loops, symprec=1e-4):
+    """Return the structure of a CIF data block."""
+    try:
+        a, b, c, alpha, beta, gamma = (
+            _cif_float(items[f'_cell_{name}'])
+            for name in (
+                'length_a',
+                'length_b',
+                'length_c',
+                'angle_alpha',
+                'angle_beta',
+                'angle_gamma',
+            )
+        )
+    except KeyError as exc:
+        raise ValueError(f'Missing cell parameter {exc} in the CIF') from exc
+
+    cosalpha, cosbeta, cosgamma = np.cos(np.radians([alpha, beta, gamma]))
+    singamma = np.sin(np.radians(gamma))
+    c_x = cosbeta
+    c_y = (cosalpha - cosbeta * cosgamma) / singamma
+    cell = np.array(
+        [
+            [a, 0.0, 0.0],
+            [b * cosgamma, b * singamma, 0.0],
+            [c * c_x, c * c_y, c * np.sqrt(1.0 - c_x**2 - c_y**2)],
+        ]
+    )
+
+    for loop in loops:
+        if '_atom_site_fract_x' in loop:
+            sites = loop
+            break
+    else:
+        raise ValueError('No fractional coordinates (_atom_site_fract_*) in the CIF')
+    positions = np.array(
+        [
+            [_cif_float(value) for value in sites[f'_atom_site_fract_{axis}']]
+            for axis in 'xyz'
+        ]
+    ).T.reshape(-1, 3)
+    symbols = sites.get('_atom_site_type_symbol', sites.get('_atom_site_label'))
+    if symbols is None:
+        raise ValueError('No atom types (_atom_site_type_symbol) in the CIF')
+    numbers = symbols_to_numbers(symbols)
+    if '_atom_site_occupancy' in sites:
+        occupancies = np.array(
+            [_cif_float(value) for value in sites['_atom_site_occupancy']]
+        )
+        if np.any(occupancies < 1.0 - symprec):
+            raise ValueError('Partial occupancies are not supported')
+
+    operations = None
+    for loop in loops:
+        for tag in ('_space_group_symop_operation_xyz', '_symmetry_equiv_pos_as_xyz'):
+            if tag in loop:
+                operations = loop[tag]
+    if operations:
+        # Expand the asymmetric unit with all the operations, and remove
+        # the duplicates
+        rotations, translations = zip(*map(_parse_symmetry_operation, operations))
+        images = np.einsum('oij,nj->oni', np.array(rotations), positions)
+        images = (images + np.array(translations)[:, None, :]).reshape(-1, 3) % 1.0
+        image_numbers = np.tile(numbers, len(operations))
+        keep = []
+        for idx, position in enumerate(images):
+            if keep:
+                difference = images[keep] - position
+                difference -= np.rint(difference)
+                distances = np.linalg.norm(difference @ cell, axis=1)
+                if np.any(distances < symprec * max(a, b, c)):
+                    continue
+            keep.append(idx)
+        positions = images[keep]
+        numbers = image_numbers[keep]
+
+    return cell, positions, numbers
+
+
+def iter_cif(source):
+    """
+    Iterate over the structures of the data blocks of a (basic) CIF file.
+
+    Only the cell parameters (``_cell_length_*``, ``_cell_angle_*``), the
+    fractional coordinates (``_atom_site_fract_*``) and the atom types
+    (``_atom_site_type_symbol``, or else ``_atom_site_label``) are used; if
+    the symmetry operations are given (``_space_group_symop_operation_xyz``
+    or ``_symmetry_equiv_pos_as_xyz``), the sites are expanded with them.
+    Partial occupancies are not supported. The cell is in the standard
+    orientation (``a`` along :math:`x`, ``b`` in the :math:`xy` plane).
+
+    :param source: a path or a (text) file object.
+    :return: an iterator over the structures ``(cell, positions, numbers)``.
+    """
+    with _open(source) as handle:
+        for items, loops in _iter_cif_blocks(handle):
+            if any('_atom_site_fract_x' in loop for loop in loops):
+                yield _get_cif_structure(items, loops)
+
+
+def guess_format(path):
+    """
+    Return the format of a file from its name: ``xdatcar`` for names
+    containing ``XDATCAR``, ``poscar`` for names containing ``POSCAR`` or
+    ``CONTCAR`` or with extension ``.vasp``, ``extxyz`` for extensions
+    ``.xyz`` and ``.extxyz``, ``cif`` for the extension ``.cif``.
+
+    :raise ValueError: if the format cannot be guessed.
+    """
+    name = os.path.basename(os.fspath(path))
+    upper = name.upper()
+    extension = os.path.splitext(name)[1].lower()
+    if 'XDATCAR' in upper:
+        return 'xdatcar'
+    if 'POSCAR' in upper or 'CONTCAR' in upper or extension == '.vasp':
+        return 'poscar'
+    if extension in ('.xyz', '.extxyz'):
+        return 'extxyz'
+    if extension == '.cif':
+        return 'cif'
+    raise ValueError(f"Cannot guess the format of '{name}': pass 'format'")
+
+
+def iter_file(source, format=None):  # pylint: disable=redefined-builtin
+    """
+    Iterate over the structures of a file, in any of the :py:data:`FORMATS`.
+
+    :param source: a path or a (text) file object.
+    :param format: the format; if None, it is guessed from the file name
+        (see :py:func:`guess_format`).
+    :return: an iterator over the structures ``(cell, positions, numbers)``.
+    """
+    if format is None:
+        if hasattr(source, 'read'):
+            raise ValueError("'format' is required for file objects")
+        format = guess_format(source)
+    if format == 'poscar':
+        return iter((read_poscar(source),))
+    if format == 'xdatcar':
+        return iter_xdatcar(source)
+    if format == 'extxyz':
+        return iter_extxyz(source)
+    if format == 'cif':
+        return iter_cif(source)
+    raise ValueError(
+        f"value '{format}' for 'format' not recognized. Accepted values: "
+        f'{", ".join(FORMATS)}'
+    )
+
+
+def _expand_sources(sources):
+    """
+    Return the list of files of ``sources``: a path, a directory (all its
+    files, sorted), a glob pattern (sorted matches), or a list of them.
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    paths = []
+    for source in sources:
+        source = os.fspath(source)
+        if os.path.isdir(source):
+            paths.extend(
+                path
+                for path in sorted(glob.glob(os.path.join(source, '*')))
+                if os.path.isfile(path)
+            )
+        elif os.path.exists(source):
+            paths.append(source)
+        else:
+            matches = sorted(glob.glob(source))
+            if not matches:
+                raise ValueError(f"No file matches '{source}'")
+            paths.extend(matches)
+    return paths
+
+
+def iter_structures(sources, format=None, prefetch=DEFAULT_PREFETCH):  # pylint: disable=redefined-builtin
+    """
+    Iterate over all the structures of one or more files, reading them in
+    a background thread.
+
+    The files are parsed in a separate thread, that keeps up to
+    ``prefetch`` structures ready in a queue: the reading of the files
+    (that releases the GIL, while the parsing, as the path computation,
+    holds it) overlaps with the processing of the structures by the caller,
+    e.g.::
+
+        for structure in seekpath.io.iter_structures('relaxations/*/CONTCAR'):
+            res = seekpath.get_path(structure)
+
+    :param sources: a path, a directory (all the files it contains, in
+        sorted order), a glob pattern, or a list of them.
+    :param format: the format of all files; if None, it is guessed from the
+        name of each file (see :py:func:`guess_format`).
+    :param prefetch: the maximum number of structures read in advance. If
+        0, the files are read in the calling thread instead.
+    :return: an iterator over the structures ``(cell, positions, numbers)``.
+        Errors raised while reading are raised by the iterator.
+    """
+    paths = _expand_sources(sources)
+    if prefetch < 0:
+        raise ValueError('prefetch must be a non-negative integer')
+    if prefetch == 0:
+        for path in paths:
+            yield from iter_file(path, format=format)
+        return
+
+    import queue
+    import threading
+
+    items = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    end = object()
+
+    def put(item):
+        """Put an item in the queue; return False if the reading stopped."""
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read():
+        """Read all the structures, and put them in the queue."""
+        try:
+            for path in paths:
+                for structure in iter_file(path, format=format):
+                    if not put((structure, None)):
+                        return
+        except Exception as exc:  # noqa: BLE001
+            put((None, exc))
+            return
+        put((end, None))
+
+    thread = threading.Thread(target=read, name='seekpath-io-reader', daemon=True)
+    thread.start()
+    try:
+        while True:
+            structure, exc = items.get()
+            if exc is not None:
+                raise exc
+            if structure is end:
+                return
+            yield structure
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,192 @@
+"""
+Lightweight lattice object, caching the derived quantities (inverse,
+reciprocal lattice, metric tensors, cell parameters) of one or many cells.
+"""
+
+import numpy as np
+
+
+class Lattice:
+    r"""
+    A lattice (or a stack of lattices), with vectors as rows.
+
+    All derived quantities are computed on first access and then cached, so
+    that the same object can be passed around instead of recomputing e.g.
+    the reciprocal lattice or the inverse of the cell several times.
+
+    The cell can be a single :math:`3 \times 3` matrix or a stack of shape
+    ``(M, 3, 3)``; in the latter case, all derived quantities are stacked
+    as well (e.g., ``cell_params`` is a tuple of six length-``M`` arrays).
+
+    .. note:: the reciprocal lattice includes the :math:`2\pi` factor, i.e.
+        ``dot(cell, reciprocal.T)`` = :math:`2 \pi I`.
+    """
+
+    __slots__ = (
+        '_cell',
+        '_cell_params',
+        '_inverse',
+        '_metric',
+        '_reciprocal',
+        '_reciprocal_cell_params',
+        '_reciprocal_metric',
+        '_volume',
+    )
+
+    def __init__(self, cell):
+        r"""
+        :param cell: a :math:`3 \times 3` matrix (``cell[0]`` is the first
+            lattice vector), or a stack of shape ``(M, 3, 3)`` of them.
+        """
+        cell = np.ascontiguousarray(cell, dtype=float)
+        if cell.ndim not in (2, 3) or cell.shape[-2:] != (3, 3):
+            raise ValueError(
+                f'The cell must have shape (3, 3) or (M, 3, 3), got {cell.shape}'
+            )
+        self._cell = cell
+        self._inverse = None
+        self._reciprocal = None
+        self._metric = None
+        self._reciprocal_metric = None
+        self._cell_params = None
+        self._reciprocal_cell_params = None
+        self._volume = None
+
+    @classmethod
+    def from_reciprocal(cls, reciprocal):
+        r"""
+        Create the lattice from its reciprocal lattice (G vectors as rows,
+        including the :math:`2\pi` factor).
+        """
+        reciprocal = np.ascontiguousarray(reciprocal, dtype=float)
+        lattice = cls(2.0 * np.pi * np.swapaxes(np.linalg.inv(reciprocal), -1, -2))
+        lattice._reciprocal = reciprocal  # pylint: disable=protected-access
+        return lattice
+
+    def __len__(self):
+        if not self.is_stack:
+            raise TypeError('len() of a single Lattice')
+        return self._cell.shape[0]
+
+    def __getitem__(self, index):
+        """Return the lattice (or the stack of lattices) at ``index``."""
+        if not self.is_stack:
+            raise TypeError('A single Lattice cannot be indexed')
+        return Lattice(self._cell[index])
+
+    def __repr__(self):
+        if self.is_stack:
+            return f'<{self.__class__.__name__}: stack of {len(self)} cells>'
+        return f'<{self.__class__.__name__}: {self._cell.tolist()}>'
+
+    @property
+    def is_stack(self):
+        """True if this object represents a stack of ``(M, 3, 3)`` cells."""
+        return self._cell.ndim == 3
+
+    @property
+    def cell(self):
+        """The real-space vectors (as rows)."""
+        return self._cell
+
+    @property
+    def inverse(self):
+        """The inverse of the cell matrix."""
+        if self._inverse is None:
+            self._inverse = np.linalg.inv(self._cell)
+        return self._inverse
+
+    @property
+    def reciprocal(self):
+        r"""The reciprocal-space vectors (as rows, including :math:`2\pi`)."""
+        if self._reciprocal is None:
+            self._reciprocal = np.ascontiguousarray(
+                2.0 * np.pi * np.swapaxes(self.inverse, -1, -2)
+            )
+        return self._reciprocal
+
+    @property
+    def reciprocal_lattice(self):
+        """The reciprocal lattice, as a new :py:class:`Lattice` object."""
+        lattice = Lattice(self.reciprocal)
+        # The reciprocal of the reciprocal lattice is this cell
+        lattice._reciprocal = self._cell  # pylint: disable=protected-access
+        return lattice
+
+    @property
+    def metric(self):
+        r"""The metric tensor :math:`G = A A^T` (:math:`A` = cell)."""
+        if self._metric is None:
+            self._metric = np.matmul(self._cell, np.swapaxes(self._cell, -1, -2))
+        return self._metric
+
+    @property
+    def reciprocal_metric(self):
+        r"""The metric tensor of the reciprocal lattice (including :math:`2\pi`)."""
+        if self._reciprocal_metric is None:
+            self._reciprocal_metric = np.matmul(
+                self.reciprocal, np.swapaxes(self.reciprocal, -1, -2)
+            )
+        return self._reciprocal_metric
+
+    @property
+    def volume(self):
+        """The (signed) volume of the cell."""
+        if self._volume is None:
+            self._volume = np.linalg.det(self._cell)
+        return self._volume
+
+    @staticmethod
+    def _get_cell_params(cell):
+        """Return ``(a, b, c, cosalpha, cosbeta, cosgamma)`` of ``cell``."""
+        v1 = cell[..., 0, :]
+        v2 = cell[..., 1, :]
+        v3 = cell[..., 2, :]
+        a = np.sqrt(np.sum(v1**2, axis=-1))
+        b = np.sqrt(np.sum(v2**2, axis=-1))
+        c = np.sqrt(np.sum(v3**2, axis=-1))
+        cosalpha = np.sum(v2 * v3, axis=-1) / b / c
+        cosbeta = np.sum(v1 * v3, axis=-1) / a / c
+        cosgamma = np.sum(v1 * v2, axis=-1) / a / b
+        params = (a, b, c, cosalpha, cosbeta, cosgamma)
+        if cell.ndim == 2:
+            return tuple(float(param) for param in params)
+        return params
+
+    @property
+    def cell_params(self):
+        """
+        The tuple ``(a, b, c, cosalpha, cosbeta, cosgamma)`` (floats, or
+        arrays for a stack of cells).
+        """
+        if self._cell_params is None:
+            self._cell_params = self._get_cell_params(self._cell)
+        return self._cell_params
+
+    @property
+    def reciprocal_cell_params(self):
+        """The cell parameters of the reciprocal lattice (see ``cell_params``)."""
+        if self._reciprocal_cell_params is None:
+            self._reciprocal_cell_params = self._get_cell_params(self.reciprocal)
+        return self._reciprocal_cell_params
+
+    def to_cartesian(self, frac_coords):
+        """
+        Convert (real-space) scaled coordinates to Cartesian coordinates.
+
+        :param frac_coords: array of shape ``(..., 3)``; for a stack of
+            cells, shape ``(M, N, 3)``.
+        """
+        return np.matmul(frac_coords, self._cell)
+
+    def to_fractional(self, cart_coords):
+        """Convert (real-space) Cartesian coordinates to scaled coordinates."""
+        return np.matmul(cart_coords, self.inverse)
+
+    def kpoints_to_cartesian(self, kpoints_frac):
+        """Convert k-points from scaled (w.r.t. ``reciprocal``) to Cartesian."""
+        return np.matmul(kpoints_frac, self.reciprocal)
+
+    def kpoints_to_fractional(self, kpoints_cart):
+        """Convert k-points from Cartesian to scaled (w.r.t. ``reciprocal``)."""
+        return np.matmul(kpoints_cart, np.swapaxes(self._cell, -1, -2)) / (2.0 * np.pi)
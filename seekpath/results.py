@@ -0,0 +1,244 @@
+"""
+Memory-efficient container for the output of :py:func:`seekpath.get_path`
+and :py:func:`seekpath.get_explicit_k_path`.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from .getpaths import _get_points_and_path
+
+# Keys of the dictionary returned by ``get_path``, in the same order
+PATH_KEYS = (
+    'point_coords',
+    'path',
+    'has_inversion_symmetry',
+    'augmented_path',
+    'bravais_lattice',
+    'bravais_lattice_extended',
+    'conv_lattice',
+    'conv_positions',
+    'conv_types',
+    'primitive_lattice',
+    'primitive_positions',
+    'primitive_types',
+    'reciprocal_primitive_lattice',
+    'inverse_primitive_transformation_matrix',
+    'primitive_transformation_matrix',
+    'transformation_matrix',
+    'volume_original_wrt_conv',
+    'volume_original_wrt_prim',
+    'spacegroup_number',
+    'spacegroup_international',
+    'rotation_matrix',
+)
+
+# Additional keys returned by ``get_explicit_k_path``
+EXPLICIT_KEYS = (
+    'explicit_kpoints_rel',
+    'explicit_kpoints_linearcoord',
+    'explicit_kpoints_labels',
+    'explicit_kpoints_abs',
+    'explicit_segments',
+)
+
+
+def _as_array(value, dtype=float):
+    """Return ``value`` as a C-contiguous array of the given dtype."""
+    return np.ascontiguousarray(value, dtype=dtype)
+
+
+class PathResult(Mapping):
+    r"""
+    Read-only result of :py:func:`seekpath.get_path`, with a small memory
+    footprint.
+
+    It behaves as a (read-only) mapping with the same keys of the dictionary
+    returned by :py:func:`seekpath.get_path` (and, if ``reference_distance``
+    is set, also those of :py:func:`seekpath.get_explicit_k_path`), but:
+
+    - it uses ``__slots__`` instead of a per-instance dictionary;
+    - lattices, positions and matrices are stored as C-contiguous NumPy
+      arrays (also ``reciprocal_primitive_lattice``, that is a list in the
+      dictionary output);
+    - the special points are stored as a tuple of labels
+      (``point_labels``) and an :math:`n\times 3` array of scaled
+      coordinates (``point_coords_array``); the path is stored as an
+      :math:`m\times 2` integer array of indices into ``point_labels``
+      (``path_indices``). The ``point_coords`` dictionary and the ``path``
+      list of tuples are rebuilt from them on access;
+    - derived quantities (the reciprocal lattice, the inverse of the
+      primitive transformation matrix, the volume ratio with respect to the
+      primitive cell and the explicit k-path) are computed on first access,
+      and then cached.
+
+    Use :py:meth:`to_dict` to get a plain dictionary.
+    """
+
+    __slots__ = (
+        '_explicit',
+        '_inverse_primitive_transformation_matrix',
+        '_reciprocal_primitive_lattice',
+        'augmented_path',
+        'bravais_lattice',
+        'bravais_lattice_extended',
+        'conv_lattice',
+        'conv_positions',
+        'conv_types',
+        'diagnostics',
+        'has_inversion_symmetry',
+        'path_indices',
+        'point_coords_array',
+        'point_labels',
+        'primitive_lattice',
+        'primitive_positions',
+        'primitive_transformation_matrix',
+        'primitive_types',
+        'reference_distance',
+        'rotation_matrix',
+        'spacegroup_international',
+        'spacegroup_number',
+        'transformation_matrix',
+        'volume_original_wrt_conv',
+    )
+
+    def __init__(self, res, reference_distance=None):
+        """
+        Create the result from the dictionary returned by
+        :py:func:`seekpath.hpkot.get_path`.
+
+        :param res: the dictionary output of ``get_path`` (either in the
+            ``'dict'`` or in the ``'numpy'`` format). Derived keys
+            (e.g. ``reciprocal_primitive_lattice`` or ``explicit_*``) are
+            ignored, and recomputed when needed.
+        :param reference_distance: if not None, the result also exposes
+            the ``explicit_*`` keys, computed with this reference distance
+            (see :py:func:`seekpath.get_explicit_k_path`).
+
+        If ``res`` has a ``diagnostics`` key (see
+        :py:mod:`seekpath.diagnostics`), it is kept and exposed as well.
+        """
+        labels, coords, path_indices = _get_points_and_path(res)
+        self.point_labels = labels
+        self.point_coords_array = _as_array(coords)
+        self.path_indices = _as_array(path_indices, dtype=int)
+
+        self.has_inversion_symmetry = bool(res['has_inversion_symmetry'])
+        self.augmented_path = bool(res['augmented_path'])
+        self.bravais_lattice = res['bravais_lattice']
+        self.bravais_lattice_extended = res['bravais_lattice_extended']
+        self.conv_lattice = _as_array(res['conv_lattice'])
+        self.conv_positions = _as_array(res['conv_positions'])
+        self.conv_types = _as_array(res['conv_types'], dtype=int)
+        self.primitive_lattice = _as_array(res['primitive_lattice'])
+        self.primitive_positions = _as_array(res['primitive_positions'])
+        self.primitive_types = _as_array(res['primitive_types'], dtype=int)
+        self.primitive_transformation_matrix = _as_array(
+            res['primitive_transformation_matrix']
+        )
+        self.transformation_matrix = _as_array(res['transformation_matrix'])
+        self.volume_original_wrt_conv = float(res['volume_original_wrt_conv'])
+        self.spacegroup_number = int(res['spacegroup_number'])
+        self.spacegroup_international = res['spacegroup_international']
+        self.rotation_matrix = _as_array(res['rotation_matrix'])
+        self.reference_distance = reference_distance
+        self.diagnostics = res.get('diagnostics')
+
+        self._reciprocal_primitive_lattice = None
+        self._inverse_primitive_transformation_matrix = None
+        self._explicit = None
+
+    @property
+    def point_coords(self):
+        """Dictionary with label -> scaled coordinates (as a list)."""
+        return dict(zip(self.point_labels, self.point_coords_array.tolist()))
+
+    @property
+    def path(self):
+        """List of length-2 tuples with the labels of each path segment."""
+        labels = self.point_labels
+        return [(labels[start], labels[stop]) for start, stop in self.path_indices]
+
+    @property
+    def reciprocal_primitive_lattice(self):
+        """Reciprocal vectors (as rows) of the primitive cell (cached)."""
+        if self._reciprocal_primitive_lattice is None:
+            self._reciprocal_primitive_lattice = np.ascontiguousarray(
+                2.0 * np.pi * np.linalg.inv(self.primitive_lattice).T
+            )
+        return self._reciprocal_primitive_lattice
+
+    @property
+    def inverse_primitive_transformation_matrix(self):
+        """Inverse of the (integer) primitive transformation matrix (cached)."""
+        if self._inverse_primitive_transformation_matrix is None:
+            self._inverse_primitive_transformation_matrix = np.rint(
+                np.linalg.inv(self.primitive_transformation_matrix)
+            ).astype(int)
+        return self._inverse_primitive_transformation_matrix
+
+    @property
+    def volume_original_wrt_prim(self):
+        """Volume ratio of the input cell w.r.t. the primitive cell."""
+        return self.volume_original_wrt_conv * float(
+            np.linalg.det(self.inverse_primitive_transformation_matrix)
+        )
+
+    def _get_explicit(self):
+        """Return the (cached) dictionary with the explicit k-path."""
+        if self._explicit is None:
+            if self.reference_distance is None:
+                raise KeyError(
+                    'The explicit k-path is not available, since no '
+                    'reference_distance was set'
+                )
+            from .getpaths import get_explicit_from_implicit
+
+            self._explicit = get_explicit_from_implicit(
+                {
+                    'path': self.path,
+                    'point_coords': self.point_coords,
+                    'reciprocal_primitive_lattice': self.reciprocal_primitive_lattice,
+                },
+                reference_distance=self.reference_distance,
+            )
+        return self._explicit
+
+    def _get_keys(self):
+        """Return the available keys, in the same order as ``get_path``."""
+        keys = PATH_KEYS
+        if self.reference_distance is not None:
+            keys += EXPLICIT_KEYS
+        if self.diagnostics is not None:
+            keys += ('diagnostics',)
+        return keys
+
+    def __getitem__(self, key):
+        if key in PATH_KEYS:
+            return getattr(self, key)
+        if key in EXPLICIT_KEYS and self.reference_distance is not None:
+            return self._get_explicit()[key[len('explicit_') :]]
+        if key == 'diagnostics' and self.diagnostics is not None:
+            return self.diagnostics
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._get_keys())
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def __contains__(self, key):
+        return key in self._get_keys()
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__}: {self.bravais_lattice_extended}, '
+            f'spacegroup {self.spacegroup_number} '
+            f'({self.spacegroup_international})>'
+        )
+
+    def to_dict(self):
+        """Return a plain dictionary, with the same content as the mapping."""
+        return {key: self[key] for key in self._get_keys()}
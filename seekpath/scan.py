@@ -0,0 +1,165 @@
+"""
+Scan of the symmetry tolerance, to find a stable symmetry assignment for
+noisy (e.g. relaxed) structures.
+"""
+
+import numpy as np
+
+from .getpaths import _check_output
+
+# Default tolerances: three per decade, from 1e-5 to 1e-1
+DEFAULT_SYMPRECS = tuple(float(value) for value in np.logspace(-5, -1, 13))
+
+
+def _is_same_dataset(dataset, other):
+    """
+    Return True if two spglib datasets give the same standardized structure
+    (and so the same output of ``get_path``).
+    """
+    if dataset.number != other.number or len(dataset.std_types) != len(other.std_types):
+        return False
+    return (
+        np.array_equal(dataset.std_types, other.std_types)
+        and np.allclose(dataset.transformation_matrix, other.transformation_matrix)
+        and np.allclose(dataset.std_rotation_matrix, other.std_rotation_matrix)
+        and np.allclose(dataset.std_lattice, other.std_lattice)
+        and np.allclose(dataset.std_positions, other.std_positions)
+    )
+
+
+def scan_symprec(
+    structure,
+    symprecs=None,
+    with_time_reversal=True,
+    recipe='hpkot',
+    threshold=1.0e-7,
+    angle_tolerance=-1.0,
+    output='dict',
+):
+    """
+    Run the symmetry analysis of a structure for several values of
+    ``symprec``, and return the path information for each of them.
+
+    The spglib symmetry analysis is run for each tolerance, but the rest of
+    :py:func:`seekpath.get_path` (standardization, extended Bravais lattice,
+    special points and path) is run only once for each distinct result:
+    tolerances for which spglib finds the same standardized structure share
+    the same ``get_path`` output.
+
+    The parameters are the same as for :py:func:`seekpath.get_path`, apart
+    from:
+
+    :param symprecs: the tolerances to scan (they are sorted in increasing
+        order). If None, :py:data:`DEFAULT_SYMPRECS` (three values per
+        decade, from ``1e-5`` to ``1e-1``) are used.
+
+    :return: a dictionary with the following keys:
+
+        - ``scan``: a list with one dictionary per tolerance (in increasing
+          order), with keys ``symprec``, ``spacegroup_number``,
+          ``spacegroup_international``, ``bravais_lattice``,
+          ``bravais_lattice_extended``, ``path`` and ``result_index`` (the
+          index of the full output in ``results``). If spglib could not
+          detect the symmetry for a tolerance, all values apart from
+          ``symprec`` are None.
+        - ``results``: the list of the distinct ``get_path`` outputs.
+        - ``intervals``: the stability intervals, i.e. the ranges of
+          consecutive tolerances with the same spacegroup and extended
+          Bravais lattice. Each is a dictionary with keys ``symprec_min``,
+          ``symprec_max``, ``num_symprecs``, ``spacegroup_number``,
+          ``bravais_lattice_extended`` and ``result_index`` (of the first
+          tolerance of the interval). Tolerances where the symmetry could
+          not be detected are not part of any interval.
+    """
+    from . import hpkot
+    from .hpkot import SymmetryDetectionError
+
+    _check_output(output)
+    if recipe != 'hpkot':
+        raise ValueError(
+            "value for 'recipe' not recognized. The only value "
+            "currently accepted is 'hpkot'."
+        )
+    if symprecs is None:
+        symprecs = DEFAULT_SYMPRECS
+    symprecs = sorted(float(symprec) for symprec in symprecs)
+    if any(symprec <= 0 for symprec in symprecs):
+        raise ValueError('All symprec values must be positive')
+
+    datasets = []
+    results = []
+    scan = []
+    for symprec in symprecs:
+        try:
+            dataset = hpkot.get_symmetry_dataset(
+                structure, symprec=symprec, angle_tolerance=angle_tolerance
+            )
+        except SymmetryDetectionError:
+            scan.append(
+                {
+                    'symprec': symprec,
+                    'spacegroup_number': None,
+                    'spacegroup_international': None,
+                    'bravais_lattice': None,
+                    'bravais_lattice_extended': None,
+                    'path': None,
+                    'result_index': None,
+                }
+            )
+            continue
+
+        for result_index, other in enumerate(datasets):
+            if _is_same_dataset(dataset, other):
+                break
+        else:
+            res = hpkot.get_path_from_dataset(
+                dataset,
+                with_time_reversal=with_time_reversal,
+                threshold=threshold,
+                output='dict' if output == 'dict' else 'numpy',
+            )
+            if output == 'result':
+                from .results import PathResult
+
+                res = PathResult(res)
+            result_index = len(results)
+            datasets.append(dataset)
+            results.append(res)
+
+        res = results[result_index]
+        scan.append(
+            {
+                'symprec': symprec,
+                'spacegroup_number': res['spacegroup_number'],
+                'spacegroup_international': res['spacegroup_international'],
+                'bravais_lattice': res['bravais_lattice'],
+                'bravais_lattice_extended': res['bravais_lattice_extended'],
+                'path': res['path'],
+                'result_index': result_index,
+            }
+        )
+
+    intervals = []
+    previous_key = None
+    for entry in scan:
+        key = (entry['spacegroup_number'], entry['bravais_lattice_extended'])
+        if entry['result_index'] is None:
+            previous_key = None
+            continue
+        if key == previous_key:
+            intervals[-1]['symprec_max'] = entry['symprec']
+            intervals[-1]['num_symprecs'] += 1
+        else:
+            intervals.append(
+                {
+                    'symprec_min': entry['symprec'],
+                    'symprec_max': entry['symprec'],
+                    'num_symprecs': 1,
+                    'spacegroup_number': entry['spacegroup_number'],
+                    'bravais_lattice_extended': entry['bravais_lattice_extended'],
+                    'result_index': entry['result_index'],
+                }
+            )
+        previous_key = key
+
+    return {'scan': scan, 'results': results, 'intervals': intervals}
@@ -0,0 +1,119 @@
+"""
+Conversion of the results of seekpath to and from JSON-compatible objects.
+
+The results of :py:func:`seekpath.get_path` (and of the other functions of
+:py:mod:`seekpath.getpaths`) mix NumPy arrays, NumPy scalars, tuples and
+lists, so they cannot be passed directly to :py:func:`json.dumps`.
+:py:func:`to_jsonable` converts them, in a single pass over the result, to
+objects made only of dictionaries, lists, strings, numbers, booleans and
+None; :py:func:`from_jsonable` converts them back.
+
+Each array is encoded as a dictionary::
+
+    {'__ndarray__': data, 'dtype': '<f8', 'shape': [3, 3]}
+
+where ``data`` is either the base64-encoded (little-endian) buffer of the
+array (``compact=True``), or the flat list of its values
+(``compact=False``). Both encodings are lossless, the first one being
+faster to produce and to parse, and shorter for floating-point arrays.
+"""
+
+import base64
+from collections.abc import Mapping
+
+import numpy as np
+
+# Key of the dictionaries encoding arrays
+ARRAY_KEY = '__ndarray__'
+
+# Keys whose values are lists of tuples (or a tuple) in the results, and
+# become lists in JSON
+_TUPLE_LIST_KEYS = ('path', 'explicit_segments')
+_TUPLE_KEYS = ('point_labels',)
+
+
+def _encode(value, compact):
+    """Return ``value`` converted to JSON-compatible objects."""
+    if isinstance(value, (str, bool, int, float)) or value is None:
+        # NumPy float64 scalars are also instances of float
+        return value.item() if isinstance(value, np.generic) else value
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind not in 'biuf':
+            return [_encode(item, compact) for item in value.tolist()]
+        if compact:
+            array = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder('<'))
+            data = base64.b64encode(array.data).decode('ascii')
+        else:
+            array = value
+            data = value.ravel().tolist()
+        return {ARRAY_KEY: data, 'dtype': array.dtype.str, 'shape': list(value.shape)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Mapping):
+        return {key: _encode(item, compact) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, compact) for item in value]
+    raise TypeError(f'object of type {type(value).__name__} is not supported')
+
+
+def _decode(value):
+    """Return ``value``, with the encoded arrays converted back to arrays."""
+    if isinstance(value, dict):
+        if ARRAY_KEY in value:
+            data = value[ARRAY_KEY]
+            dtype = np.dtype(value['dtype'])
+            if isinstance(data, str):
+                # A bytearray, so that the array is writable without a copy
+                array = np.frombuffer(bytearray(base64.b64decode(data)), dtype=dtype)
+            else:
+                array = np.array(data, dtype=dtype)
+            return array.reshape(value['shape'])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def to_jsonable(seekpath_output, compact=True):
+    """
+    Convert a result of seekpath to an object that can be serialized with
+    :py:func:`json.dumps`.
+
+    :param seekpath_output: the output of :py:func:`seekpath.get_path` (or
+        of the other functions of :py:mod:`seekpath.getpaths`), in any
+        ``output`` format. A :py:class:`~seekpath.results.PathResult` is
+        converted as its :py:meth:`~seekpath.results.PathResult.to_dict`.
+    :param compact: if True (default), arrays are encoded as base64 strings
+        of their buffer; otherwise, as flat lists of their values.
+    :return: a dictionary with the same keys, where NumPy scalars are
+        converted to Python scalars, tuples to lists and arrays to
+        dictionaries (see :py:mod:`seekpath.serialization`).
+    """
+    if hasattr(seekpath_output, 'to_dict'):
+        seekpath_output = seekpath_output.to_dict()
+    return {key: _encode(value, compact) for key, value in seekpath_output.items()}
+
+
+def from_jsonable(data):
+    """
+    Convert the output of :py:func:`to_jsonable` (e.g. after a round trip
+    through :py:func:`json.dumps` and :py:func:`json.loads`) back to a
+    result of seekpath.
+
+    Arrays are restored with their dtype and shape, and the ``path``,
+    ``explicit_segments`` and ``point_labels`` keys as tuples, as in the
+    original result. NumPy scalars are restored as Python scalars, with the
+    same value.
+
+    :param data: the output of :py:func:`to_jsonable`.
+    :return: a dictionary, with the same content as the original result.
+    """
+    res = {}
+    for key, value in data.items():
+        value = _decode(value)
+        if key in _TUPLE_LIST_KEYS and isinstance(value, list):
+            value = [tuple(item) for item in value]
+        elif key in _TUPLE_KEYS and isinstance(value, list):
+            value = tuple(value)
+        res[key] = value
+    return res
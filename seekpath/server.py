@@ -0,0 +1,417 @@
+"""
+Local HTTP service computing k-paths, built on the standard library.
+
+The service exposes JSON endpoints (requests and responses are JSON
+objects):
+
+- ``POST /get_path`` and ``POST /get_explicit_k_path``: the body has a
+  ``structure`` key, with the ``cell``, ``positions`` and ``numbers`` of the
+  structure, and optionally the parameters of the corresponding function of
+  :py:mod:`seekpath.getpaths` (``with_time_reversal``, ``symprec``,
+  ``angle_tolerance``, ``threshold``, and ``reference_distance`` for the
+  explicit path). The response is the result converted with
+  :py:func:`seekpath.to_jsonable` (with ``compact=False`` if the request
+  has ``"compact": false``);
+- ``POST /brillouin_zone``: the body has either a ``cell`` (in real space)
+  or a ``reciprocal_lattice`` (the reciprocal vectors as rows, e.g. the
+  ``reciprocal_primitive_lattice`` of a result); the response has the
+  ``faces``, ``triangles`` and ``triangles_vertices`` of the
+  :py:class:`~seekpath.brillouinzone.brillouinzone.BZ` (requires scipy);
+- ``GET /health``: the status of the service and its metrics (see
+  :py:meth:`KPathService.get_metrics`).
+
+Invalid requests get a 400 response, with an ``error`` key.
+
+Requests are handled in threads, and the computations run in a pool of
+worker threads or processes (see :py:class:`KPathService`). Responses are
+kept in an in-memory LRU cache, and concurrent identical requests are
+coalesced: only the first one is computed, the others wait for its
+response. At startup, the path data of all extended Bravais lattices and
+the symmetry backend are loaded (see :py:func:`preload`), so that the
+first requests do not pay for them.
+
+Run the service with ``python -m seekpath.server`` (see ``--help``). It
+has no authentication: bind it to a local address only.
+"""
+
+import argparse
+import collections
+import functools
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Endpoint -> function of seekpath.getpaths, for the path endpoints
+PATH_ENDPOINTS = {
+    '/get_path': 'get_path',
+    '/get_explicit_k_path': 'get_explicit_k_path',
+}
+
+# Parameters accepted by each path endpoint
+_PATH_PARAMETERS = ('with_time_reversal', 'symprec', 'angle_tolerance', 'threshold')
+_EXPLICIT_PARAMETERS = _PATH_PARAMETERS + ('reference_distance',)
+
+# Default number of responses kept in the cache
+DEFAULT_CACHE_SIZE = 1024
+
+# Maximum size of the body of a request, in bytes
+MAX_REQUEST_SIZE = 16 * 1024 * 1024
+
+
+class RequestError(ValueError):
+    """An invalid request (answered with a 400 status)."""
+
+
+def preload():
+    """
+    Load what the first computation would otherwise load: the symmetry
+    backend (spglib), the path data of all the extended Bravais lattices
+    (by computing the path of the example structures of
+    ``hpkot/band_path_data``) and, if scipy is installed, the Brillouin
+    zone module.
+
+    :return: the number of example structures computed.
+    """
+    import glob
+    import os
+
+    from . import getpaths, io
+
+    pattern = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        'hpkot',
+        'band_path_data',
+        '*',
+        'POSCAR*',
+    )
+    paths = sorted(glob.glob(pattern))
+    for path in paths:
+        getpaths.get_path(io.read_poscar(path), diagnostics='collect')
+    try:
+        from .brillouinzone import brillouinzone  # noqa: F401
+    except ImportError:
+        pass
+    return len(paths)
+
+
+def _get_structure(request):
+    """Return the structure ``(cell, positions, numbers)`` of a request."""
+    structure = request.get('structure')
+    if not isinstance(structure, dict):
+        raise RequestError("the request must have a 'structure' object")
+    try:
+        return (structure['cell'], structure['positions'], structure['numbers'])
+    except KeyError as exc:
+        raise RequestError(f'the structure has no {exc} key') from exc
+
+
+def _compute(endpoint, request):
+    """
+    Compute the response to a request (possibly in a worker process).
+
+    :return: the body of the response (JSON, encoded in UTF-8).
+    """
+    import numpy as np
+
+    from .serialization import to_jsonable
+
+    if endpoint == '/brillouin_zone':
+        from .brillouinzone.brillouinzone import BZ
+
+        if ('cell' in request) == ('reciprocal_lattice' in request):
+            raise RequestError(
+                "the request must have either a 'cell' or a 'reciprocal_lattice'"
+            )
+        if 'cell' in request:
+            reciprocal_lattice = 2.0 * np.pi * np.linalg.inv(request['cell']).T
+        else:
+            reciprocal_lattice = np.asarray(request['reciprocal_lattice'], dtype=float)
+        bz = BZ(*reciprocal_lattice)
+        res = {
+            'faces': bz.faces,
+            'triangles': bz.triangles,
+            'triangles_vertices': bz.triangles_vertices,
+        }
+        return json.dumps(to_jsonable(res, compact=False)).encode('utf-8')
+
+    from . import getpaths
+
+    function_name = PATH_ENDPOINTS[endpoint]
+    parameters = (
+        _EXPLICIT_PARAMETERS
+        if function_name == 'get_explicit_k_path'
+        else _PATH_PARAMETERS
+    )
+    unknown = set(request) - set(parameters) - {'structure', 'compact'}
+    if unknown:
+        raise RequestError(f'unknown parameters: {", ".join(sorted(unknown))}')
+    kwargs = {key: request[key] for key in parameters if key in request}
+    res = getattr(getpaths, function_name)(
+        _get_structure(request), diagnostics='collect', **kwargs
+    )
+    return json.dumps(to_jsonable(res, compact=request.get('compact', True))).encode(
+        'utf-8'
+    )
+
+
+class KPathService:
+    """
+    Computation of the responses, with a cache and the coalescing of
+    concurrent identical requests (thread-safe).
+    """
+
+    def __init__(self, executor=None, max_workers=None, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        :param executor: the :py:class:`concurrent.futures.Executor` running
+            the computations. If None, a
+            :py:class:`concurrent.futures.ThreadPoolExecutor` with
+            ``max_workers`` threads is created (and shut down by
+            :py:meth:`close`). With a
+            :py:class:`concurrent.futures.ProcessPoolExecutor`, computations
+            run in parallel (use :py:func:`preload` as its ``initializer``).
+        :param max_workers: the number of threads of the default executor.
+        :param cache_size: the maximum number of responses in the cache (0
+            to disable the cache; concurrent requests are still coalesced).
+        """
+        if cache_size < 0:
+            raise ValueError('cache_size must be a non-negative integer')
+        self._own_executor = executor is None
+        if executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='seekpath-server'
+            )
+        self._executor = executor
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._in_flight = {}
+        # Reentrant, since the callback of a future that is already done
+        # runs immediately, in add_done_callback (with the lock held)
+        self._lock = threading.RLock()
+        self._start_time = time.monotonic()
+        self._counters = collections.Counter()
+
+    def _get_key(self, endpoint, request):
+        """Return the cache key of a request."""
+        canonical = json.dumps(
+            [endpoint, request], sort_keys=True, separators=(',', ':')
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).digest()
+
+    def _on_done(self, key, start, future):
+        """Store the response of a completed computation in the cache."""
+        with self._lock:
+            del self._in_flight[key]
+            self._counters['compute_time'] += time.monotonic() - start
+            if future.cancelled() or future.exception() is not None:
+                return
+            if self.cache_size:
+                self._cache[key] = future.result()
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    def get_response(self, endpoint, request):
+        """
+        Return the response to a request, from the cache, from a concurrent
+        identical request, or computing it.
+
+        :param endpoint: the endpoint, e.g. ``'/get_path'``.
+        :param request: the (JSON-decoded) body of the request.
+        :return: the body of the response (JSON, encoded in UTF-8).
+        :raise RequestError: for invalid requests (and
+            :py:exc:`ValueError` or
+            :py:exc:`~seekpath.hpkot.SymmetryDetectionError` raised by
+            seekpath for invalid structures).
+        """
+        if endpoint not in PATH_ENDPOINTS and endpoint != '/brillouin_zone':
+            raise RequestError(f"unknown endpoint '{endpoint}'")
+        if not isinstance(request, dict):
+            raise RequestError('the request must be a JSON object')
+        key = self._get_key(endpoint, request)
+        with self._lock:
+            self._counters['requests'] += 1
+            response = self._cache.get(key)
+            if response is not None:
+                self._cache.move_to_end(key)
+                self._counters['cache_hits'] += 1
+                return response
+            future = self._in_flight.get(key)
+            if future is None:
+                self._counters['computations'] += 1
+                future = self._executor.submit(_compute, endpoint, request)
+                self._in_flight[key] = future
+                future.add_done_callback(
+                    functools.partial(self._on_done, key, time.monotonic())
+                )
+            else:
+                self._counters['coalesced'] += 1
+        try:
+            return future.result()
+        except Exception:
+            with self._lock:
+                self._counters['errors'] += 1
+            raise
+
+    def get_metrics(self):
+        """
+        Return the metrics of the service: the number of ``requests``, of
+        ``cache_hits``, of ``coalesced`` requests (that waited for an
+        identical one), of ``computations`` and of ``errors``, the total
+        ``compute_time`` (in seconds), the number of requests ``in_flight``,
+        the ``cache_size`` and the ``uptime`` (in seconds).
+        """
+        with self._lock:
+            metrics = {
+                name: self._counters[name]
+                for name in (
+                    'requests',
+                    'cache_hits',
+                    'coalesced',
+                    'computations',
+                    'errors',
+                    'compute_time',
+                )
+            }
+            metrics['in_flight'] = len(self._in_flight)
+            metrics['cache_size'] = len(self._cache)
+        metrics['uptime'] = time.monotonic() - self._start_time
+        return metrics
+
+    def close(self):
+        """Shut down the executor, if it was created by the service."""
+        if self._own_executor:
+            self._executor.shutdown()
+
+
+class KPathRequestHandler(BaseHTTPRequestHandler):
+    """Handler of the requests to the service (``self.server.service``)."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'seekpath'
+
+    def _send_json(self, status, body):
+        """Send a response with a JSON body (bytes, or an object to encode)."""
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer ``GET /health``."""
+        if self.path != '/health':
+            self._send_json(404, {'error': f"unknown endpoint '{self.path}'"})
+            return
+        self._send_json(
+            200, {'status': 'ok', 'metrics': self.server.service.get_metrics()}
+        )
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Answer the computation endpoints."""
+        from .hpkot import SymmetryDetectionError
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be delimited: the connection cannot be reused
+            self.close_connection = True
+            self._send_json(400, {'error': 'invalid Content-Length'})
+            return
+        if length > MAX_REQUEST_SIZE:
+            self.close_connection = True
+            self._send_json(413, {'error': 'request too large'})
+            return
+        data = self.rfile.read(length)
+        if self.path not in PATH_ENDPOINTS and self.path != '/brillouin_zone':
+            self._send_json(404, {'error': f"unknown endpoint '{self.path}'"})
+            return
+        try:
+            request = json.loads(data)
+            response = self.server.service.get_response(self.path, request)
+        except (ValueError, TypeError, KeyError, SymmetryDetectionError) as exc:
+            # json.JSONDecodeError and RequestError are ValueErrors
+            self._send_json(400, {'error': f'{type(exc).__name__}: {exc}'})
+        except ImportError as exc:
+            self._send_json(501, {'error': f'{type(exc).__name__}: {exc}'})
+        except Exception as exc:  # noqa: BLE001
+            self._send_json(500, {'error': f'{type(exc).__name__}: {exc}'})
+        else:
+            self._send_json(200, response)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Log the requests only if the server is ``verbose``."""
+        if getattr(self.server, 'verbose', False):
+            super().log_message(format, *args)
+
+
+def make_server(host='127.0.0.1', port=8000, service=None, verbose=False):
+    """
+    Create the HTTP server (a :py:class:`http.server.ThreadingHTTPServer`,
+    with the service as its ``service`` attribute).
+
+    :param host: the address to bind.
+    :param port: the port (0 for any free port, see ``server_address``).
+    :param service: the :py:class:`KPathService`; if None, a new one with
+        the default parameters.
+    :param verbose: if True, log each request on standard error.
+    """
+    server = ThreadingHTTPServer((host, port), KPathRequestHandler)
+    server.daemon_threads = True
+    server.service = KPathService() if service is None else service
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    """Run the service until interrupted (``python -m seekpath.server``)."""
+    parser = argparse.ArgumentParser(
+        prog='python -m seekpath.server', description='Run the k-path service.'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument(
+        '--workers', type=int, default=None, help='number of worker threads/processes'
+    )
+    parser.add_argument(
+        '--processes',
+        action='store_true',
+        help='compute in worker processes rather than threads',
+    )
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE)
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    executor = None
+    if args.processes:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=args.workers, initializer=preload)
+        # Start (and preload) a worker before the first request
+        executor.submit(int).result()
+    else:
+        preload()
+    service = KPathService(
+        executor=executor, max_workers=args.workers, cache_size=args.cache_size
+    )
+    server = make_server(args.host, args.port, service=service, verbose=args.verbose)
+    print(f'seekpath: serving on http://{args.host}:{server.server_address[1]}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
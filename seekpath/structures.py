@@ -0,0 +1,161 @@
+"""
+Struct-of-arrays container for many structures, to process large
+databases without building one Python tuple per structure.
+"""
+
+import os
+from collections.abc import Sequence
+
+import numpy as np
+
+# Names of the arrays of a StructureBatch, and of the .npy files storing them
+ARRAY_NAMES = ('cells', 'positions', 'numbers', 'offsets')
+
+
+class StructureBatch(Sequence):
+    r"""
+    Many structures stored as contiguous arrays:
+
+    - ``cells``: the :math:`M \times 3 \times 3` array of the cells;
+    - ``positions``: the :math:`(\sum_i N_i) \times 3` array of the scaled
+      positions of the atoms of all structures, concatenated;
+    - ``numbers``: the length-:math:`\sum_i N_i` array of the atomic
+      numbers (or types), concatenated;
+    - ``offsets``: the length-:math:`M + 1` integer array such that the
+      atoms of the i-th structure are ``positions[offsets[i]:offsets[i + 1]]``
+      (``offsets[0] == 0``).
+
+    The arrays are not copied (they can be e.g. memory-mapped, see
+    :py:meth:`load`), and indexing returns the structure
+    ``(cell, positions, numbers)`` as views of them, that can be passed
+    directly to :py:func:`seekpath.get_path`. A batch is also accepted
+    directly by :py:func:`seekpath.get_path_batch` and
+    :py:func:`seekpath.get_path_batch_shared_memory`.
+    """
+
+    __slots__ = ARRAY_NAMES
+
+    def __init__(self, cells, positions, numbers, offsets):
+        """
+        :param cells: the cells, with shape ``(M, 3, 3)``.
+        :param positions: the concatenated scaled positions, with shape
+            ``(sum(N_i), 3)``.
+        :param numbers: the concatenated atomic numbers, with shape
+            ``(sum(N_i),)``.
+        :param offsets: the offsets of the structures in ``positions`` and
+            ``numbers``, with shape ``(M + 1,)``.
+        """
+        cells = np.asanyarray(cells)
+        positions = np.asanyarray(positions)
+        numbers = np.asanyarray(numbers)
+        offsets = np.asanyarray(offsets)
+
+        if cells.ndim != 3 or cells.shape[1:] != (3, 3):
+            raise ValueError(f'cells must have shape (M, 3, 3), got {cells.shape}')
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError(
+                f'positions must have shape (num_atoms, 3), got {positions.shape}'
+            )
+        if numbers.shape != positions.shape[:1]:
+            raise ValueError(
+                f'numbers must have shape ({len(positions)},), got {numbers.shape}'
+            )
+        if offsets.shape != (len(cells) + 1,) or offsets.dtype.kind not in 'iu':
+            raise ValueError(
+                f'offsets must be an integer array with shape ({len(cells) + 1},)'
+            )
+        if (
+            offsets[0] != 0
+            or offsets[-1] != len(positions)
+            or np.any(np.diff(offsets) < 0)
+        ):
+            raise ValueError(
+                'offsets must be non-decreasing, from 0 to the number of atoms'
+            )
+
+        self.cells = cells
+        self.positions = positions
+        self.numbers = numbers
+        self.offsets = offsets
+
+    @classmethod
+    def from_structures(cls, structures):
+        """
+        Create a batch from an iterable of structures
+        ``(cell, positions, numbers)`` (the arrays are copied).
+        """
+        structures = list(structures)
+        cells = np.empty((len(structures), 3, 3), dtype=np.float64)
+        num_atoms = np.empty(len(structures), dtype=np.int64)
+        for idx, (cell, _, numbers) in enumerate(structures):
+            cells[idx] = cell
+            num_atoms[idx] = len(numbers)
+        offsets = np.zeros(len(structures) + 1, dtype=np.int64)
+        np.cumsum(num_atoms, out=offsets[1:])
+
+        positions = np.empty((offsets[-1], 3), dtype=np.float64)
+        numbers = np.empty(offsets[-1], dtype=np.intc)
+        for idx, (_, structure_positions, structure_numbers) in enumerate(structures):
+            positions[offsets[idx] : offsets[idx + 1]] = np.reshape(
+                structure_positions, (-1, 3)
+            )
+            numbers[offsets[idx] : offsets[idx + 1]] = structure_numbers
+        return cls(cells, positions, numbers, offsets)
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """
+        Load a batch from the ``cells.npy``, ``positions.npy``,
+        ``numbers.npy`` and ``offsets.npy`` files in ``directory`` (e.g.
+        written by :py:meth:`save`).
+
+        :param directory: the directory with the ``.npy`` files.
+        :param mmap_mode: the ``mmap_mode`` of :py:func:`numpy.load`. By
+            default (``'r'``), the files are memory-mapped read-only, so that
+            only the pages of the structures that are accessed are read from
+            disk; None to read the arrays in memory.
+        """
+        return cls(
+            *(
+                np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode)
+                for name in ARRAY_NAMES
+            )
+        )
+
+    def save(self, directory):
+        """
+        Save the batch as ``.npy`` files in ``directory`` (created if needed),
+        that can be loaded (and memory-mapped) with :py:meth:`load`.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(directory, f'{name}.npy'), getattr(self, name))
+
+    @property
+    def num_atoms(self):
+        """The number of atoms of each structure (a length-``M`` array)."""
+        return np.diff(self.offsets)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, index):
+        """Return the structure ``(cell, positions, numbers)`` at ``index``."""
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError('StructureBatch indices must be integers')
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('StructureBatch index out of range')
+        begin, end = self.offsets[index], self.offsets[index + 1]
+        return (
+            self.cells[index],
+            self.positions[begin:end],
+            self.numbers[begin:end],
+        )
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__}: {len(self)} structures, '
+            f'{len(self.positions)} atoms>'
+        )
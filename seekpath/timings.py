@@ -0,0 +1,156 @@
+"""
+Timings of the stages of the computation of the paths (symmetry analysis,
+primitive cell, special points, ...), to find where the time goes for
+slow structures.
+
+The timings are collected, per thread, with :py:func:`collect_timings`::
+
+    with collect_timings() as timings:
+        for structure in structures:
+            seekpath.get_explicit_k_path(structure)
+    print(format_timings(timings))
+
+When no collection is active, the instrumentation only costs a lookup of a
+thread-local attribute per stage. The stages are (a stage includes the
+time of the stages run within it):
+
+- ``getpaths.<function>``: the public functions of
+  :py:mod:`seekpath.getpaths` (e.g. ``getpaths.get_explicit_k_path``);
+- ``hpkot.get_path``: the whole :py:func:`seekpath.hpkot.get_path`;
+- ``hpkot.spglib``: the symmetry analysis by spglib;
+- ``hpkot.niggli``: the Niggli reduction and the changes of basis of the
+  ``aP`` lattices;
+- ``hpkot.get_primitive``: the primitive cell;
+- ``hpkot.points_and_path``: the special points and the path, including
+  the lookup in the memo of :py:func:`seekpath.hpkot.tools.get_points_and_path`;
+- ``hpkot.get_path_data``: reading the path data files;
+- ``hpkot.kparams``: the evaluation of the k-parameters and of the
+  coordinates of the points;
+- ``hpkot.augment_path``: the addition of the :math:`-k` points and path;
+- ``BZ``: the construction of a :py:class:`~seekpath.brillouinzone.brillouinzone.BZ`.
+"""
+
+import contextlib
+import functools
+import threading
+import time
+
+_local = threading.local()
+
+# Returned by stage() when no collection is active
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class _Stage:
+    """Context manager adding its duration to a collector."""
+
+    __slots__ = ('collector', 'name', 'start')
+
+    def __init__(self, collector, name):
+        self.collector = collector
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start
+        timing = self.collector.get(self.name)
+        if timing is None:
+            self.collector[self.name] = {'calls': 1, 'total': duration}
+        else:
+            timing['calls'] += 1
+            timing['total'] += duration
+
+
+def stage(name):
+    """
+    Return a context manager that times a stage, if
+    :py:func:`collect_timings` is active in the current thread (otherwise, a
+    context manager that does nothing).
+
+    :param name: the name of the stage (e.g. ``'hpkot.spglib'``).
+    """
+    collector = getattr(_local, 'collector', None)
+    if collector is None:
+        return _NULL_CONTEXT
+    return _Stage(collector, name)
+
+
+def timed(name):
+    """
+    Decorator timing each call of a function as the stage ``name`` (see
+    :py:func:`stage`).
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            collector = getattr(_local, 'collector', None)
+            if collector is None:
+                return function(*args, **kwargs)
+            with _Stage(collector, name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def collect_timings():
+    """
+    Context manager that collects the timings of the stages run in the
+    current thread.
+
+    It yields the dictionary to which the timings are added: the keys are
+    the names of the stages, and the values are dictionaries with keys
+    ``calls`` (the number of times the stage was run) and ``total`` (the
+    total time, in seconds). Other threads are not affected. When nested,
+    the timings collected by the inner context manager are also added to
+    those of the outer one at its exit.
+    """
+    previous = getattr(_local, 'collector', None)
+    collector = {}
+    _local.collector = collector
+    try:
+        yield collector
+    finally:
+        _local.collector = previous
+        if previous is not None:
+            merge_timings(previous, collector)
+
+
+def merge_timings(timings, other):
+    """
+    Add the timings ``other`` to ``timings`` (e.g. to combine the timings
+    collected in several threads or processes).
+
+    :param timings: the dictionary of timings to update, as yielded by
+        :py:func:`collect_timings`.
+    :param other: the dictionary of timings to add.
+    """
+    for name, timing in other.items():
+        if name in timings:
+            timings[name]['calls'] += timing['calls']
+            timings[name]['total'] += timing['total']
+        else:
+            timings[name] = dict(timing)
+
+
+def format_timings(timings):
+    """
+    Return a table of timings (as yielded by :py:func:`collect_timings`),
+    sorted by decreasing total time.
+    """
+    lines = [f'{"stage":<40} {"calls":>8} {"total (s)":>12} {"per call (ms)":>14}']
+    for name, timing in sorted(
+        timings.items(), key=lambda item: item[1]['total'], reverse=True
+    ):
+        lines.append(
+            f'{name:<40} {timing["calls"]:>8d} {timing["total"]:>12.6f} '
+            f'{1000 * timing["total"] / timing["calls"]:>14.4f}'
+        )
+    return '\n'.join(lines)
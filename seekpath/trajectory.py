@@ -0,0 +1,666 @@
+"""
+Incremental k-paths along trajectories (e.g. relaxations or molecular
+dynamics), where the symmetry of consecutive frames rarely changes.
+"""
+
+import itertools
+from types import SimpleNamespace
+
+import numpy as np
+
+from .getpaths import _check_output
+from .hpkot.spg_mapping import get_P_matrix, get_spgroup_data
+
+# Offset (in units of bins) used to bin the scaled coordinates
+_BIN_OFFSET = (3.0 - 5.0**0.5) / 2.0
+
+
+class _SymmetryReference:
+    """
+    The symmetry of the last frame analysed with spglib, used to standardize
+    the following frames without a new symmetry search.
+
+    The standardization mimics the one of spglib: the symmetry operations of
+    the reference frame are applied to the new frame, the positions are
+    symmetrized by averaging over the operations, and the metric of the
+    conventional cell is symmetrized with the rotations of the point group.
+    The standardized (idealized) lattice is then the lower-triangular
+    Cholesky factor of the symmetrized metric, as for spglib, and the
+    rotation is the closest one (polar decomposition) to the idealization.
+    """
+
+    __slots__ = (
+        'cell',
+        'centering_permutations',
+        'centering_translations',
+        'conv_rotations',
+        'free_values',
+        'international',
+        'inv_centering_permutations',
+        'inv_permutations',
+        'inv_transformation_matrix',
+        'number',
+        'numbers',
+        'origin_shift',
+        'pairs',
+        'permutations',
+        'positions',
+        'primitive_vectors',
+        'reduced_vectors',
+        'rotations',
+        'setting_signature',
+        'setting_values',
+        'short_vectors',
+        'std_atoms',
+        'std_shifts',
+        'symprec',
+        'transformation_matrix',
+        'translations',
+    )
+
+    def __init__(self, structure, dataset, symprec, previous=None):
+        """
+        :param structure: the reference frame ``(cell, positions, numbers)``.
+        :param dataset: its spglib dataset.
+        :param symprec: the tolerance (a length) for the symmetry checks.
+        :param previous: the previous reference, if any: its atom
+            permutations are reused if they are still valid (e.g. when only
+            the choice of the conventional cell has changed).
+        """
+        cell = np.array(structure[0], dtype=float)
+        positions = np.array(structure[1], dtype=float)
+        numbers = np.array(structure[2])
+
+        self.cell = cell
+        self.positions = positions
+        self.numbers = numbers
+        # For supercells, spglib returns each rotation combined with all the
+        # pure (centering) translations: it is enough to check one operation
+        # per rotation, and the pure translations separately. The operations
+        # are sorted by translation and rotation (the order of spglib is
+        # arbitrary), so that the same ones are chosen for similar frames
+        rotations = np.array(dataset.rotations, dtype=int)
+        translations = np.array(dataset.translations, dtype=float)
+        keys = np.concatenate(
+            [
+                np.rint(translations * 1.0e6).astype(np.int64) % 1000000,
+                rotations.reshape(len(rotations), 9),
+            ],
+            axis=1,
+        )
+        order = np.lexsort(keys.T[::-1])
+        rotations = rotations[order]
+        translations = translations[order]
+        # (viewed as single elements: np.unique along an axis is slow for the
+        # many operations of large supercells)
+        _, first_indices = np.unique(
+            np.ascontiguousarray(rotations.reshape(len(rotations), 9))
+            .view(np.dtype((np.void, 9 * rotations.itemsize)))
+            .ravel(),
+            return_index=True,
+        )
+        first_indices = np.sort(first_indices)
+        self.rotations = rotations[first_indices]
+        self.translations = translations[first_indices]
+        is_identity = np.all(rotations == np.eye(3, dtype=int), axis=(1, 2))
+        self.centering_translations = translations[is_identity]
+        self.transformation_matrix = np.array(dataset.transformation_matrix)
+        self.inv_transformation_matrix = np.linalg.inv(self.transformation_matrix)
+        self.origin_shift = np.array(dataset.origin_shift, dtype=float)
+        self.number = dataset.number
+        self.international = dataset.international
+        self.symprec = symprec
+
+        # Rotations in the basis of the conventional cell: x_c = T x + o
+        conv_rotations = np.rint(
+            np.matmul(
+                np.matmul(self.transformation_matrix, self.rotations),
+                self.inv_transformation_matrix,
+            )
+        ).astype(int)
+        self.conv_rotations = np.unique(conv_rotations, axis=0)
+
+        # The conventional cell chosen by spglib among the equivalent ones
+        # (e.g. the axes a and c of monoclinic cells, or the order of the
+        # axes of orthorhombic cells) depends on the cell parameters: through
+        # the Delaunay reduction of the primitive cell, whose result is
+        # stored for the reference frame, and through the comparisons of the
+        # lengths and scalar products of short lattice vectors in the choice
+        # of the axes. The comparisons between the vectors of the Delaunay
+        # sets of the reduced primitive cell and of the conventional cell are
+        # also stored (apart from those that cannot change the choice)
+        conv_cell = np.dot(self.inv_transformation_matrix.T, cell)
+        properties = get_spgroup_data()[self.number]
+        # Primitive lattice vectors, in the basis of the conventional cell
+        self.primitive_vectors = get_P_matrix(f'{properties[0]}{properties[1]}')[0].T
+        self.reduced_vectors = self._get_reduced_vectors(cell, conv_cell)
+        self.short_vectors = self._get_short_vectors()
+        self.pairs = np.triu_indices(len(self.short_vectors), 1)
+        self.free_values = self._get_free_values()
+        self.setting_values, self.setting_signature = self._get_setting_signature(
+            self._get_conv_metric(cell)[1]
+        )
+
+        # Atom permutation of each operation: atom i goes onto atom
+        # permutations[m, i]. It is computed once, for the reference frame
+        identities = np.broadcast_to(
+            np.eye(3, dtype=int), (len(self.centering_translations), 3, 3)
+        )
+        if (
+            previous is not None
+            and previous.permutations is not None
+            and np.array_equal(self.rotations, previous.rotations)
+            and len(self.centering_translations) == len(previous.centering_translations)
+            and self._are_valid_permutations(
+                previous.permutations, previous.centering_permutations
+            )
+        ):
+            self.permutations = previous.permutations
+            self.centering_permutations = previous.centering_permutations
+            self.inv_permutations = previous.inv_permutations
+            self.inv_centering_permutations = previous.inv_centering_permutations
+        else:
+            self.permutations = self._get_permutations(
+                self.rotations, self.translations
+            )
+            self.centering_permutations = self._get_permutations(
+                identities, self.centering_translations
+            )
+            if self.permutations is None or self.centering_permutations is None:
+                # Should not happen: the reference can then never be reused
+                self.permutations = None
+            else:
+                self.inv_permutations = np.argsort(self.permutations, axis=1)
+                self.inv_centering_permutations = np.argsort(
+                    self.centering_permutations, axis=1
+                )
+
+        # Each atom of the standardized cell is x_s = T (x_i + n) + o, for an
+        # atom i of the input cell and an integer shift n
+        std_positions = np.array(dataset.std_positions, dtype=float)
+        std_types = np.array(dataset.std_types)
+        in_input_basis = np.dot(
+            std_positions - self.origin_shift, self.inv_transformation_matrix.T
+        )
+        distances = self._get_distances(
+            in_input_basis[:, np.newaxis, :] - positions[np.newaxis, :, :], cell
+        )
+        distances[std_types[:, np.newaxis] != numbers[np.newaxis, :]] = np.inf
+        self.std_atoms = np.argmin(distances, axis=1)
+        self.std_shifts = np.rint(in_input_basis - positions[self.std_atoms])
+
+    def _get_permutations(self, rotations, translations):
+        """
+        Return the atom permutations of the operations for the reference
+        frame (or None, if an operation does not map atoms onto atoms).
+
+        Images are first matched to atoms by looking up the bin (of size
+        about ``4 * symprec``) they fall into and, if they are close to the
+        boundary of a bin, the neighbouring bins; only images that are not
+        matched this way are compared with all the atoms.
+        """
+        positions = self.positions
+        num_atoms = len(positions)
+        images = np.matmul(positions, np.swapaxes(rotations, 1, 2))
+        images += translations[:, np.newaxis, :]
+
+        n_bins = np.clip(
+            np.linalg.norm(self.cell, axis=1) / (4.0 * self.symprec), 1, 2**20
+        ).astype(np.int64)
+
+        def get_keys(scaled):
+            # The (irrational) offset avoids that the bin boundaries fall on
+            # special positions (e.g. 0, 1/2 or 1/3)
+            bins = np.floor((scaled - np.floor(scaled)) * n_bins + _BIN_OFFSET).astype(
+                np.int64
+            )
+            bins %= n_bins
+            return (bins[..., 0] * n_bins[1] + bins[..., 1]) * n_bins[2] + bins[..., 2]
+
+        atom_keys = get_keys(positions)
+        order = np.argsort(atom_keys)
+        sorted_keys = atom_keys[order]
+
+        def look_up(scaled, shift, sources):
+            # The atom in the bin of each image shifted by ``shift`` bins (or
+            # any atom, if there is none), and whether it matches the image
+            keys = get_keys(scaled + shift / n_bins)
+            indices = np.minimum(np.searchsorted(sorted_keys, keys), num_atoms - 1)
+            targets = order[indices]
+            distances = self._get_distances(scaled - positions[targets], self.cell)
+            return targets, (
+                (sorted_keys[indices] == keys)
+                & (distances <= self.symprec)
+                & (self.numbers[targets] == self.numbers[sources])
+            )
+
+        if np.any(sorted_keys[1:] == sorted_keys[:-1]):
+            # Atoms closer than the bin size: compare all images with all atoms
+            permutations = np.zeros(images.shape[:2], dtype=int)
+            op_indices, atom_indices = np.nonzero(np.ones(images.shape[:2], dtype=bool))
+        else:
+            permutations, matched = look_up(images, np.zeros(3), np.arange(num_atoms))
+            op_indices, atom_indices = np.nonzero(~matched)
+            # Images close to the boundary of a bin
+            for shift in itertools.product([-1, 0, 1], repeat=3):
+                if not any(shift) or not len(op_indices):
+                    continue
+                targets, matched = look_up(
+                    images[op_indices, atom_indices], np.array(shift), atom_indices
+                )
+                permutations[op_indices[matched], atom_indices[matched]] = targets[
+                    matched
+                ]
+                op_indices = op_indices[~matched]
+                atom_indices = atom_indices[~matched]
+
+        for start in range(0, len(op_indices), 1024):
+            ops = op_indices[start : start + 1024]
+            atoms = atom_indices[start : start + 1024]
+            distances = self._get_distances(
+                images[ops, atoms][:, np.newaxis, :] - positions[np.newaxis, :, :],
+                self.cell,
+            )
+            distances[self.numbers[atoms][:, np.newaxis] != self.numbers] = np.inf
+            permutations[ops, atoms] = np.argmin(distances, axis=1)
+
+        if np.any(np.sort(permutations, axis=1) != np.arange(num_atoms)):
+            return None
+        return permutations
+
+    def _are_valid_permutations(self, permutations, centering_permutations):
+        """
+        Return whether the atom permutations (e.g. of the previous reference)
+        are valid, within symprec, for the operations of the reference frame.
+        """
+        identities = np.broadcast_to(
+            np.eye(3, dtype=int), (len(self.centering_translations), 3, 3)
+        )
+        for rotations, translations, perms in [
+            (self.rotations, self.translations, permutations),
+            (identities, self.centering_translations, centering_permutations),
+        ]:
+            differences = self._get_differences(
+                self.positions, rotations, translations, perms
+            )
+            if (
+                np.max(np.linalg.norm(np.dot(differences, self.cell), axis=-1))
+                > self.symprec
+            ):
+                return False
+        return True
+
+    def _get_reduced_vectors(self, cell, conv_cell):
+        """
+        Return the vectors (in the basis of the conventional cell) of the
+        primitive cell reduced by spglib with the Delaunay reduction, as in
+        its symmetry analysis, or None if the reduction fails.
+
+        The result depends on the starting basis: spglib reduces the input
+        cell if it is primitive, otherwise a primitive cell that it builds
+        from the pure translations (here, the standard one).
+        """
+        from .hpkot.tools import check_spglib_version
+
+        spglib = check_spglib_version()
+
+        if len(self.centering_translations) > 1:
+            cell = np.dot(self.primitive_vectors, conv_cell)
+        reduced = spglib.delaunay_reduce(cell, eps=self.symprec)
+        if reduced is None:
+            return None
+        return np.round(np.dot(reduced, np.linalg.inv(conv_cell)), 6)
+
+    def _get_short_vectors(self):
+        """
+        Return the vectors (in the basis of the conventional cell, one of
+        each pair v and -v) of the Delaunay sets of the reduced primitive
+        cell and of the conventional cell.
+        """
+        vectors = []
+        for basis in [self.reduced_vectors, np.eye(3)]:
+            if basis is None:
+                continue
+            superbase = np.concatenate([basis, [-np.sum(basis, axis=0)]])
+            vectors.extend(superbase)
+            vectors.extend(
+                superbase[i] + superbase[j] for i, j in [(0, 1), (0, 2), (1, 2)]
+            )
+        vectors = np.round(vectors, 8)
+        signs = np.sign(
+            vectors[np.arange(len(vectors)), np.argmax(vectors != 0, axis=1)]
+        )
+        return np.unique(vectors * signs[:, np.newaxis], axis=0)
+
+    def _get_free_values(self):
+        """
+        Return the mask of the values of :py:meth:`_get_setting_values` that
+        can change the choice of the conventional cell.
+
+        The values that vanish for a generic (symmetrized) metric are ties by
+        symmetry. Moreover, the equivalent conventional cells are related by
+        changes of basis that normalize the point group: they can only
+        exchange vectors that are left invariant (or reversed) by as many
+        proper and improper rotations, and the lengths of other vectors are
+        not compared.
+        """
+        generic_cell = np.random.default_rng(0).normal(size=(3, 3)) + 3.0 * np.eye(3)
+        generic_values = self._get_setting_values(
+            self._get_conv_metric(generic_cell)[1]
+        )
+
+        images = np.matmul(self.conv_rotations, self.short_vectors.T)
+        is_proper = np.linalg.det(self.conv_rotations) > 0
+        profiles = []
+        for sign in [1, -1]:
+            is_invariant = np.all(
+                np.abs(images - sign * self.short_vectors.T) < 1.0e-6, axis=1
+            )
+            profiles.append(np.sum(is_invariant[is_proper], axis=0))
+            profiles.append(np.sum(is_invariant[~is_proper], axis=0))
+        profiles = np.transpose(profiles)
+        exchangeable = np.all(
+            profiles[self.pairs[0]] == profiles[self.pairs[1]], axis=1
+        )
+        return (np.abs(generic_values) > 1.0e-8) & np.concatenate(
+            [exchangeable, np.ones_like(exchangeable)]
+        )
+
+    def _get_conv_metric(self, cell):
+        """
+        Return the conventional cell (with the transformation of the
+        reference frame) and its metric, symmetrized with the rotations of
+        the point group.
+        """
+        conv_cell = np.dot(self.inv_transformation_matrix.T, cell)
+        conv_metric = np.mean(
+            np.matmul(
+                np.matmul(
+                    np.swapaxes(self.conv_rotations, 1, 2),
+                    np.dot(conv_cell, conv_cell.T),
+                ),
+                self.conv_rotations,
+            ),
+            axis=0,
+        )
+        return conv_cell, conv_metric
+
+    def _get_setting_values(self, conv_metric):
+        """
+        Return the differences of the squared lengths, and the scalar
+        products, of all the pairs of short lattice vectors, in units of the
+        largest squared length of the conventional axes.
+        """
+        gram = np.dot(np.dot(self.short_vectors, conv_metric), self.short_vectors.T)
+        lengths = np.diag(gram)
+        return np.concatenate(
+            [lengths[self.pairs[0]] - lengths[self.pairs[1]], gram[self.pairs]]
+        ) / np.max(np.diag(conv_metric))
+
+    def _get_setting_signature(self, conv_metric):
+        """
+        Return the values of :py:meth:`_get_setting_values` that are not
+        fixed by symmetry, and their signs (0 within the tolerance).
+        """
+        values = self._get_setting_values(conv_metric)[self.free_values]
+        tolerance = 2.0 * self.symprec / np.sqrt(np.max(np.diag(conv_metric)))
+        signs = np.where(np.abs(values) > tolerance, np.sign(values), 0)
+        return values, signs.astype(np.int8)
+
+    @staticmethod
+    def _get_differences(positions, rotations, translations, permutations):
+        """
+        Return the (wrapped) differences between the image of each atom under
+        each operation and the atom it is mapped onto, shape ``(M, N, 3)``.
+        """
+        images = np.matmul(positions, np.swapaxes(rotations, 1, 2))
+        images += translations[:, np.newaxis, :]
+        differences = images - positions[permutations]
+        differences -= np.rint(differences)
+        return differences
+
+    @staticmethod
+    def _get_distances(scaled_differences, cell):
+        """Cartesian norm of scaled differences, wrapped to [-0.5, 0.5)."""
+        wrapped = scaled_differences - np.rint(scaled_differences)
+        return np.linalg.norm(np.dot(wrapped, cell), axis=-1)
+
+    def standardize(self, structure):
+        """
+        Return the dataset of ``structure``, if it has (at least) the
+        symmetry of the reference frame within ``symprec`` and if spglib
+        would choose the same conventional cell, otherwise None.
+
+        The returned object has the same attributes of the spglib dataset
+        that are needed by :py:func:`seekpath.hpkot.get_path_from_dataset`.
+        """
+        if self.permutations is None:
+            return None
+
+        cell = np.array(structure[0], dtype=float)
+        positions = np.array(structure[1], dtype=float)
+        numbers = np.array(structure[2])
+        if positions.shape != self.positions.shape or not np.array_equal(
+            numbers, self.numbers
+        ):
+            return None
+
+        # The lattice must be invariant under the rotations: W^T G W = G
+        metric = np.dot(cell, cell.T)
+        rotated_metrics = np.matmul(
+            np.matmul(np.swapaxes(self.rotations, 1, 2), metric), self.rotations
+        )
+        max_length = np.sqrt(np.max(np.diag(metric)))
+        if np.max(np.abs(rotated_metrics - metric)) > 2.0 * self.symprec * max_length:
+            return None
+
+        # The transformation of the reference frame must still give the
+        # conventional cell chosen by spglib: the Delaunay reduction must
+        # give the same primitive cell, and the comparisons must have the
+        # same outcome as for the reference frame, and must not be ties
+        # within the tolerance (spglib may then choose either way), unless
+        # they are unchanged (e.g. for a uniform scaling of the cell)
+        conv_cell, conv_metric = self._get_conv_metric(cell)
+        reduced_vectors = self._get_reduced_vectors(cell, conv_cell)
+        if (
+            reduced_vectors is None
+            or self.reduced_vectors is None
+            or not np.array_equal(reduced_vectors, self.reduced_vectors)
+        ):
+            return None
+        values, signature = self._get_setting_signature(conv_metric)
+        if not np.all(
+            ((signature == self.setting_signature) & (signature != 0))
+            | (np.abs(values - self.setting_values) < 1.0e-10)
+        ):
+            return None
+
+        # Rigid drift of the atoms w.r.t. the reference frame: the operations
+        # are translated accordingly, (W, t + d - W d)
+        displacements = positions - self.positions
+        drift = np.mean(displacements - np.rint(displacements), axis=0)
+        drifted_translations = self.translations + drift - np.dot(self.rotations, drift)
+
+        # All atoms must be mapped onto atoms of the same type (according to
+        # the permutations of the reference frame). Then, symmetrize:
+        # x_j <- mean over the operations of the image of the atom mapped onto
+        # j. Averaging over one operation per rotation and then over the pure
+        # translations is the same as averaging over the whole group
+        for rotations, translations, permutations, inv_permutations in [
+            (
+                self.rotations,
+                drifted_translations,
+                self.permutations,
+                self.inv_permutations,
+            ),
+            (
+                np.broadcast_to(
+                    np.eye(3, dtype=int), (len(self.centering_translations), 3, 3)
+                ),
+                self.centering_translations,
+                self.centering_permutations,
+                self.inv_centering_permutations,
+            ),
+        ]:
+            differences = self._get_differences(
+                positions, rotations, translations, permutations
+            )
+            if (
+                np.max(np.linalg.norm(np.dot(differences, cell), axis=-1))
+                > self.symprec
+            ):
+                return None
+            positions = positions + np.mean(
+                np.take_along_axis(
+                    differences, inv_permutations[:, :, np.newaxis], axis=1
+                ),
+                axis=0,
+            )
+
+        # The origin follows the drift, apart from the component along polar
+        # directions (those invariant under all rotations, obtained with the
+        # average of the rotations), where it is not fixed by symmetry and
+        # spglib keeps it unchanged
+        fixed_drift = drift - np.dot(np.mean(self.rotations, axis=0), drift)
+        origin_shift = self.origin_shift - np.dot(
+            self.transformation_matrix, fixed_drift
+        )
+        std_positions = (
+            np.dot(
+                positions[self.std_atoms] + self.std_shifts,
+                self.transformation_matrix.T,
+            )
+            + origin_shift
+        ) % 1.0
+
+        # Build the idealized lattice from the symmetrized metric of the
+        # conventional cell, with the same orientation convention as spglib
+        std_lattice = np.linalg.cholesky(conv_metric)
+        left, _, right = np.linalg.svd(np.dot(conv_cell.T, std_lattice))
+        std_rotation_matrix = np.dot(left, right).T
+
+        return SimpleNamespace(
+            number=self.number,
+            international=self.international,
+            transformation_matrix=self.transformation_matrix,
+            origin_shift=origin_shift,
+            std_lattice=std_lattice,
+            std_positions=std_positions,
+            std_types=self.numbers[self.std_atoms],
+            std_rotation_matrix=std_rotation_matrix,
+        )
+
+
+def get_path_trajectory(
+    frames,
+    with_time_reversal=True,
+    recipe='hpkot',
+    threshold=1.0e-7,
+    symprec=1e-05,
+    angle_tolerance=-1.0,
+    output='dict',
+    recheck_interval=None,
+):
+    """
+    Return the k-point path information (as in :py:func:`seekpath.get_path`)
+    for each frame of a trajectory, running the full symmetry analysis only
+    when the symmetry changes.
+
+    The spglib symmetry analysis is run on the first frame. For the
+    following frames, a cheap check verifies whether the symmetry operations
+    of the last analysed frame are still valid (within ``symprec``, allowing
+    for a rigid drift of the atoms), and whether the transformation to the
+    conventional cell still gives the cell chosen by spglib (which depends
+    on the cell parameters, e.g. the choice of the axes of monoclinic cells
+    or the order of the axes of orthorhombic cells, through the Delaunay
+    reduction of the primitive cell and the comparisons of the lengths of
+    short lattice vectors). If so, the spacegroup and the transformation are
+    reused, and the frame is standardized with a few matrix operations.
+    Otherwise (a transition frame), the full analysis is run again, and the
+    frame becomes the new reference. The rest of the algorithm (extended
+    Bravais lattice, special points, primitive cell) is the same as for
+    ``get_path``, and it is run for every frame, so that e.g. changes of the
+    extended Bravais lattice due to changes of the cell parameters are
+    detected.
+
+    .. note:: the cheap check only verifies that the symmetry is not
+        lower than that of the reference frame: an increase of the symmetry
+        (e.g. a distorted structure that relaxes to a more symmetric one) is
+        detected only at the next transition frame. Set ``recheck_interval``
+        to run the full analysis periodically.
+
+    .. note:: the check of the conventional cell is conservative: the
+        full analysis is run whenever the Delaunay reduction of the primitive
+        cell changes, or when lengths of short lattice vectors are equal
+        within the tolerance without being equal by symmetry. If the cell
+        has such ties (e.g. a cubic cell with some noise on the cell
+        parameters) and changes along the trajectory, the full analysis can
+        be run for most frames.
+
+    .. note:: the atoms must be in the same order in all frames. The results
+        of the frames that are not analysed with spglib agree with those of
+        ``get_path`` within ``symprec`` (the standardized lattices and
+        positions are idealized similarly, but not identically, to spglib).
+        ``angle_tolerance`` is only used for the full analysis.
+
+    The parameters are the same as for :py:func:`seekpath.get_path`, apart
+    from:
+
+    :param frames: an iterable of structures, each in the format
+        ``(cell, positions, numbers)`` accepted by ``get_path``.
+    :param recheck_interval: if not None, run the full analysis at least
+        every ``recheck_interval`` frames.
+
+    :return: a dictionary with the following keys:
+
+        - ``results``: a list with the output of ``get_path`` for each frame.
+        - ``transition_frames``: the indices of the frames for which the full
+          symmetry analysis was run (the first one is always 0).
+        - ``num_frames``: the number of frames.
+    """
+    from . import hpkot
+
+    _check_output(output)
+    if recipe != 'hpkot':
+        raise ValueError(
+            "value for 'recipe' not recognized. The only value "
+            "currently accepted is 'hpkot'."
+        )
+    if recheck_interval is not None and recheck_interval < 1:
+        raise ValueError(f'recheck_interval must be positive, got {recheck_interval}')
+
+    results = []
+    transition_frames = []
+    reference = None
+    for idx, structure in enumerate(frames):
+        dataset = None
+        if reference is not None and (
+            recheck_interval is None or idx - transition_frames[-1] < recheck_interval
+        ):
+            dataset = reference.standardize(structure)
+        if dataset is None:
+            dataset = hpkot.get_symmetry_dataset(
+                structure, symprec=symprec, angle_tolerance=angle_tolerance
+            )
+            reference = _SymmetryReference(
+                structure, dataset, symprec, previous=reference
+            )
+            transition_frames.append(idx)
+
+        res = hpkot.get_path_from_dataset(
+            dataset,
+            with_time_reversal=with_time_reversal,
+            threshold=threshold,
+            output='dict' if output == 'dict' else 'numpy',
+        )
+        if output == 'result':
+            from .results import PathResult
+
+            res = PathResult(res)
+        results.append(res)
+
+    return {
+        'results': results,
+        'transition_frames': transition_frames,
+        'num_frames': len(results),
+    }
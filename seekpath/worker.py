@@ -0,0 +1,265 @@
+"""
+Long-running worker reading structures as JSON lines on the standard input,
+and writing the results as JSON lines on the standard output::
+
+    python -m seekpath.worker --jobs 4 < structures.jsonl > paths.jsonl
+
+Each input line is a JSON object with a ``structure`` key, either an object
+with the ``cell``, ``positions`` and ``numbers`` keys or a list
+``[cell, positions, numbers]``. Optional keys are:
+
+- ``id``, any JSON value, copied to the output;
+- ``function``, the function of :py:mod:`seekpath.getpaths` to run
+  (:py:data:`FUNCTIONS`; by default, the one given with ``--function``);
+- ``parameters``, an object with the keyword arguments of the function
+  (e.g. ``symprec`` or ``reference_distance``).
+
+Each output line is a JSON object with the ``index`` of the input line
+among the non-empty input lines (starting from 0), the ``id`` (null if not
+given), and either ``result`` (see :py:func:`seekpath.to_jsonable`) or
+``error``, an object with the ``type`` and the ``message`` of the
+exception. Empty input lines are ignored. Each output line is flushed as soon as it is written, so that the
+worker can be driven interactively through pipes.
+
+With ``--jobs`` larger than 1, the structures are computed in a pool of
+worker processes, with at most ``--max-pending`` structures read in
+advance. The results are written in the input order, or as soon as they
+are available with ``--unordered``.
+"""
+
+import argparse
+import json
+import sys
+
+# Functions of seekpath.getpaths that can be run
+FUNCTIONS = (
+    'get_path',
+    'get_explicit_k_path',
+    'get_path_orig_cell',
+    'get_explicit_k_path_orig_cell',
+)
+
+
+def _get_error(exc):
+    """Return the error object describing an exception."""
+    return {'type': type(exc).__name__, 'message': str(exc)}
+
+
+def process_line(index, line, function='get_path', compact=True):
+    """
+    Compute the result of an input line.
+
+    :param index: the index of the line among the non-empty lines.
+    :param line: the input line.
+    :param function: the default function, if the line has no ``function``.
+    :param compact: passed to :py:func:`seekpath.to_jsonable`.
+    :return: the output line (without the final newline).
+    """
+    from . import getpaths
+    from .serialization import to_jsonable
+
+    output = {'index': index, 'id': None}
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise TypeError('the record must be a JSON object')
+        output['id'] = record.get('id')
+        function = record.get('function', function)
+        if function not in FUNCTIONS:
+            raise ValueError(
+                f"value '{function}' for 'function' not recognized. Accepted "
+                f'values: {", ".join(FUNCTIONS)}'
+            )
+        structure = record['structure']
+        if isinstance(structure, dict):
+            structure = (
+                structure['cell'],
+                structure['positions'],
+                structure['numbers'],
+            )
+        res = getattr(getpaths, function)(
+            structure, diagnostics='collect', **record.get('parameters', {})
+        )
+        output['result'] = to_jsonable(res, compact=compact)
+    except Exception as exc:  # noqa: BLE001
+        output['error'] = _get_error(exc)
+    return json.dumps(output)
+
+
+def _iter_lines(stream):
+    """Iterate over the non-empty lines of ``stream``, with their index."""
+    index = 0
+    for line in stream:
+        if line.strip():
+            yield index, line
+            index += 1
+
+
+def run(
+    stdin,
+    stdout,
+    function='get_path',
+    jobs=1,
+    ordered=True,
+    compact=True,
+    max_pending=None,
+):
+    """
+    Process all the lines of ``stdin``, and write the results to ``stdout``.
+
+    :param stdin: the input text stream.
+    :param stdout: the output text stream.
+    :param function: the default function (see :py:func:`process_line`).
+    :param jobs: the number of worker processes; 1 to compute in the
+        calling process, 0 for one per CPU.
+    :param ordered: if True, the results are written in the input order.
+    :param compact: passed to :py:func:`seekpath.to_jsonable`.
+    :param max_pending: the maximum number of lines read in advance (by
+        default, 4 per worker).
+    :return: the number of lines processed.
+    """
+    if jobs < 0:
+        raise ValueError('jobs must be a non-negative integer')
+    if function not in FUNCTIONS:
+        raise ValueError(
+            f"value '{function}' for 'function' not recognized. Accepted values: "
+            f'{", ".join(FUNCTIONS)}'
+        )
+
+    def write(output_line):
+        stdout.write(output_line + '\n')
+        stdout.flush()
+
+    num_lines = 0
+    if jobs == 1:
+        for index, line in _iter_lines(stdin):
+            write(process_line(index, line, function=function, compact=compact))
+            num_lines += 1
+        return num_lines
+
+    import os
+    import queue
+    import threading
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = jobs or os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 4 * jobs
+    if max_pending < 1:
+        raise ValueError('max_pending must be a positive integer')
+
+    # The lines are read and submitted in a separate thread, so that
+    # results are written while waiting for the next input line. The
+    # pairs (index, future) are passed to the calling thread in input order
+    # (ordered), or when done (unordered), through 'done'; at the end, the
+    # reader puts (end, number of lines)
+    done = queue.Queue()
+    slots = threading.Semaphore(max_pending)
+    end = object()
+    read_error = []
+
+    def read():
+        num_read = 0
+        try:
+            for index, line in _iter_lines(stdin):
+                slots.acquire()
+                future = executor.submit(
+                    process_line, index, line, function=function, compact=compact
+                )
+                num_read += 1
+                if ordered:
+                    done.put((index, future))
+                else:
+                    future.add_done_callback(
+                        lambda future, index=index: done.put((index, future))
+                    )
+        except Exception as exc:  # noqa: BLE001
+            read_error.append(exc)
+        finally:
+            done.put((end, num_read))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        reader = threading.Thread(
+            target=read, name='seekpath-worker-reader', daemon=True
+        )
+        reader.start()
+        num_read = None
+        while num_read is None or num_lines < num_read:
+            index, future = done.get()
+            if index is end:
+                num_read = future
+                continue
+            try:
+                output_line = future.result()
+            except Exception as exc:  # noqa: BLE001
+                # E.g. a worker process was killed
+                output_line = json.dumps(
+                    {'index': index, 'id': None, 'error': _get_error(exc)}
+                )
+            write(output_line)
+            num_lines += 1
+            slots.release()
+        reader.join()
+    if read_error:
+        raise read_error[0]
+    return num_lines
+
+
+def main(argv=None):
+    """Run the worker (``python -m seekpath.worker``)."""
+    parser = argparse.ArgumentParser(
+        prog='python -m seekpath.worker',
+        description='Compute k-paths of structures read as JSON lines on the '
+        'standard input, writing the results as JSON lines on the standard output.',
+    )
+    parser.add_argument(
+        '--function',
+        choices=FUNCTIONS,
+        default='get_path',
+        help='function run for the records without a "function" (default: get_path)',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='number of worker processes (0 for one per CPU; default: 1)',
+    )
+    parser.add_argument(
+        '--unordered',
+        action='store_true',
+        help='write the results as soon as they are available',
+    )
+    parser.add_argument(
+        '--max-pending',
+        type=int,
+        default=None,
+        help='maximum number of records read in advance (default: 4 per job)',
+    )
+    parser.add_argument(
+        '--lists',
+        action='store_true',
+        help='write arrays as lists of values, rather than base64 buffers',
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error('--jobs must be a non-negative integer')
+    if args.max_pending is not None and args.max_pending < 1:
+        parser.error('--max-pending must be a positive integer')
+    run(
+        sys.stdin,
+        sys.stdout,
+        function=args.function,
+        jobs=args.jobs,
+        ordered=not args.unordered,
+        compact=not args.lists,
+        max_pending=args.max_pending,
+    )
+
+
+if __name__ == '__main__':
+    # Run the main of the imported module rather than of __main__, so that
+    # the worker processes unpickle process_line from seekpath.worker
+    from seekpath.worker import main as _main
+
+    _main()
@@ -0,0 +1,259 @@
+"""
+Writers of the k-paths in the input formats of DFT codes.
+
+All writers take the output of :py:func:`seekpath.get_explicit_k_path` (or
+of :py:func:`seekpath.get_explicit_k_path_orig_cell`, in any ``output``
+format) and write to a (text) file object or to a path. The coordinates are
+scaled coordinates with respect to the reciprocal lattice of the
+corresponding cell (``primitive_lattice`` for ``get_explicit_k_path``, the
+input cell for ``get_explicit_k_path_orig_cell``).
+
+Explicit lists of k-points are written in chunks of
+:py:data:`CHUNKSIZE` points, each formatted with a single string
+formatting operation, rather than with one Python formatting call per line.
+"""
+
+import contextlib
+
+import numpy as np
+
+from .getpaths import _get_points_and_path
+
+# Accepted values of the ``format`` parameter of write_kpoints
+FORMATS = (
+    'qe_crystal_b',
+    'qe_crystal',
+    'vasp_line',
+    'vasp_explicit',
+    'wannier90',
+    'castep_path',
+    'castep_list',
+)
+
+# Number of k-points formatted and written at once
+CHUNKSIZE = 8192
+
+# Format of a coordinate
+COORD_FORMAT = '%16.10f'
+
+
+@contextlib.contextmanager
+def _open(target):
+    """Open ``target`` (a path) for writing, or yield it if it is a file."""
+    if hasattr(target, 'write'):
+        yield target
+    else:
+        with open(target, 'w', encoding='utf-8') as handle:
+            yield handle
+
+
+def _check_mode(mode, modes):
+    """Raise a ValueError if ``mode`` is not one of ``modes``."""
+    if mode not in modes:
+        raise ValueError(
+            f"value '{mode}' for 'mode' not recognized. Accepted values: "
+            f'{", ".join(modes)}'
+        )
+
+
+def _write_rows(handle, row_format, values):
+    """
+    Write the rows of ``values`` (a 2D array), each formatted with
+    ``row_format``, in chunks of :py:data:`CHUNKSIZE` rows: the format is
+    repeated and applied once to each chunk.
+    """
+    values = np.asarray(values, dtype=float)
+    for start in range(0, len(values), CHUNKSIZE):
+        chunk = values[start : start + CHUNKSIZE]
+        handle.write((row_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+def _get_special_points(seekpath_output):
+    """
+    Return the special points along the path, as a list of tuples
+    ``(label, coords, num_intervals)``: ``num_intervals`` is the number of
+    intervals of the explicit path to the next point, or 0 if the path is
+    interrupted after the point (or for the last point).
+    """
+    labels, coords, path_indices = _get_points_and_path(seekpath_output)
+    segments = np.asarray(seekpath_output['explicit_segments'], dtype=int).reshape(
+        -1, 2
+    )
+    points = []
+    for idx, ((start, stop), (segment_start, segment_stop)) in enumerate(
+        zip(path_indices, segments)
+    ):
+        if idx > 0 and path_indices[idx - 1][1] != start:
+            # Discontinuity: the previous segment ended at a different point
+            previous = path_indices[idx - 1][1]
+            points.append((labels[previous], coords[previous], 0))
+        points.append((labels[start], coords[start], segment_stop - segment_start - 1))
+    if len(path_indices):
+        last = path_indices[-1][1]
+        points.append((labels[last], coords[last], 0))
+    return points
+
+
+def _get_explicit_kpoints(seekpath_output):
+    """Return the explicit k-points as an :math:`N \\times 3` array."""
+    return np.asarray(seekpath_output['explicit_kpoints_rel'], dtype=float).reshape(
+        -1, 3
+    )
+
+
+def write_qe_kpoints(seekpath_output, target, mode='crystal_b'):
+    """
+    Write the ``K_POINTS`` card of Quantum ESPRESSO (``pw.x``).
+
+    :param seekpath_output: the output of
+        :py:func:`seekpath.get_explicit_k_path`.
+    :param target: a (text) file object or a path.
+    :param mode: ``'crystal_b'`` (default) to write the special points, each
+        with the number of points to the next one (1 for discontinuities of
+        the path, i.e. a direct jump to the next point); ``'crystal'`` to
+        write the explicit list of k-points, with unit weights.
+    """
+    _check_mode(mode, ('crystal_b', 'crystal'))
+    with _open(target) as handle:
+        if mode == 'crystal_b':
+            points = _get_special_points(seekpath_output)
+            handle.write(f'K_POINTS crystal_b\n{len(points)}\n')
+            for label, coords, num_intervals in points:
+                handle.write(
+                    (COORD_FORMAT * 3) % tuple(coords)
+                    + f' {max(num_intervals, 1)} ! {label}\n'
+                )
+        else:
+            kpoints = _get_explicit_kpoints(seekpath_output)
+            handle.write(f'K_POINTS crystal\n{len(kpoints)}\n')
+            _write_rows(handle, COORD_FORMAT * 3 + ' 1\n', kpoints)
+
+
+def write_vasp_kpoints(seekpath_output, target, mode='line', num_points=None):
+    """
+    Write a VASP ``KPOINTS`` file.
+
+    :param seekpath_output: the output of
+        :py:func:`seekpath.get_explicit_k_path`.
+    :param target: a (text) file object or a path.
+    :param mode: ``'line'`` (default) for the line mode, with one pair of
+        special points per segment of the path; ``'explicit'`` to write the
+        explicit list of k-points, with unit weights.
+    :param num_points: for the line mode, the number of points of each
+        segment (VASP uses the same for all segments). If None, the largest
+        number of points of the segments of the explicit path is used, so
+        that the spacing is not larger than the ``reference_distance``.
+    """
+    _check_mode(mode, ('line', 'explicit'))
+    with _open(target) as handle:
+        if mode == 'line':
+            labels, coords, path_indices = _get_points_and_path(seekpath_output)
+            if num_points is None:
+                segments = np.asarray(
+                    seekpath_output['explicit_segments'], dtype=int
+                ).reshape(-1, 2)
+                num_points = int(np.max(segments[:, 1] - segments[:, 0], initial=2))
+            handle.write(
+                f'k-path generated by seekpath\n{num_points}\nLine-mode\nReciprocal\n'
+            )
+            for start, stop in path_indices:
+                for idx in (start, stop):
+                    handle.write(
+                        (COORD_FORMAT * 3) % tuple(coords[idx]) + f' ! {labels[idx]}\n'
+                    )
+                handle.write('\n')
+        else:
+            kpoints = _get_explicit_kpoints(seekpath_output)
+            handle.write(
+                f'Explicit k-points generated by seekpath\n{len(kpoints)}\nReciprocal\n'
+            )
+            _write_rows(handle, COORD_FORMAT * 3 + ' 1\n', kpoints)
+
+
+def write_wannier90_kpoint_path(seekpath_output, target):
+    """
+    Write the ``kpoint_path`` block of Wannier90, with one line per segment
+    of the path.
+
+    :param seekpath_output: the output of :py:func:`seekpath.get_path` or
+        :py:func:`seekpath.get_explicit_k_path`.
+    :param target: a (text) file object or a path.
+    """
+    labels, coords, path_indices = _get_points_and_path(seekpath_output)
+    with _open(target) as handle:
+        handle.write('begin kpoint_path\n')
+        for start, stop in path_indices:
+            handle.write(
+                f'{labels[start]}'
+                + (COORD_FORMAT * 3) % tuple(coords[start])
+                + f'  {labels[stop]}'
+                + (COORD_FORMAT * 3) % tuple(coords[stop])
+                + '\n'
+            )
+        handle.write('end kpoint_path\n')
+
+
+def write_castep_kpoints(seekpath_output, target, mode='path'):
+    """
+    Write the k-points block of a CASTEP ``.cell`` file.
+
+    :param seekpath_output: the output of
+        :py:func:`seekpath.get_explicit_k_path`.
+    :param target: a (text) file object or a path.
+    :param mode: ``'path'`` (default) to write the special points in the
+        ``SPECTRAL_KPOINT_PATH`` block, with ``BREAK`` at the discontinuities
+        of the path; ``'list'`` to write the explicit list of k-points in
+        the ``SPECTRAL_KPOINT_LIST`` block, with equal weights.
+    """
+    _check_mode(mode, ('path', 'list'))
+    with _open(target) as handle:
+        if mode == 'path':
+            handle.write('%BLOCK SPECTRAL_KPOINT_PATH\n')
+            points = _get_special_points(seekpath_output)
+            for idx, (label, coords, num_intervals) in enumerate(points):
+                handle.write((COORD_FORMAT * 3) % tuple(coords) + f' ! {label}\n')
+                if num_intervals == 0 and idx < len(points) - 1:
+                    handle.write('BREAK\n')
+            handle.write('%ENDBLOCK SPECTRAL_KPOINT_PATH\n')
+        else:
+            kpoints = _get_explicit_kpoints(seekpath_output)
+            handle.write('%BLOCK SPECTRAL_KPOINT_LIST\n')
+            weights = np.full((len(kpoints), 1), 1.0 / max(len(kpoints), 1))
+            _write_rows(
+                handle, COORD_FORMAT * 3 + ' %.12e\n', np.hstack([kpoints, weights])
+            )
+            handle.write('%ENDBLOCK SPECTRAL_KPOINT_LIST\n')
+
+
+def write_kpoints(seekpath_output, target, format):  # pylint: disable=redefined-builtin
+    """
+    Write the k-path in one of the :py:data:`FORMATS`: ``qe_crystal_b``,
+    ``qe_crystal`` (:py:func:`write_qe_kpoints`), ``vasp_line``,
+    ``vasp_explicit`` (:py:func:`write_vasp_kpoints`), ``wannier90``
+    (:py:func:`write_wannier90_kpoint_path`), ``castep_path``,
+    ``castep_list`` (:py:func:`write_castep_kpoints`).
+
+    :param seekpath_output: the output of
+        :py:func:`seekpath.get_explicit_k_path`.
+    :param target: a (text) file object or a path.
+    :param format: the format.
+    """
+    if format == 'qe_crystal_b':
+        write_qe_kpoints(seekpath_output, target, mode='crystal_b')
+    elif format == 'qe_crystal':
+        write_qe_kpoints(seekpath_output, target, mode='crystal')
+    elif format == 'vasp_line':
+        write_vasp_kpoints(seekpath_output, target, mode='line')
+    elif format == 'vasp_explicit':
+        write_vasp_kpoints(seekpath_output, target, mode='explicit')
+    elif format == 'wannier90':
+        write_wannier90_kpoint_path(seekpath_output, target)
+    elif format == 'castep_path':
+        write_castep_kpoints(seekpath_output, target, mode='path')
+    elif format == 'castep_list':
+        write_castep_kpoints(seekpath_output, target, mode='list')
+    else:
+        raise ValueError(
+            f"value '{format}' for 'format' not recognized. Accepted values: "
+            f'{", ".join(FORMATS)}'
+        )
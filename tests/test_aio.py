@@ -0,0 +1,145 @@
+"""Test the asyncio interface."""
+
+import unittest
+
+import numpy as np
+
+
+def get_structures():
+    """Return a few simple structures, with different Bravais lattices."""
+    return [
+        ([[4.0, 0, 0], [0, 4.0, 0], [0, 0, 4.0]], [[0, 0, 0]], [1]),
+        ([[3.0, 0, 0], [0, 3.0, 0], [0, 0, 5.0]], [[0, 0, 0]], [1]),
+        ([[3.0, 0, 0], [0, 4.0, 0], [0, 0, 5.0]], [[0, 0, 0]], [1]),
+        (
+            [[-3.0, 0.0, 3.0], [0.0, 3.0, 3.0], [-3.0, 3.0, 0.0]],
+            [[0.0, 0.0, 0.0], [0.25, 0.25, 0.25]],
+            [30, 16],
+        ),
+    ]
+
+
+class TestAio(unittest.TestCase):
+    """Test seekpath.aio."""
+
+    def test_get_path(self):
+        """The coroutines give the same results as the blocking functions."""
+        import asyncio
+
+        import seekpath
+        import seekpath.aio
+
+        structure = get_structures()[3]
+
+        async def main():
+            semaphore = asyncio.Semaphore(1)
+            return await asyncio.gather(
+                seekpath.aio.get_path(structure, semaphore=semaphore),
+                seekpath.aio.get_explicit_k_path(
+                    structure, semaphore=semaphore, reference_distance=0.1
+                ),
+            )
+
+        res, res_explicit = asyncio.run(main())
+        res_ref = seekpath.get_path(structure)
+        self.assertEqual(res['path'], res_ref['path'])
+        self.assertEqual(res['point_coords'], res_ref['point_coords'])
+        np.testing.assert_array_equal(
+            res_explicit['explicit_kpoints_rel'],
+            seekpath.get_explicit_k_path(structure, reference_distance=0.1)[
+                'explicit_kpoints_rel'
+            ],
+        )
+
+    def test_as_completed(self):
+        """All results are yielded, with their index."""
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
+        import seekpath
+        import seekpath.aio
+
+        structures = get_structures()
+
+        async def main(executor, explicit):
+            return [
+                item
+                async for item in seekpath.aio.get_paths_as_completed(
+                    iter(structures),
+                    explicit=explicit,
+                    executor=executor,
+                    max_concurrency=2,
+                )
+            ]
+
+        for executor, explicit in [(None, False), (None, True)]:
+            results = asyncio.run(main(executor, explicit))
+            self.assertEqual(sorted(idx for idx, _ in results), [0, 1, 2, 3])
+            for idx, res in results:
+                self.assertEqual(
+                    res['bravais_lattice_extended'],
+                    seekpath.get_path(structures[idx])['bravais_lattice_extended'],
+                )
+                self.assertEqual('explicit_kpoints_rel' in res, explicit)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = asyncio.run(main(executor, False))
+        self.assertEqual(sorted(idx for idx, _ in results), [0, 1, 2, 3])
+
+    def test_max_concurrency(self):
+        """No more than max_concurrency computations run at the same time."""
+        import asyncio
+        import threading
+        import time
+        from unittest import mock
+
+        import seekpath.aio
+        from seekpath import getpaths
+
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+        get_path = getpaths.get_path
+
+        def counting_get_path(structure, **kwargs):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.01)
+            try:
+                return get_path(structure, **kwargs)
+            finally:
+                with lock:
+                    running[0] -= 1
+
+        async def main():
+            return [
+                idx
+                async for idx, _ in seekpath.aio.get_paths_as_completed(
+                    get_structures() * 3, max_concurrency=2
+                )
+            ]
+
+        with mock.patch.object(getpaths, 'get_path', counting_get_path):
+            indices = asyncio.run(main())
+        self.assertEqual(sorted(indices), list(range(12)))
+        self.assertEqual(max_running[0], 2)
+
+    def test_errors(self):
+        """Errors are propagated, and invalid parameters raise ValueError."""
+        import asyncio
+
+        import seekpath.aio
+
+        async def main(structures, **kwargs):
+            return [
+                item
+                async for item in seekpath.aio.get_paths_as_completed(
+                    structures, **kwargs
+                )
+            ]
+
+        with self.assertRaises(ValueError):
+            asyncio.run(main(get_structures(), max_concurrency=0))
+        with self.assertRaises(ValueError):
+            asyncio.run(main(get_structures(), recipe='unknown'))
@@ -0,0 +1,180 @@
+"""Test the batch front ends."""
+
+import unittest
+
+import numpy as np
+
+
+def get_structures():
+    """
+    Return a list of structures with duplicates: two distinct structures,
+    plus permuted/translated/wrapped copies of the first one.
+    """
+    cell = [[-3.0, 0.0, 3.0], [0.0, 3.0, 3.0], [-3.0, 3.0, 0.0]]
+    positions = np.array([[0.0, 0.0, 0.0], [0.25, 0.25, 0.25]])
+    zincblende = (cell, positions.tolist(), [30, 16])
+    zincblende_permuted = (cell, positions[::-1].tolist(), [16, 30])
+    zincblende_shifted = (cell, (positions + [0.1, 1.2, -0.3]).tolist(), [30, 16])
+    simple_cubic = (
+        [[2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 2.0]],
+        [[0, 0, 0]],
+        [1],
+    )
+    return [
+        zincblende,
+        simple_cubic,
+        zincblende_permuted,
+        zincblende_shifted,
+        simple_cubic,
+    ]
+
+
+class TestGetPathBatch(unittest.TestCase):
+    """Test seekpath.get_path_batch."""
+
+    def test_deduplication(self):
+        """Duplicates are computed once, and results are in input order."""
+        import seekpath
+
+        structures = get_structures()
+        batch = seekpath.get_path_batch(structures)
+
+        self.assertEqual(batch['num_structures'], 5)
+        self.assertEqual(batch['num_unique'], 2)
+        self.assertAlmostEqual(batch['duplication_ratio'], 2.5)
+        self.assertEqual(batch['group_indices'], [0, 1, 0, 0, 1])
+        self.assertEqual(len(batch['results']), 5)
+
+        for structure, res in zip(structures, batch['results']):
+            res_ref = seekpath.get_path(structure)
+            self.assertEqual(
+                res['bravais_lattice_extended'], res_ref['bravais_lattice_extended']
+            )
+            self.assertEqual(res['path'], res_ref['path'])
+            for label, coords in res_ref['point_coords'].items():
+                np.testing.assert_array_almost_equal(res['point_coords'][label], coords)
+            np.testing.assert_array_almost_equal(
+                res['transformation_matrix'], res_ref['transformation_matrix']
+            )
+
+    def test_no_deduplication(self):
+        """With deduplicate=False, every structure is computed."""
+        from unittest import mock
+
+        import seekpath
+        from seekpath import batch as batch_module
+
+        structures = get_structures()
+        with mock.patch.object(batch_module, 'fingerprint') as fingerprint:
+            batch = seekpath.get_path_batch(structures, deduplicate=False)
+        fingerprint.assert_not_called()
+        self.assertEqual(batch['num_unique'], 5)
+        self.assertEqual(batch['group_indices'], [0, 1, 2, 3, 4])
+        self.assertAlmostEqual(batch['duplication_ratio'], 1.0)
+        for res, res_dedup in zip(
+            batch['results'], seekpath.get_path_batch(structures)['results']
+        ):
+            self.assertEqual(
+                res['bravais_lattice_extended'], res_dedup['bravais_lattice_extended']
+            )
+
+    def test_unique_cells_not_fingerprinted(self):
+        """Structures with a unique cell and number of atoms are not fingerprinted."""
+        from unittest import mock
+
+        from seekpath import batch as batch_module
+
+        structures = get_structures()
+        # A different cell: it cannot have duplicates
+        cell, positions, numbers = structures[0]
+        structures.append((np.array(cell) * 1.1, positions, numbers))
+        with mock.patch.object(
+            batch_module, 'fingerprint', wraps=batch_module.fingerprint
+        ) as fingerprint:
+            representatives, group_indices = batch_module.group_by_fingerprint(
+                iter(structures)
+            )
+        self.assertEqual(fingerprint.call_count, 5)
+        self.assertEqual(representatives, [0, 1, 5])
+        self.assertEqual(group_indices, [0, 1, 0, 0, 1, 2])
+
+    def test_independent_copies(self):
+        """Results of duplicates can be modified independently."""
+        import seekpath
+
+        results = seekpath.get_path_batch(get_structures())['results']
+        results[0]['point_coords']['GAMMA'][0] = 100.0
+        results[0]['path'].append(('X', 'X'))
+        self.assertEqual(results[2]['point_coords']['GAMMA'], [0.0, 0.0, 0.0])
+        self.assertNotIn(('X', 'X'), results[2]['path'])
+
+    def test_empty(self):
+        """An empty batch does not fail."""
+        import seekpath
+
+        batch = seekpath.get_path_batch([])
+        self.assertEqual(batch['results'], [])
+        self.assertEqual(batch['num_unique'], 0)
+        self.assertEqual(batch['duplication_ratio'], 1.0)
+
+    def test_result_output(self):
+        """With output='result', PathResult objects are shared in a group."""
+        import seekpath
+
+        results = seekpath.get_path_batch(get_structures(), output='result')['results']
+        self.assertIsInstance(results[0], seekpath.PathResult)
+        self.assertIs(results[0], results[3])
+
+
+class TestGetPathBatchSharedMemory(unittest.TestCase):
+    """Test seekpath.get_path_batch_shared_memory."""
+
+    def test_same_results(self):
+        """The results are the same as those of get_path, in input order."""
+        import seekpath
+
+        # The last one is a tI structure given in its conventional cell
+        structures = get_structures() + [
+            (
+                [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 6.0]],
+                [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]],
+                [1, 1],
+            )
+        ]
+        results = seekpath.get_path_batch_shared_memory(
+            structures, max_workers=2, chunksize=2
+        )
+        self.assertEqual(len(results), len(structures))
+        for structure, res in zip(structures, results):
+            res_ref = seekpath.get_path(structure)
+            self.assertEqual(list(res), list(res_ref))
+            for key, value in res_ref.items():
+                if isinstance(value, np.ndarray):
+                    np.testing.assert_array_equal(res[key], value)
+                else:
+                    self.assertEqual(res[key], value)
+
+    def test_output(self):
+        """The 'numpy' and 'result' outputs are supported."""
+        import seekpath
+
+        structures = get_structures()[:2]
+        results = seekpath.get_path_batch_shared_memory(
+            structures, output='numpy', max_workers=1
+        )
+        self.assertEqual(results[0]['conv_types'].tolist(), [30, 16] * 4)
+        results = seekpath.get_path_batch_shared_memory(
+            structures, output='result', max_workers=1
+        )
+        self.assertIsInstance(results[1], seekpath.PathResult)
+        self.assertEqual(results[1]['bravais_lattice_extended'], 'cP2')
+
+    def test_empty_and_invalid(self):
+        """An empty batch does not fail; invalid parameters raise ValueError."""
+        import seekpath
+
+        self.assertEqual(seekpath.get_path_batch_shared_memory([]), [])
+        with self.assertRaises(ValueError):
+            seekpath.get_path_batch_shared_memory(get_structures(), chunksize=0)
+        with self.assertRaises(ValueError):
+            seekpath.get_path_batch_shared_memory(get_structures(), output='list')
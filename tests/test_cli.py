@@ -0,0 +1,131 @@
+"""Test the command-line interface."""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+
+def get_band_path_pattern(bravais):
+    """Return the glob pattern of the POSCARs of the band_path_data."""
+    import seekpath
+
+    return os.path.join(
+        os.path.dirname(seekpath.__file__),
+        'hpkot',
+        'band_path_data',
+        bravais,
+        'POSCAR*',
+    )
+
+
+def run(argv):
+    """Run the command, and return its exit status and standard error."""
+    from seekpath import cli
+
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr):
+        status = cli.main(argv)
+    return status, stderr.getvalue()
+
+
+class TestCli(unittest.TestCase):
+    """Test seekpath.cli."""
+
+    def test_jsonl_and_resume(self):
+        """Results are written as JSON lines, and reruns skip them."""
+        import seekpath
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'paths.jsonl')
+            status, stderr = run(
+                ['get-path', get_band_path_pattern('cP1'), '-o', output]
+            )
+            self.assertEqual(status, 0)
+            self.assertIn('2 computed, 0 skipped, 0 failed', stderr)
+
+            status, stderr = run(
+                [
+                    'get-path',
+                    get_band_path_pattern('cP1'),
+                    get_band_path_pattern('tI1'),
+                    '-o',
+                    output,
+                    '--jobs',
+                    '2',
+                ]
+            )
+            self.assertEqual(status, 0)
+            self.assertIn('2 computed, 2 skipped, 0 failed', stderr)
+
+            with open(output) as handle:
+                records = [json.loads(line) for line in handle]
+            self.assertEqual(len(records), 4)
+            self.assertEqual(
+                [record['result']['bravais_lattice_extended'] for record in records],
+                ['cP1', 'cP1', 'tI1', 'tI1'],
+            )
+            res = seekpath.from_jsonable(records[0]['result'])
+            self.assertEqual(res['diagnostics'], [])
+
+            status, stderr = run(
+                ['get-path', get_band_path_pattern('tI1'), '-o', output, '--overwrite']
+            )
+            with open(output) as handle:
+                self.assertEqual(len(handle.readlines()), 2)
+
+    def test_stdout(self):
+        """By default, results are written to the standard output."""
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            status, _ = run(['get-path', get_band_path_pattern('cP1')])
+        self.assertEqual(status, 0)
+        self.assertFalse(stdout.closed)
+        self.assertEqual(len(stdout.getvalue().splitlines()), 2)
+
+    def test_errors(self):
+        """Failures are reported in the output, and in the exit status."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'wrong.xyz')
+            with open(path, 'w') as handle:
+                handle.write('1\nProperties=species:S:1:pos:R:3\nH 0 0 0\n')
+            output = os.path.join(directory, 'paths.jsonl')
+            status, stderr = run(['get-path-orig-cell', path, '-o', output])
+            self.assertEqual(status, 1)
+            self.assertIn('1 failed', stderr)
+            with open(output) as handle:
+                record = json.loads(handle.read())
+            self.assertEqual(record['index'], None)
+            self.assertIn('ValueError', record['error'])
+
+            with self.assertRaises(SystemExit):
+                run(['get-path', os.path.join(directory, '*.none')])
+            with self.assertRaises(SystemExit):
+                run(['get-path', path, '--format', 'vasp_line', '-o', directory])
+
+    def test_kpoints_files(self):
+        """The explicit commands can write k-points files."""
+        with tempfile.TemporaryDirectory() as directory:
+            argv = [
+                'get-explicit-k-path',
+                get_band_path_pattern('cP1'),
+                get_band_path_pattern('cP2'),
+                '--format',
+                'vasp_line',
+                '-o',
+                directory,
+            ]
+            status, stderr = run(argv)
+            self.assertEqual(status, 0)
+            self.assertEqual(
+                sorted(os.listdir(directory)),
+                [
+                    f'{bravais}__POSCAR_{name}.0.vasp_line'
+                    for bravais in ['cP1', 'cP2']
+                    for name in ['inversion', 'noinversion']
+                ],
+            )
+            status, stderr = run(argv)
+            self.assertIn('0 computed, 4 skipped', stderr)
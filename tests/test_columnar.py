@@ -0,0 +1,166 @@
+"""Test the columnar storage of the results."""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+
+def get_results():
+    """Return the paths of a few structures with different Bravais lattices."""
+    import seekpath
+
+    structures = [
+        (np.eye(3) * 4.0, [[0.0, 0.0, 0.0]], [1]),
+        (
+            [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 6.0]],
+            [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]],
+            [1, 1],
+        ),
+        (
+            [[3.0, 0.0, 0.0], [-1.5, 2.598076211353316, 0.0], [0.0, 0.0, 5.0]],
+            [[0.0, 0.0, 0.0], [1 / 3, 2 / 3, 0.5]],
+            [30, 8],
+        ),
+        (
+            [[3.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 5.0]],
+            [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]],
+            [1, 2],
+        ),
+    ]
+    return seekpath.get_path_batch(structures * 3)['results']
+
+
+class TestColumnar(unittest.TestCase):
+    """Test seekpath.columnar."""
+
+    def check_results(self, reader, results):
+        """Check that ``reader`` stores ``results``."""
+        from seekpath.getpaths import _get_points_and_path
+
+        self.assertEqual(len(reader), len(results))
+        for stored, res in zip(reader, results):
+            labels, coords, path = _get_points_and_path(res)
+            self.assertEqual(stored['point_labels'], labels)
+            np.testing.assert_allclose(stored['point_coords'], coords)
+            np.testing.assert_array_equal(stored['path'], path)
+            for key in [
+                'spacegroup_number',
+                'spacegroup_international',
+                'bravais_lattice',
+                'bravais_lattice_extended',
+                'has_inversion_symmetry',
+                'augmented_path',
+            ]:
+                self.assertEqual(stored[key], res[key])
+            np.testing.assert_allclose(
+                stored['reciprocal_primitive_lattice'],
+                res['reciprocal_primitive_lattice'],
+            )
+
+        np.testing.assert_array_equal(
+            reader.column('spacegroup_number'),
+            [res['spacegroup_number'] for res in results],
+        )
+        self.assertEqual(reader.column('conv_lattice').shape, (len(results), 3, 3))
+        point_offsets = reader.point_offsets
+        label_ids = reader.column('point_label_ids')
+        self.assertEqual(point_offsets[-1], len(label_ids))
+        last_labels = [reader.labels[idx] for idx in label_ids[point_offsets[-2] :]]
+        self.assertEqual(tuple(last_labels), reader[-1]['point_labels'])
+        self.assertEqual(reader.path_offsets[-1], len(reader.column('path')))
+
+    def test_npz(self):
+        """Results are written in chunks, and memory-mapped on read."""
+        from seekpath import columnar
+
+        results = get_results()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'paths.npz')
+            self.assertEqual(columnar.write_columnar(results[:5], path, chunksize=2), 5)
+            with columnar.ColumnarWriter(path, mode='a', chunksize=4) as writer:
+                writer.extend(results[5:])
+
+            for mmap in [True, False]:
+                reader = columnar.read_columnar(path, mmap=mmap)
+                self.check_results(reader, results)
+                self.assertEqual(
+                    isinstance(reader.column('point_coords'), np.memmap), False
+                )
+            reader = columnar.read_columnar(path)
+            self.assertIsInstance(reader._chunks[0]['point_coords'], np.memmap)
+
+            # The file is a valid NPZ file
+            with np.load(path) as data:
+                np.testing.assert_array_equal(
+                    data['000000/spacegroup_number'],
+                    [res['spacegroup_number'] for res in results[:2]],
+                )
+
+            # A single chunk is memory-mapped also as a column
+            columnar.write_columnar(results, path, chunksize=100)
+            reader = columnar.read_columnar(path)
+            self.assertIsInstance(reader.column('point_coords'), np.memmap)
+            self.check_results(reader, results)
+
+    def test_output_formats(self):
+        """All output formats of get_path are accepted."""
+        import seekpath
+        from seekpath import columnar
+
+        structure = (np.eye(3) * 4.0, [[0.0, 0.0, 0.0]], [1])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'paths.npz')
+            results = [
+                seekpath.get_explicit_k_path(structure, output=output)
+                for output in ['dict', 'numpy', 'result']
+            ]
+            columnar.write_columnar(results, path)
+            reader = columnar.read_columnar(path)
+            self.check_results(reader, results)
+
+            columnar.write_columnar([], path)
+            reader = columnar.read_columnar(path)
+            self.assertEqual(len(reader), 0)
+            self.assertEqual(reader.column('point_coords').shape, (0, 3))
+            with self.assertRaises(IndexError):
+                reader.get_result(0)
+
+    def test_errors(self):
+        """Invalid parameters raise ValueError."""
+        from seekpath import columnar
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'paths.npz')
+            with self.assertRaises(ValueError):
+                columnar.ColumnarWriter(path, format='parquet')
+            with self.assertRaises(ValueError):
+                columnar.ColumnarWriter(path, mode='r')
+            columnar.write_columnar(get_results()[:1], path)
+            with self.assertRaises(ValueError):
+                columnar.read_columnar(path).column('conv_positions')
+
+    def test_hdf5(self):
+        """Results are appended to resizable HDF5 datasets."""
+        import pytest
+
+        pytest.importorskip('h5py')
+
+        from seekpath import columnar
+
+        results = get_results()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'paths.h5')
+            columnar.write_columnar(results[:5], path, chunksize=2)
+            columnar.write_columnar(results[5:8], path, mode='a')
+            with columnar.ColumnarWriter(path, mode='a', chunksize=3) as writer:
+                writer.extend(results[8:])
+            with columnar.read_columnar(path) as reader:
+                self.check_results(reader, results)
+
+            # Appending to a new file creates it
+            path = os.path.join(directory, 'new.hdf5')
+            columnar.write_columnar(results[:2], path, mode='a')
+            with columnar.read_columnar(path) as reader:
+                self.check_results(reader, results[:2])
@@ -0,0 +1,145 @@
+"""Test the collection of the diagnostics in the results."""
+
+import unittest
+
+import numpy as np
+
+
+def get_edge_case_structure():
+    """Return a tI structure with a == c, that issues an EdgeCaseWarning."""
+    cell = [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 4.0]]
+    positions = [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [0.0, 0.0, 0.1], [0.5, 0.5, 0.6]]
+    return cell, positions, [6, 6, 8, 8]
+
+
+def get_supercell_structure():
+    """Return a 2x1x1 supercell of a simple cubic structure."""
+    cell = [[8.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 4.0]]
+    return cell, [[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]], [1, 1]
+
+
+class TestDiagnostics(unittest.TestCase):
+    """Test the ``diagnostics`` parameter."""
+
+    def test_collect(self):
+        """Diagnostics are returned, and no warning is issued."""
+        import warnings
+
+        import seekpath
+
+        structure = get_edge_case_structure()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            res = seekpath.get_path(structure, diagnostics='collect')
+            res_explicit = seekpath.get_explicit_k_path(
+                structure, diagnostics='collect'
+            )
+            res_orig = seekpath.get_path_orig_cell(
+                get_supercell_structure(), diagnostics='collect'
+            )
+        # spglib can issue e.g. DeprecationWarnings, that are not diagnostics
+        categories = (seekpath.hpkot.EdgeCaseWarning, seekpath.SupercellWarning)
+        self.assertEqual([_ for _ in w if issubclass(_.category, categories)], [])
+
+        self.assertEqual(len(res['diagnostics']), 1)
+        self.assertEqual(res['diagnostics'][0]['category'], 'EdgeCaseWarning')
+        self.assertIn('a almost equal to c', res['diagnostics'][0]['message'])
+        self.assertEqual(res_explicit['diagnostics'], res['diagnostics'])
+        self.assertEqual(
+            [entry['category'] for entry in res_orig['diagnostics']],
+            ['SupercellWarning'],
+        )
+
+    def test_warn(self):
+        """By default, warnings are issued and there is no diagnostics key."""
+        import warnings
+
+        import seekpath
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            res = seekpath.get_path(get_edge_case_structure())
+        self.assertNotIn('diagnostics', res)
+        relevant_w = [
+            _ for _ in w if issubclass(_.category, seekpath.hpkot.EdgeCaseWarning)
+        ]
+        self.assertEqual(len(relevant_w), 1)
+
+    def test_result_output(self):
+        """PathResult objects expose the collected diagnostics."""
+        import seekpath
+
+        res = seekpath.get_path(
+            get_edge_case_structure(), output='result', diagnostics='collect'
+        )
+        self.assertIn('diagnostics', res)
+        self.assertEqual(res['diagnostics'][0]['category'], 'EdgeCaseWarning')
+        self.assertIn('diagnostics', res.to_dict())
+
+        res = seekpath.get_path(get_edge_case_structure(), output='result')
+        self.assertNotIn('diagnostics', res)
+        with self.assertRaises(KeyError):
+            res['diagnostics']
+
+    def test_invalid(self):
+        """Invalid values raise ValueError."""
+        import seekpath
+
+        with self.assertRaises(ValueError):
+            seekpath.get_path(get_edge_case_structure(), diagnostics='ignore')
+
+    def test_threads(self):
+        """Diagnostics are collected independently in each thread."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        import seekpath
+
+        structures = [get_edge_case_structure(), get_supercell_structure()] * 4
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda structure: seekpath.get_path_orig_cell(
+                        structure, diagnostics='collect'
+                    ),
+                    structures,
+                )
+            )
+        for idx, res in enumerate(results):
+            self.assertEqual(
+                [entry['category'] for entry in res['diagnostics']],
+                # The conventional tI cell is a supercell of the primitive one
+                ['EdgeCaseWarning', 'SupercellWarning']
+                if idx % 2 == 0
+                else ['SupercellWarning'],
+            )
+
+
+class TestThreadedBatch(unittest.TestCase):
+    """Test get_path_batch with a thread pool."""
+
+    def test_same_results(self):
+        """The threaded batch gives the same results as the sequential one."""
+        import seekpath
+
+        structures = [
+            get_edge_case_structure(),
+            get_supercell_structure(),
+            ([[3.0, 0, 0], [0, 3.0, 0], [0, 0, 5.0]], [[0, 0, 0]], [1]),
+            get_edge_case_structure(),
+        ]
+        batch = seekpath.get_path_batch(structures, diagnostics='collect')
+        batch_threaded = seekpath.get_path_batch(
+            structures, diagnostics='collect', max_workers=3
+        )
+        self.assertEqual(batch_threaded['group_indices'], batch['group_indices'])
+        for res, res_threaded in zip(batch['results'], batch_threaded['results']):
+            self.assertEqual(res_threaded['path'], res['path'])
+            self.assertEqual(res_threaded['diagnostics'], res['diagnostics'])
+            for label, coords in res['point_coords'].items():
+                np.testing.assert_array_equal(
+                    res_threaded['point_coords'][label], coords
+                )
+        self.assertEqual(len(batch['results'][2]['diagnostics']), 0)
+
+        with self.assertRaises(ValueError):
+            seekpath.get_path_batch(structures, max_workers=0)
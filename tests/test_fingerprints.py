@@ -0,0 +1,162 @@
+"""Test the structure fingerprints."""
+
+import unittest
+
+import numpy as np
+
+
+def get_structure(seed=0, num_atoms=32):
+    """Return a random orthorhombic structure with three species."""
+    rng = np.random.default_rng(seed)
+    cell = np.diag([5.0, 6.0, 7.0])
+    positions = rng.random((num_atoms, 3))
+    numbers = rng.integers(1, 4, num_atoms)
+    return cell, positions, numbers
+
+
+class TestFingerprint(unittest.TestCase):
+    """Test the invariances of seekpath.fingerprint."""
+
+    def test_invariances(self):
+        """Permutations, translations and wrapping do not change it."""
+        from seekpath import fingerprint
+
+        cell, positions, numbers = get_structure()
+        reference = fingerprint((cell, positions, numbers))
+        rng = np.random.default_rng(42)
+        for _ in range(20):
+            perm = rng.permutation(len(positions))
+            new_positions = (positions[perm] + rng.random(3)) % 1.0
+            new_positions += rng.integers(-2, 3, new_positions.shape)
+            self.assertEqual(
+                fingerprint((cell.tolist(), new_positions.tolist(), numbers[perm])),
+                reference,
+            )
+
+    def test_tolerance(self):
+        """Changes below symprec are ignored, larger ones are not."""
+        from seekpath import fingerprint
+
+        cell, positions, numbers = get_structure()
+        reference = fingerprint((cell, positions, numbers), symprec=1e-3)
+
+        moved = positions.copy()
+        moved[3] += 1e-9
+        self.assertEqual(fingerprint((cell, moved, numbers), symprec=1e-3), reference)
+        moved[3] += 0.05
+        self.assertNotEqual(
+            fingerprint((cell, moved, numbers), symprec=1e-3), reference
+        )
+        self.assertNotEqual(
+            fingerprint((cell * 1.01, positions, numbers), symprec=1e-3), reference
+        )
+        self.assertNotEqual(
+            fingerprint((cell, positions, numbers), symprec=1e-4), reference
+        )
+
+    def test_species(self):
+        """Swapping the species of two atoms changes the fingerprint."""
+        from seekpath import fingerprint
+
+        cell, positions, numbers = get_structure()
+        swapped = numbers.copy()
+        idx = np.flatnonzero(numbers != numbers[0])[0]
+        swapped[0], swapped[idx] = numbers[idx], numbers[0]
+        self.assertNotEqual(
+            fingerprint((cell, positions, swapped)),
+            fingerprint((cell, positions, numbers)),
+        )
+
+    def test_large_supercell(self):
+        """Single-species supercells do not need one candidate origin per atom."""
+        import tracemalloc
+
+        from seekpath import fingerprint
+
+        # bcc 12x12x12 supercell: all the 3456 atoms are equivalent origins
+        grid = np.stack(
+            np.meshgrid(*[np.arange(12)] * 3, indexing='ij'), axis=-1
+        ).reshape(-1, 3)
+        positions = np.concatenate([grid, grid + 0.5]) / 12
+        cell = np.eye(3) * 36.0
+        numbers = np.ones(len(positions), dtype=int)
+
+        tracemalloc.start()
+        try:
+            reference = fingerprint((cell, positions, numbers))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Trying every atom as the origin would need more than 1 GB
+        self.assertLess(peak, 32 * 2**20)
+
+        rng = np.random.default_rng(0)
+        for _ in range(3):
+            perm = rng.permutation(len(positions))
+            new_positions = (positions[perm] + rng.random(3)) % 1.0
+            self.assertEqual(
+                fingerprint((cell, new_positions, numbers[perm])), reference
+            )
+        # Removing an atom, or moving it to an interstitial site, changes it
+        self.assertNotEqual(fingerprint((cell, positions[1:], numbers[1:])), reference)
+        moved = positions.copy()
+        moved[0] += [0.5 / 12, 0.0, 0.0]
+        self.assertNotEqual(fingerprint((cell, moved, numbers)), reference)
+
+    def test_random_supercells(self):
+        """
+        The fingerprint of random supercells (with atoms equally spaced by
+        fractions of the lattice vectors, e.g. 1/2) does not depend on
+        rigid translations, also for cells that are not a multiple of symprec.
+        """
+        from seekpath import fingerprint
+
+        rng = np.random.default_rng(0)
+        # Regression: two equally spaced atoms, and an odd number of bins
+        cell = np.diag([8.00001, 4.0, 4.0])
+        positions = np.array([[0.1, 0.2, 0.3], [0.6, 0.2, 0.3]])
+        fingerprints = {
+            fingerprint((cell, (positions + rng.random(3)) % 1.0, [6, 6]))
+            for _ in range(20)
+        }
+        self.assertEqual(len(fingerprints), 1)
+
+        for _ in range(100):
+            cell = np.diag(rng.uniform(3.0, 9.0, 3)) + rng.uniform(-0.5, 0.5, (3, 3))
+            motif = rng.random((rng.integers(1, 4), 3))
+            motif_numbers = list(rng.integers(1, 4, len(motif)))
+            if rng.random() < 0.5:
+                # An atom at a special position relative to another one
+                motif = np.concatenate([motif, (motif[:1] + 0.5) % 1.0])
+                motif_numbers.append(9)
+            sizes = rng.integers(1, 4, 3)
+            shifts = np.stack(
+                np.meshgrid(*[np.arange(size) for size in sizes], indexing='ij'),
+                axis=-1,
+            ).reshape(-1, 1, 3)
+            positions = ((motif + shifts) / sizes).reshape(-1, 3)
+            numbers = np.tile(motif_numbers, len(shifts))
+            supercell = cell * sizes[:, np.newaxis]
+
+            fingerprints = set()
+            for _ in range(5):
+                perm = rng.permutation(len(positions))
+                new_positions = (
+                    positions[perm]
+                    + rng.random(3)
+                    + rng.normal(scale=1e-10, size=positions.shape)
+                ) % 1.0
+                fingerprints.add(fingerprint((supercell, new_positions, numbers[perm])))
+            self.assertEqual(len(fingerprints), 1)
+
+    def test_invalid(self):
+        """Invalid inputs raise ValueError."""
+        from seekpath import fingerprint
+
+        cell, positions, numbers = get_structure()
+        with self.assertRaises(ValueError):
+            fingerprint((cell, positions, numbers), symprec=0.0)
+        with self.assertRaises(ValueError):
+            fingerprint((cell[:2], positions, numbers))
+        with self.assertRaises(ValueError):
+            fingerprint((cell, positions, numbers[:-1]))
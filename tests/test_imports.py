@@ -0,0 +1,52 @@
+"""Test that importing seekpath is cheap."""
+
+import json
+import subprocess
+import sys
+import unittest
+
+# Time budget (in seconds) for ``import seekpath``, on top of numpy
+IMPORT_TIME_BUDGET = 0.5
+
+
+def run_in_subprocess(code):
+    """
+    Run the given python code in a fresh interpreter, and return the
+    JSON-decoded content of its standard output.
+    """
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return json.loads(output)
+
+
+class TestImports(unittest.TestCase):
+    """Test the modules imported by ``import seekpath``."""
+
+    def test_no_heavy_imports(self):
+        """``import seekpath`` should not import scipy, spglib or packaging."""
+        loaded = run_in_subprocess(
+            'import json, sys\n'
+            'import seekpath\n'
+            "print(json.dumps([name for name in ('scipy', 'spglib', 'packaging') "
+            'if name in sys.modules]))\n'
+        )
+        self.assertEqual(loaded, [])
+
+    def test_lazy_brillouinzone(self):
+        """The brillouinzone module is still accessible as an attribute."""
+        result = run_in_subprocess(
+            'import json\n'
+            'import seekpath\n'
+            'print(json.dumps(seekpath.brillouinzone.BZ.__module__))\n'
+        )
+        self.assertEqual(result, 'seekpath.brillouinzone.brillouinzone')
+
+    def test_import_time_budget(self):
+        """``import seekpath`` should take less than ``IMPORT_TIME_BUDGET``."""
+        elapsed = run_in_subprocess(
+            'import json, time\n'
+            'import numpy\n'
+            't0 = time.perf_counter()\n'
+            'import seekpath\n'
+            'print(json.dumps(time.perf_counter() - t0))\n'
+        )
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
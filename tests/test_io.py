@@ -0,0 +1,254 @@
+"""Test the structure readers."""
+
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+POSCAR_CARTESIAN = """Si, scaled by the volume
+  -40.0
+  0.0 0.5 0.5
+  0.5 0.0 0.5
+  0.5 0.5 0.0
+  Si_pv
+  2
+Selective dynamics
+Cartesian
+  0.0 0.0 0.0 T T T
+  0.25 0.25 0.25 F F F
+"""
+
+POSCAR_COMMENTS = """GaAs, with comments
+  1.0 ! scale
+  0.0 2.8 2.8 # a
+  2.8 0.0 2.8 # b
+  2.8 2.8 0.0 # c
+  Ga As ! species
+  1 1 # counts
+Direct
+  0.0 0.0 0.0
+  0.25 0.25 0.25
+"""
+
+XDATCAR = """ZnO
+  1.0
+  3.2 0.0 0.0
+  -1.6 2.7712812921102037 0.0
+  0.0 0.0 5.2
+  Zn O
+  1 1
+Direct configuration=     1
+  0.0 0.0 0.0
+  0.33 0.66 0.375
+Direct configuration=     2
+  0.01 0.0 0.0
+  0.34 0.66 0.375
+ZnO
+  1.0
+  3.3 0.0 0.0
+  -1.65 2.8578838324886476 0.0
+  0.0 0.0 5.3
+  Zn O
+  1 1
+Direct configuration=     3
+  0.02 0.0 0.0
+  0.35 0.66 0.375
+"""
+
+EXTXYZ = """2
+Lattice="0.0 2.7 2.7 2.7 0.0 2.7 2.7 2.7 0.0" Properties=species:S:1:pos:R:3:forces:R:3 pbc="T T T"
+Ga 0.0 0.0 0.0 0.1 0.0 0.0
+As 1.35 1.35 1.35 -0.1 0.0 0.0
+1
+Properties=id:I:1:species:S:1:pos:R:3 Lattice='3.0 0.0 0.0 0.0 3.0 0.0 0.0 0.0 3.0'
+7 Po 0.0 0.0 0.0
+"""
+
+CIF = """# Iron, bcc, with the symmetry operations of the centering only
+data_Fe
+_cell_length_a 2.8665(2)
+_cell_length_b 2.8665(2)
+_cell_length_c 2.8665(2)
+_cell_angle_alpha 90
+_cell_angle_beta 90
+_cell_angle_gamma 90
+_symmetry_space_group_name_H-M 'I m -3 m'
+loop_
+_symmetry_equiv_pos_as_xyz
+'x, y, z'
+'x+1/2, y+1/2, z+1/2'
+'-x, -y, -z'
+loop_
+_atom_site_label
+_atom_site_type_symbol
+_atom_site_fract_x
+_atom_site_fract_y
+_atom_site_fract_z
+_atom_site_occupancy
+Fe1 Fe 0.0 0.0 0.0 1.0
+
+data_NaCl
+_cell_length_a 5.64
+_cell_length_b 5.64
+_cell_length_c 5.64
+_cell_angle_alpha 90.0
+_cell_angle_beta 90.0
+_cell_angle_gamma 90.0
+_chemical_name_common
+;
+rock salt
+;
+loop_
+_atom_site_label
+_atom_site_fract_x
+_atom_site_fract_y
+_atom_site_fract_z
+Na1 0.0 0.0 0.0
+Na2 0.0 0.5 0.5
+Na3 0.5 0.0 0.5
+Na4 0.5 0.5 0.0
+Cl1 0.5 0.5 0.5
+Cl2 0.5 0.0 0.0
+Cl3 0.0 0.5 0.0
+Cl4 0.0 0.0 0.5
+"""
+
+
+class TestReaders(unittest.TestCase):
+    """Test the readers of each format."""
+
+    def test_poscar(self):
+        """The POSCARs of the band_path_data are read as by the tests."""
+        import glob
+
+        from test_paths_hpkot import simple_read_poscar
+
+        import seekpath
+        from seekpath import io as seekpath_io
+
+        pattern = os.path.join(
+            os.path.dirname(seekpath.__file__),
+            'hpkot',
+            'band_path_data',
+            '*',
+            'POSCAR*',
+        )
+        for path in glob.glob(pattern):
+            cell, positions, numbers = seekpath_io.read_poscar(path)
+            cell_ref, positions_ref, numbers_ref = simple_read_poscar(path)
+            np.testing.assert_allclose(cell, cell_ref)
+            np.testing.assert_allclose(positions, positions_ref)
+            self.assertEqual(numbers.tolist(), numbers_ref)
+
+    def test_poscar_cartesian(self):
+        """Cartesian coordinates and volume scaling are supported."""
+        from seekpath import io as seekpath_io
+
+        cell, positions, numbers = seekpath_io.read_poscar(
+            io.StringIO(POSCAR_CARTESIAN)
+        )
+        self.assertAlmostEqual(abs(np.linalg.det(cell)), 40.0)
+        np.testing.assert_allclose(positions, [[0, 0, 0], [0.25, 0.25, 0.25]])
+        self.assertEqual(numbers.tolist(), [14, 14])
+
+    def test_poscar_comments(self):
+        """Trailing comments of the header lines are ignored."""
+        from seekpath import io as seekpath_io
+
+        cell, positions, numbers = seekpath_io.read_poscar(io.StringIO(POSCAR_COMMENTS))
+        np.testing.assert_allclose(cell, 2.8 * (np.ones((3, 3)) - np.eye(3)))
+        np.testing.assert_allclose(positions, [[0, 0, 0], [0.25, 0.25, 0.25]])
+        self.assertEqual(numbers.tolist(), [31, 33])
+
+    def test_xdatcar(self):
+        """All frames are read, also with a variable cell."""
+        from seekpath import io as seekpath_io
+
+        frames = list(seekpath_io.iter_xdatcar(io.StringIO(XDATCAR)))
+        self.assertEqual(len(frames), 3)
+        self.assertAlmostEqual(frames[1][1][0, 0], 0.01)
+        self.assertAlmostEqual(frames[2][0][0, 0], 3.3)
+        self.assertEqual(frames[2][2].tolist(), [30, 8])
+
+    def test_extxyz(self):
+        """Cartesian positions are converted to scaled ones."""
+        from seekpath import io as seekpath_io
+
+        frames = list(seekpath_io.iter_extxyz(io.StringIO(EXTXYZ)))
+        self.assertEqual(len(frames), 2)
+        np.testing.assert_allclose(frames[0][1], [[0, 0, 0], [0.25, 0.25, 0.25]])
+        self.assertEqual(frames[0][2].tolist(), [31, 33])
+        np.testing.assert_allclose(frames[1][0], 3.0 * np.eye(3))
+        self.assertEqual(frames[1][2].tolist(), [84])
+
+    def test_cif(self):
+        """Data blocks are read, and sites are expanded by symmetry."""
+        import seekpath
+        from seekpath import io as seekpath_io
+
+        iron, salt = seekpath_io.iter_cif(io.StringIO(CIF))
+        np.testing.assert_allclose(iron[0], 2.8665 * np.eye(3), atol=1e-12)
+        np.testing.assert_allclose(iron[1], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        self.assertEqual(iron[2].tolist(), [26, 26])
+        self.assertEqual(seekpath.get_path(iron)['bravais_lattice'], 'cI')
+
+        self.assertEqual(salt[2].tolist(), [11] * 4 + [17] * 4)
+        self.assertEqual(seekpath.get_path(salt)['bravais_lattice'], 'cF')
+
+    def test_symbols_to_numbers(self):
+        """Species labels are mapped to atomic numbers."""
+        from seekpath import io as seekpath_io
+
+        self.assertEqual(
+            seekpath_io.symbols_to_numbers(
+                ['Fe', 'FE', 'Fe_pv', 'O2-', 'C1', 'Ca']
+            ).tolist(),
+            [26, 26, 26, 8, 6, 20],
+        )
+        with self.assertRaises(ValueError):
+            seekpath_io.symbols_to_numbers(['Xx'])
+
+
+class TestIterStructures(unittest.TestCase):
+    """Test seekpath.io.iter_structures."""
+
+    def test_directory_and_glob(self):
+        """Files are read in order, from directories and glob patterns."""
+        from seekpath import io as seekpath_io
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, content in [
+                ('a.cif', CIF),
+                ('b_XDATCAR', XDATCAR),
+                ('c.xyz', EXTXYZ),
+                ('d_POSCAR', POSCAR_CARTESIAN),
+            ]:
+                with open(os.path.join(directory, name), 'w') as handle:
+                    handle.write(content)
+
+            for prefetch in [0, 1, 16]:
+                structures = list(
+                    seekpath_io.iter_structures(directory, prefetch=prefetch)
+                )
+                self.assertEqual(
+                    [len(numbers) for _, _, numbers in structures],
+                    [2, 8, 2, 2, 2, 2, 1, 2],
+                )
+            structures = list(
+                seekpath_io.iter_structures(os.path.join(directory, '*.xyz'))
+            )
+            self.assertEqual(len(structures), 2)
+
+            # Stopping early does not block
+            iterator = seekpath_io.iter_structures(directory, prefetch=1)
+            next(iterator)
+            iterator.close()
+
+            with open(os.path.join(directory, 'e.xyz'), 'w') as handle:
+                handle.write('2\nProperties=species:S:1:pos:R:3\nH 0 0 0\nH 1 0 0\n')
+            with self.assertRaises(ValueError):
+                list(seekpath_io.iter_structures(directory))
+            with self.assertRaises(ValueError):
+                list(seekpath_io.iter_structures(os.path.join(directory, '*.none')))
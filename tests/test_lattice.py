@@ -0,0 +1,76 @@
+"""Test the Lattice class."""
+
+import unittest
+
+import numpy as np
+
+from seekpath.lattice import Lattice
+
+
+class TestLattice(unittest.TestCase):
+    """Test the Lattice class."""
+
+    cell = ((4.0, 0.1, 0.2), (0.3, 5.0, 0.4), (0.5, 0.6, 6.0))
+
+    def test_reciprocal(self):
+        """Test the reciprocal lattice and its caching."""
+        lattice = Lattice(self.cell)
+        np.testing.assert_array_almost_equal(
+            np.dot(lattice.cell, lattice.reciprocal.T), 2.0 * np.pi * np.eye(3)
+        )
+        self.assertIs(lattice.reciprocal, lattice.reciprocal)
+        np.testing.assert_array_almost_equal(
+            lattice.reciprocal_lattice.reciprocal, self.cell
+        )
+        np.testing.assert_array_almost_equal(
+            Lattice.from_reciprocal(lattice.reciprocal).cell, self.cell
+        )
+        np.testing.assert_array_almost_equal(
+            lattice.reciprocal_metric, np.linalg.inv(lattice.metric) * 4 * np.pi**2
+        )
+
+    def test_cell_params(self):
+        """Test the cell parameters."""
+        from math import sqrt
+
+        lattice = Lattice([[2.0, 0.0, 0.0], [1.0, sqrt(3.0), 0.0], [0.0, 0.0, 5.0]])
+        a, b, c, cosalpha, cosbeta, cosgamma = lattice.cell_params
+        self.assertAlmostEqual(a, 2.0)
+        self.assertAlmostEqual(b, 2.0)
+        self.assertAlmostEqual(c, 5.0)
+        self.assertAlmostEqual(cosalpha, 0.0)
+        self.assertAlmostEqual(cosbeta, 0.0)
+        self.assertAlmostEqual(cosgamma, 0.5)
+        self.assertAlmostEqual(lattice.volume, 10.0 * sqrt(3.0))
+
+    def test_stack(self):
+        """A stack of cells gives the same results as the individual cells."""
+        cells = np.array([self.cell, np.eye(3) * 3.0, np.array(self.cell) * 2.0])
+        stack = Lattice(cells)
+        self.assertTrue(stack.is_stack)
+        self.assertEqual(len(stack), 3)
+        params = np.array(stack.cell_params).T
+        for idx, cell in enumerate(cells):
+            single = Lattice(cell)
+            np.testing.assert_array_almost_equal(
+                stack.reciprocal[idx], single.reciprocal
+            )
+            np.testing.assert_array_almost_equal(stack.metric[idx], single.metric)
+            np.testing.assert_array_almost_equal(params[idx], single.cell_params)
+            np.testing.assert_array_almost_equal(stack[idx].cell, cell)
+
+    def test_conversions(self):
+        """Test the conversions between Cartesian and scaled coordinates."""
+        lattice = Lattice(self.cell)
+        frac = np.array([[0.1, 0.2, 0.3], [0.5, 0.5, 0.0]])
+        np.testing.assert_array_almost_equal(
+            lattice.to_fractional(lattice.to_cartesian(frac)), frac
+        )
+        np.testing.assert_array_almost_equal(
+            lattice.kpoints_to_fractional(lattice.kpoints_to_cartesian(frac)), frac
+        )
+
+    def test_invalid_shape(self):
+        """An invalid shape raises a ValueError."""
+        with self.assertRaises(ValueError):
+            Lattice([[1.0, 0.0], [0.0, 1.0]])
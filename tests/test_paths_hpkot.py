@@ -1,6 +1,8 @@
 """Test the HPKOT paths."""
 
 # pylint: disable=invalid-name,too-many-public-methods
+import itertools
+
 import numpy as np
 import unittest
 from seekpath.util import atoms_num_dict
@@ -156,6 +158,7 @@ class TestExplicitPaths(unittest.TestCase):
                 'reciprocal_primitive_lattice',
                 'spacegroup_international',
                 'spacegroup_number',
+                'transformation_matrix',
                 'volume_original_wrt_conv',
                 'volume_original_wrt_prim',
             ]
@@ -169,6 +172,65 @@ class TestExplicitPaths(unittest.TestCase):
             )
 
 
+class TestTransformationMatrix(unittest.TestCase):
+    """Test the transformation matrix from the original to the conventional cell."""
+
+    def base_test(self, system):
+        """
+        Check that the ``transformation_matrix`` and ``rotation_matrix`` map
+        the input cell onto the conventional cell.
+
+        :param system: a tuple ``(cell, positions, numbers)``
+        """
+        from seekpath import hpkot
+
+        res = hpkot.get_path(system)
+        T = res['transformation_matrix']
+
+        # (a_conv, b_conv, c_conv) = R (a, b, c) T^-1, with vectors as columns
+        conv_lattice = (
+            np.linalg.inv(T).T @ np.array(system[0]) @ res['rotation_matrix'].T
+        )
+        np.testing.assert_array_almost_equal(conv_lattice, res['conv_lattice'])
+        np.testing.assert_array_almost_equal(T, np.rint(T))
+
+        return res
+
+    def test_aP(self):
+        """
+        Test a triclinic cell given in a non-reduced basis: the Niggli
+        reduction must be included in the transformation matrix.
+        """
+        cell = [[4.0, 0.1, 0.2], [0.3, 5.0, 0.4], [0.5, 0.6, 6.0]]
+        positions = [[0.0, 0.0, 0.0], [0.1, 0.2, 0.3]]
+        atomic_numbers = [1, 2]
+
+        T = np.array([[1, 1, 0], [0, 1, 0], [2, 1, 1]])
+        system = (T @ cell, positions @ np.linalg.inv(T), atomic_numbers)
+
+        res = self.base_test(system)
+        self.assertEqual(res['bravais_lattice'], 'aP')
+        self.assertAlmostEqual(abs(np.linalg.det(res['transformation_matrix'])), 1.0)
+
+    def test_aP_supercell(self):
+        """
+        Test a 1*2*1 supercell of a triclinic cell.
+        """
+        cell = [[4.0, 0.1, 0.2], [0.3, 5.0, 0.4], [0.5, 0.6, 6.0]]
+        positions = [[0.0, 0.0, 0.0], [0.1, 0.2, 0.3]]
+        atomic_numbers = [1, 2]
+
+        T = np.array([[1, 0, 0], [0, 2, 0], [0, 0, 1]])
+        supercell_positions = np.concatenate(
+            [positions, np.array(positions) + [0, 1, 0]]
+        ) @ np.linalg.inv(T)
+        system = (T @ cell, supercell_positions, atomic_numbers * 2)
+
+        res = self.base_test(system)
+        self.assertEqual(res['bravais_lattice'], 'aP')
+        self.assertAlmostEqual(res['volume_original_wrt_conv'], 2.0)
+
+
 class TestPaths3D_HPKOT_EdgeCases(unittest.TestCase):
     """
     Test the warnings issued for edge cases
@@ -1025,6 +1087,140 @@ class TestPaths3D_HPKOT_Orig_Cell(unittest.TestCase):
         np.testing.assert_almost_equal(res_standard['point_coords']['R'], xk_R)
         self.assertGreater(np.sum(abs(res_original['point_coords']['R'] - xk_R)), 1e-7)
 
+    def test_kpoint_transformation_matrix(self):
+        """
+        Test that the k-point transformation operator maps a uniform mesh
+        as the explicit Cartesian round trip does.
+        """
+        cell = [[0.0, 2.5, 2.5], [2.5, 0.0, 2.5], [2.5, 2.5, 0.0]]
+        rot = np.array(
+            [
+                [np.cos(0.3), -np.sin(0.3), 0.0],
+                [np.sin(0.3), np.cos(0.3), 0.0],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+        cell = (np.array(cell) @ rot.T).tolist()
+        system = (cell, [[0.0, 0.0, 0.0]], [14])
+
+        import seekpath
+        from seekpath import get_kpoint_transformation_orig_cell
+
+        res = seekpath.get_path(system)
+        res_original = seekpath.get_path_orig_cell(system)
+        operator = get_kpoint_transformation_orig_cell(res, cell)
+        np.testing.assert_array_almost_equal(
+            res_original['kpoint_transformation_matrix'], operator
+        )
+
+        mesh = np.stack(
+            np.meshgrid(*[np.linspace(0, 1, 5, endpoint=False)] * 3, indexing='ij'),
+            axis=-1,
+        ).reshape(-1, 3)
+        cart = mesh @ np.array(res['reciprocal_primitive_lattice'])
+        cart_orig = cart @ res['rotation_matrix']
+        expected = cart_orig @ np.array(cell).T / (2.0 * np.pi)
+        np.testing.assert_array_almost_equal(mesh @ operator, expected)
+
+        for label, coords in res['point_coords'].items():
+            np.testing.assert_array_almost_equal(
+                res_original['point_coords'][label], np.dot(coords, operator)
+            )
+
+
+class TestPathOrigCellSupercells(unittest.TestCase):
+    """Test get_path_orig_cell_supercells against get_path_orig_cell."""
+
+    @staticmethod
+    def make_supercell(structure, supercell_matrix):
+        """Return the supercell of structure for the given integer matrix."""
+        cell, positions, numbers = structure
+        supercell_matrix = np.array(supercell_matrix)
+        inv_matrix = np.linalg.inv(supercell_matrix)
+        supercell_positions = []
+        supercell_numbers = []
+        shifts = range(-3, 4)
+        for shift in itertools.product(shifts, shifts, shifts):
+            for position, number in zip(positions, numbers):
+                scaled = np.dot(np.add(position, shift), inv_matrix)
+                if np.all(scaled > -1e-8) and np.all(scaled < 1.0 - 1e-8):
+                    supercell_positions.append(scaled.tolist())
+                    supercell_numbers.append(number)
+        return (
+            np.dot(supercell_matrix, cell).tolist(),
+            supercell_positions,
+            supercell_numbers,
+        )
+
+    def test_fcc(self):
+        """
+        The paths must be the same as those of get_path_orig_cell, called
+        on each supercell.
+        """
+        import warnings
+
+        import seekpath
+
+        cell = [[-3.0, 0.0, 3.0], [0.0, 3.0, 3.0], [-3.0, 3.0, 0.0]]
+        structure = (cell, [[0.0, 0.0, 0.0], [0.25, 0.25, 0.25]], [14, 14])
+        supercell_matrices = [
+            np.eye(3, dtype=int),
+            np.diag([2, 2, 2]),
+            [[1, 1, 0], [0, 1, 0], [0, 0, 2]],
+            [[-1, 1, 1], [1, -1, 1], [1, 1, -1]],
+        ]
+
+        res = seekpath.get_path(structure)
+        results = seekpath.get_path_orig_cell_supercells(res, supercell_matrices, cell)
+        results_numpy = seekpath.get_path_orig_cell_supercells(
+            res, supercell_matrices, cell, output='numpy'
+        )
+        self.assertEqual(len(results), len(supercell_matrices))
+
+        for supercell_matrix, res_super, res_numpy in zip(
+            supercell_matrices, results, results_numpy
+        ):
+            supercell = self.make_supercell(structure, supercell_matrix)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', seekpath.SupercellWarning)
+                res_ref = seekpath.get_path_orig_cell(supercell)
+
+            self.assertEqual(sorted(res_super), sorted(res_ref))
+            self.assertEqual(res_super['path'], res_ref['path'])
+            self.assertEqual(res_super['is_supercell'], res_ref['is_supercell'])
+            self.assertEqual(
+                list(res_super['point_coords']), list(res_ref['point_coords'])
+            )
+            for label, coords in res_ref['point_coords'].items():
+                np.testing.assert_array_almost_equal(
+                    res_super['point_coords'][label], coords
+                )
+            np.testing.assert_array_almost_equal(
+                res_super['kpoint_transformation_matrix'],
+                res_ref['kpoint_transformation_matrix'],
+            )
+            np.testing.assert_array_equal(
+                res_numpy['point_coords'],
+                [
+                    res_super['point_coords'][label]
+                    for label in res_numpy['point_labels']
+                ],
+            )
+
+    def test_invalid_matrices(self):
+        """Non-integer or singular supercell matrices are rejected."""
+        import seekpath
+
+        cell = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        res = seekpath.get_path((cell, [[0.0, 0.0, 0.0]], [1]))
+        for matrices in [
+            [np.eye(3) * 1.5],
+            [np.zeros((3, 3), dtype=int)],
+            np.ones((2, 2, 2), dtype=int),
+        ]:
+            with self.assertRaises(ValueError):
+                seekpath.get_path_orig_cell_supercells(res, matrices, cell)
+
 
 class TestExplicitPaths_Orig_Cell(unittest.TestCase):
     """Test the creation of explicit paths for the original cell."""
@@ -1148,3 +1344,61 @@ class TestExplicitPaths_Orig_Cell(unittest.TestCase):
             np.testing.assert_array_almost_equal(
                 k_abs, k_abs_standard @ res_standard['rotation_matrix']
             )
+
+
+class TestLatticeCache(unittest.TestCase):
+    """Test the memo of the special points and paths of hpkot.get_path."""
+
+    def setUp(self):
+        from seekpath.hpkot import tools
+
+        tools.clear_lattice_cache()
+
+    def test_hits(self):
+        """Structures with the same lattice share the memoized points."""
+        from seekpath.hpkot import get_path, tools
+
+        cell = [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 5.0]]
+        res1 = get_path((cell, [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]], [1, 2]))
+        res2 = get_path((cell, [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]], [3, 4]))
+        info = tools.get_lattice_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['size']), (1, 1, 1))
+
+        self.assertEqual(res1['point_coords'], res2['point_coords'])
+        self.assertEqual(res1['path'], res2['path'])
+
+        # The results are independent objects
+        res1['point_coords']['GAMMA'][0] = 1.0
+        res1['path'].append(('X', 'X'))
+        res3 = get_path((cell, [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]], [5, 6]))
+        self.assertEqual(res3['point_coords']['GAMMA'], [0.0, 0.0, 0.0])
+        self.assertEqual(res3['path'], res2['path'])
+
+    def test_augmented_path(self):
+        """The time-reversal flag is part of the key."""
+        from seekpath.hpkot import get_path, tools
+
+        cell = [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 5.0]]
+        # No inversion symmetry (P4mm)
+        structure = (cell, [[0.0, 0.0, 0.0], [0.5, 0.5, 0.4]], [1, 2])
+        res = get_path(structure, with_time_reversal=True)
+        res_augmented = get_path(structure, with_time_reversal=False)
+        self.assertEqual(tools.get_lattice_cache_info()['misses'], 2)
+        self.assertFalse(res['augmented_path'])
+        self.assertTrue(res_augmented['augmented_path'])
+        self.assertEqual(len(res_augmented['path']), 2 * len(res['path']))
+
+    def test_same_as_evaluation(self):
+        """Cached points are the same as those evaluated directly."""
+        from seekpath.hpkot import tools
+
+        cell_params = (4.1, 5.3, 6.2, 0.1, -0.2, 0.05)
+        for _ in range(2):
+            points, path = tools.get_points_and_path(
+                'mC3', cell_params, with_time_reversal=False, has_inv=False
+            )
+            self.assertEqual(
+                (points, path),
+                tools.evaluate_points_and_path('mC3', cell_params, True),
+            )
+        self.assertEqual(tools.get_lattice_cache_info()['hits'], 1)
@@ -0,0 +1,166 @@
+"""Test the PathResult output type."""
+
+import pickle
+import unittest
+
+import numpy as np
+
+
+def get_system():
+    """Return a simple non-standard fcc system."""
+    cell = [[-3.0, 0.0, 3.0], [0.0, 3.0, 3.0], [-3.0, 3.0, 0.0]]
+    positions = [[0.0, 0.0, 0.0], [0.25, 0.25, 0.25]]
+    atomic_numbers = [1, 1]
+    return (cell, positions, atomic_numbers)
+
+
+class TestPathResult(unittest.TestCase):
+    """Test that PathResult is equivalent to the dictionary output."""
+
+    def assert_same_content(self, res_dict, res_obj):
+        """Check that the dictionary and the PathResult have the same content."""
+        self.assertEqual(list(res_obj.keys()), list(res_dict.keys()))
+        for key, value in res_dict.items():
+            if key == 'point_coords':
+                self.assertEqual(list(res_obj[key]), list(value))
+                for label, coords in value.items():
+                    np.testing.assert_array_almost_equal(res_obj[key][label], coords)
+            elif key in [
+                'path',
+                'explicit_kpoints_labels',
+                'explicit_segments',
+            ] or isinstance(value, str):
+                self.assertEqual(res_obj[key], value)
+            else:
+                np.testing.assert_array_almost_equal(res_obj[key], value)
+
+    def test_get_path(self):
+        """Compare the output of get_path."""
+        import seekpath
+
+        res_dict = seekpath.get_path(get_system(), with_time_reversal=False)
+        res_obj = seekpath.get_path(
+            get_system(), with_time_reversal=False, output='result'
+        )
+
+        self.assertIsInstance(res_obj, seekpath.PathResult)
+        self.assert_same_content(res_dict, res_obj)
+        self.assertNotIn('explicit_kpoints_abs', res_obj)
+        with self.assertRaises(KeyError):
+            res_obj['explicit_kpoints_abs']  # pylint: disable=pointless-statement
+
+    def test_get_explicit_k_path(self):
+        """Compare the output of get_explicit_k_path."""
+        import seekpath
+
+        res_dict = seekpath.get_explicit_k_path(get_system())
+        res_obj = seekpath.get_explicit_k_path(get_system(), output='result')
+
+        self.assert_same_content(res_dict, res_obj)
+        self.assert_same_content(res_dict, res_obj.to_dict())
+
+    def test_slots_and_cache(self):
+        """No per-instance dictionary, and derived fields are cached."""
+        import seekpath
+
+        res = seekpath.get_path(get_system(), output='result')
+        self.assertFalse(hasattr(res, '__dict__'))
+        self.assertIs(
+            res['reciprocal_primitive_lattice'], res['reciprocal_primitive_lattice']
+        )
+        self.assertTrue(res.conv_positions.flags['C_CONTIGUOUS'])
+        self.assertEqual(res.point_coords_array.shape, (len(res.point_labels), 3))
+        self.assertEqual(res.path_indices.shape, (len(res['path']), 2))
+
+    def test_pickle(self):
+        """PathResult can be pickled."""
+        import seekpath
+
+        res = seekpath.get_explicit_k_path(get_system(), output='result')
+        res_unpickled = pickle.loads(pickle.dumps(res))
+        self.assert_same_content(res.to_dict(), res_unpickled)
+
+    def test_invalid_output(self):
+        """An invalid value for output raises a ValueError."""
+        import seekpath
+
+        with self.assertRaises(ValueError):
+            seekpath.get_path(get_system(), output='invalid')
+
+
+class TestNumpyOutput(unittest.TestCase):
+    """Test the 'numpy' output format."""
+
+    def assert_same_points(self, res_dict, res_numpy):
+        """Check that points and path are the same in the two formats."""
+        labels = res_numpy['point_labels']
+        self.assertIsInstance(labels, tuple)
+        self.assertEqual(list(labels), list(res_dict['point_coords']))
+        self.assertEqual(res_numpy['point_coords'].shape, (len(labels), 3))
+        for label, coords in zip(labels, res_numpy['point_coords']):
+            np.testing.assert_array_almost_equal(
+                coords, res_dict['point_coords'][label]
+            )
+        self.assertEqual(res_numpy['path'].shape, (len(res_dict['path']), 2))
+        self.assertEqual(
+            [(labels[start], labels[stop]) for start, stop in res_numpy['path']],
+            list(res_dict['path']),
+        )
+
+    def test_get_path(self):
+        """Compare get_path with the 'dict' and 'numpy' outputs."""
+        import seekpath
+
+        res_dict = seekpath.get_path(get_system(), with_time_reversal=False)
+        res_numpy = seekpath.get_path(
+            get_system(), with_time_reversal=False, output='numpy'
+        )
+
+        self.assert_same_points(res_dict, res_numpy)
+        self.assertIsInstance(res_numpy['reciprocal_primitive_lattice'], np.ndarray)
+        np.testing.assert_array_almost_equal(
+            res_numpy['reciprocal_primitive_lattice'],
+            res_dict['reciprocal_primitive_lattice'],
+        )
+
+    def test_get_explicit_k_path(self):
+        """Compare get_explicit_k_path with the 'dict' and 'numpy' outputs."""
+        import seekpath
+
+        res_dict = seekpath.get_explicit_k_path(get_system())
+        res_numpy = seekpath.get_explicit_k_path(get_system(), output='numpy')
+
+        self.assert_same_points(res_dict, res_numpy)
+        self.assertEqual(
+            res_numpy['explicit_kpoints_labels'], res_dict['explicit_kpoints_labels']
+        )
+        self.assertEqual(
+            res_numpy['explicit_segments'].tolist(),
+            [list(segment) for segment in res_dict['explicit_segments']],
+        )
+        for key in ['explicit_kpoints_abs', 'explicit_kpoints_rel']:
+            np.testing.assert_array_equal(res_numpy[key], res_dict[key])
+
+    def test_get_explicit_k_path_orig_cell(self):
+        """Compare get_explicit_k_path_orig_cell in the two formats."""
+        import warnings
+
+        import seekpath
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', seekpath.SupercellWarning)
+            res_dict = seekpath.get_explicit_k_path_orig_cell(get_system())
+            res_numpy = seekpath.get_explicit_k_path_orig_cell(
+                get_system(), output='numpy'
+            )
+
+        self.assert_same_points(res_dict, res_numpy)
+        for key in ['explicit_kpoints_abs', 'explicit_kpoints_rel']:
+            np.testing.assert_array_almost_equal(res_numpy[key], res_dict[key])
+
+    def test_invalid_output_orig_cell(self):
+        """The 'result' output is not available for the original cell."""
+        import seekpath
+
+        with self.assertRaises(ValueError):
+            seekpath.get_path_orig_cell(get_system(), output='result')
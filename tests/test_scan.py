@@ -0,0 +1,91 @@
+"""Test the scan of the symmetry tolerance."""
+
+import unittest
+
+import numpy as np
+
+
+def get_noisy_structure():
+    """
+    Return a noisy, slightly tetragonal CsCl-like structure, whose symmetry
+    depends on the tolerance.
+    """
+    rng = np.random.default_rng(0)
+    a = 4.0
+    cell = np.diag([a, a, a * 1.001]) + rng.normal(scale=1e-4, size=(3, 3))
+    positions = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]])
+    positions += rng.normal(scale=3e-3, size=(2, 3))
+    return cell.tolist(), positions.tolist(), [11, 17]
+
+
+class TestScanSymprec(unittest.TestCase):
+    """Test seekpath.scan_symprec."""
+
+    def test_noisy(self):
+        """The scan gives the same results as get_path for each tolerance."""
+        import warnings
+
+        import seekpath
+
+        structure = get_noisy_structure()
+        symprecs = [1e-1, 1e-5, 1e-4, 1e-3, 5e-3, 1e-2, 5e-2]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', seekpath.hpkot.EdgeCaseWarning)
+            scan = seekpath.scan_symprec(structure, symprecs=symprecs)
+
+            self.assertEqual(
+                [entry['symprec'] for entry in scan['scan']], sorted(symprecs)
+            )
+            for entry in scan['scan']:
+                res = seekpath.get_path(structure, symprec=entry['symprec'])
+                res_scan = scan['results'][entry['result_index']]
+                for key in [
+                    'spacegroup_number',
+                    'spacegroup_international',
+                    'bravais_lattice',
+                    'bravais_lattice_extended',
+                    'path',
+                ]:
+                    self.assertEqual(entry[key], res[key])
+                    self.assertEqual(res_scan[key], res[key])
+                for label, coords in res['point_coords'].items():
+                    np.testing.assert_allclose(res_scan['point_coords'][label], coords)
+
+        # The path is computed once per distinct symmetry
+        self.assertEqual(
+            len(scan['results']),
+            len({entry['spacegroup_number'] for entry in scan['scan']}),
+        )
+        self.assertLess(len(scan['results']), len(symprecs))
+
+        # Intervals cover all tolerances, in order, and have distinct
+        # spacegroups from their neighbours
+        intervals = scan['intervals']
+        self.assertEqual(sum(interval['num_symprecs'] for interval in intervals), 7)
+        self.assertEqual(intervals[0]['symprec_min'], 1e-5)
+        self.assertEqual(intervals[-1]['symprec_max'], 1e-1)
+        self.assertEqual(intervals[0]['spacegroup_number'], 1)
+        self.assertEqual(intervals[-1]['spacegroup_number'], 221)
+        for interval, next_interval in zip(intervals[:-1], intervals[1:]):
+            self.assertLess(interval['symprec_max'], next_interval['symprec_min'])
+            self.assertNotEqual(
+                interval['spacegroup_number'], next_interval['spacegroup_number']
+            )
+
+    def test_ideal(self):
+        """For an ideal structure, there is a single interval and result."""
+        import seekpath
+
+        structure = ([[4.0, 0, 0], [0, 4.0, 0], [0, 0, 4.0]], [[0, 0, 0]], [1])
+        scan = seekpath.scan_symprec(structure)
+        self.assertEqual(len(scan['scan']), len(seekpath.scan.DEFAULT_SYMPRECS))
+        self.assertEqual(len(scan['results']), 1)
+        self.assertEqual(len(scan['intervals']), 1)
+        self.assertEqual(scan['intervals'][0]['bravais_lattice_extended'], 'cP2')
+
+    def test_invalid(self):
+        """Non-positive tolerances raise ValueError."""
+        import seekpath
+
+        with self.assertRaises(ValueError):
+            seekpath.scan_symprec(get_noisy_structure(), symprecs=[1e-3, 0.0])
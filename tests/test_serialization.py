@@ -0,0 +1,82 @@
+"""Test the JSON serialization of the results."""
+
+import json
+import unittest
+
+import numpy as np
+
+
+def assert_same_result(testcase, res, res_ref):
+    """Check that two results have the same keys, values and types."""
+    testcase.assertEqual(list(res), list(res_ref))
+    for key, value_ref in res_ref.items():
+        value = res[key]
+        if isinstance(value_ref, np.ndarray):
+            testcase.assertIsInstance(value, np.ndarray)
+            testcase.assertEqual(value.dtype, value_ref.dtype)
+            np.testing.assert_array_equal(value, value_ref)
+        else:
+            testcase.assertEqual(value, value_ref, msg=key)
+            if not isinstance(value_ref, np.generic):
+                testcase.assertIs(type(value), type(value_ref), msg=key)
+
+
+class TestSerialization(unittest.TestCase):
+    """Test seekpath.to_jsonable and seekpath.from_jsonable."""
+
+    structure = (
+        [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 6.0]],
+        [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]],
+        [1, 1],
+    )
+
+    def test_round_trip(self):
+        """Results round-trip through JSON without losses."""
+        import seekpath
+
+        for output in ['dict', 'numpy']:
+            res = seekpath.get_explicit_k_path(
+                self.structure, output=output, diagnostics='collect'
+            )
+            for compact in [True, False]:
+                data = json.loads(
+                    json.dumps(seekpath.to_jsonable(res, compact=compact))
+                )
+                assert_same_result(self, seekpath.from_jsonable(data), res)
+
+        res = seekpath.get_path_orig_cell(self.structure, diagnostics='collect')
+        data = json.loads(json.dumps(seekpath.to_jsonable(res)))
+        assert_same_result(self, seekpath.from_jsonable(data), res)
+
+    def test_path_result(self):
+        """PathResult objects are serialized as their dictionary."""
+        import seekpath
+
+        res = seekpath.get_path(self.structure, output='result')
+        data = json.loads(json.dumps(seekpath.to_jsonable(res)))
+        assert_same_result(self, seekpath.from_jsonable(data), res.to_dict())
+
+    def test_arrays(self):
+        """Arrays keep dtype and shape, and decoded arrays are writable."""
+        import seekpath
+
+        res = {
+            'float': np.arange(6.0).reshape(2, 3).T,
+            'big_endian': np.arange(4, dtype='>i4'),
+            'empty': np.zeros((0, 3)),
+            'bool': np.array([True, False]),
+            'scalar': np.float64(1.0) / 3.0,
+        }
+        for compact in [True, False]:
+            data = seekpath.to_jsonable(res, compact=compact)
+            self.assertEqual(data['scalar'], 1.0 / 3.0)
+            decoded = seekpath.from_jsonable(json.loads(json.dumps(data)))
+            for key in ['float', 'big_endian', 'empty', 'bool']:
+                np.testing.assert_array_equal(decoded[key], res[key])
+                self.assertEqual(decoded[key].shape, res[key].shape)
+                self.assertTrue(decoded[key].flags.writeable)
+            self.assertEqual(decoded['bool'].dtype, bool)
+
+        self.assertIsInstance(seekpath.to_jsonable(res)['float']['__ndarray__'], str)
+        with self.assertRaises(TypeError):
+            seekpath.to_jsonable({'set': {1, 2}})
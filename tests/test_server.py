@@ -0,0 +1,173 @@
+"""Test the k-path HTTP service."""
+
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+STRUCTURE = {
+    'cell': [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 6.0]],
+    'positions': [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]],
+    'numbers': [1, 1],
+}
+
+
+class TestKPathService(unittest.TestCase):
+    """Test seekpath.server.KPathService."""
+
+    def test_cache_and_coalescing(self):
+        """Identical requests are computed once."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest import mock
+
+        from seekpath import server
+
+        started = threading.Event()
+        release = threading.Event()
+        compute = server._compute
+
+        def slow_compute(endpoint, request):
+            started.set()
+            release.wait(10)
+            return compute(endpoint, request)
+
+        service = server.KPathService(max_workers=2)
+        request = {'structure': STRUCTURE, 'symprec': 1e-3}
+        patch = mock.patch.object(server, '_compute', slow_compute)
+        with patch, ThreadPoolExecutor(max_workers=3) as clients:
+            futures = [clients.submit(service.get_response, '/get_path', request)]
+            started.wait(10)
+            futures += [
+                clients.submit(service.get_response, '/get_path', request)
+                for _ in range(2)
+            ]
+            while service.get_metrics()['coalesced'] < 2:
+                release.wait(0.01)
+            release.set()
+            responses = [future.result() for future in futures]
+        self.assertEqual(len(set(responses)), 1)
+        self.assertEqual(json.loads(responses[0])['bravais_lattice_extended'], 'tI2')
+
+        # Same request, with the keys in a different order: from the cache
+        self.assertEqual(
+            service.get_response(
+                '/get_path', {'symprec': 1e-3, 'structure': STRUCTURE}
+            ),
+            responses[0],
+        )
+        metrics = service.get_metrics()
+        self.assertEqual(metrics['requests'], 4)
+        self.assertEqual(metrics['computations'], 1)
+        self.assertEqual(metrics['coalesced'], 2)
+        self.assertEqual(metrics['cache_hits'], 1)
+        self.assertEqual(metrics['in_flight'], 0)
+        self.assertEqual(metrics['cache_size'], 1)
+        service.close()
+
+    def test_errors(self):
+        """Invalid requests raise RequestError, and are not cached."""
+        from seekpath import server
+
+        service = server.KPathService(max_workers=1, cache_size=0)
+        for endpoint, request in [
+            ('/get_path', {'structure': STRUCTURE, 'reference_distance': 0.1}),
+            ('/get_path', {'structure': {'cell': STRUCTURE['cell']}}),
+            ('/get_explicit_k_path', []),
+            ('/get_bands', {}),
+        ]:
+            with self.assertRaises(server.RequestError):
+                service.get_response(endpoint, request)
+        response = service.get_response(
+            '/get_explicit_k_path', {'structure': STRUCTURE, 'reference_distance': 0.1}
+        )
+        self.assertIn('explicit_kpoints_rel', json.loads(response))
+        metrics = service.get_metrics()
+        self.assertEqual(metrics['errors'], 2)
+        self.assertEqual(metrics['cache_size'], 0)
+        service.close()
+
+
+class TestServer(unittest.TestCase):
+    """Test the HTTP endpoints."""
+
+    def setUp(self):
+        from seekpath import server
+
+        self.server = server.make_server(port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server.service.close()
+        self.thread.join()
+
+    def request(self, path, body=None):
+        """Return the status and the decoded body of a request."""
+        data = None if body is None else json.dumps(body).encode('utf-8')
+        try:
+            with urllib.request.urlopen(self.url + path, data=data) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            return exc.code, json.loads(exc.read())
+
+    def test_endpoints(self):
+        """The path and health endpoints answer with JSON."""
+        import seekpath
+
+        status, body = self.request('/get_path', {'structure': STRUCTURE})
+        self.assertEqual(status, 200)
+        res = seekpath.from_jsonable(body)
+        self.assertEqual(res['path'][0], ('GAMMA', 'X'))
+
+        status, body = self.request('/get_path', {'structure': {}})
+        self.assertEqual(status, 400)
+        self.assertIn('RequestError', body['error'])
+        status, body = self.request('/unknown', {})
+        self.assertEqual(status, 404)
+
+        status, body = self.request('/health')
+        self.assertEqual(status, 200)
+        self.assertEqual(body['status'], 'ok')
+        self.assertEqual(body['metrics']['requests'], 2)
+
+    def test_content_length(self):
+        """Invalid Content-Length headers get a 400, and close the connection."""
+        import http.client
+
+        for length in ['abc', '-5']:
+            connection = http.client.HTTPConnection(
+                '127.0.0.1', self.server.server_address[1], timeout=10
+            )
+            connection.putrequest('POST', '/get_path')
+            connection.putheader('Content-Length', length)
+            connection.endheaders()
+            response = connection.getresponse()
+            self.assertEqual(response.status, 400)
+            self.assertIn('Content-Length', json.loads(response.read())['error'])
+            # The server has closed the connection
+            self.assertEqual(connection.sock.recv(1), b'')
+            connection.close()
+
+    def test_brillouin_zone(self):
+        """The Brillouin zone endpoint returns its faces."""
+        try:
+            import scipy  # noqa: F401
+        except ImportError:
+            self.skipTest('scipy is not installed')
+
+        status, body = self.request('/brillouin_zone', {'cell': STRUCTURE['cell']})
+        self.assertEqual(status, 200)
+        # The Brillouin zone of a tetragonal P lattice is a box
+        self.assertEqual(len(body['faces']), 6)
+
+        # Hexagonal prism, with faces with different numbers of vertices
+        status, body = self.request(
+            '/brillouin_zone',
+            {'cell': [[3.0, 0.0, 0.0], [-1.5, 2.598076211353316, 0.0], [0, 0, 5.0]]},
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(sorted(len(face) for face in body['faces']), [4] * 6 + [6] * 2)
@@ -0,0 +1,105 @@
+"""Test the struct-of-arrays batch of structures."""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+
+def get_structures():
+    """Return a few structures, with different numbers of atoms."""
+    return [
+        (
+            [[-3.0, 0.0, 3.0], [0.0, 3.0, 3.0], [-3.0, 3.0, 0.0]],
+            [[0.0, 0.0, 0.0], [0.25, 0.25, 0.25]],
+            [30, 16],
+        ),
+        ([[4.0, 0, 0], [0, 4.0, 0], [0, 0, 4.0]], [[0, 0, 0]], [1]),
+        (
+            [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 6.0]],
+            [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [0.0, 0.5, 0.25]],
+            [1, 1, 8],
+        ),
+    ]
+
+
+class TestStructureBatch(unittest.TestCase):
+    """Test seekpath.StructureBatch."""
+
+    def test_from_structures(self):
+        """The structures are stored as ragged arrays and returned as views."""
+        import seekpath
+
+        structures = get_structures()
+        batch = seekpath.StructureBatch.from_structures(structures)
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.offsets.tolist(), [0, 2, 3, 6])
+        self.assertEqual(batch.num_atoms.tolist(), [2, 1, 3])
+        for structure, batch_structure in zip(structures, batch):
+            for value, batch_value in zip(structure, batch_structure):
+                np.testing.assert_array_equal(batch_value, value)
+        _cell, positions, numbers = batch[-1]
+        self.assertTrue(np.shares_memory(positions, batch.positions))
+        self.assertTrue(np.shares_memory(numbers, batch.numbers))
+
+        with self.assertRaises(IndexError):
+            batch[3]
+
+    def test_save_load(self):
+        """A batch can be saved and memory-mapped."""
+        import seekpath
+
+        batch = seekpath.StructureBatch.from_structures(get_structures())
+        with tempfile.TemporaryDirectory() as directory:
+            batch.save(os.path.join(directory, 'batch'))
+            loaded = seekpath.StructureBatch.load(os.path.join(directory, 'batch'))
+            self.assertIsInstance(loaded.positions, np.memmap)
+            for name in ['cells', 'positions', 'numbers', 'offsets']:
+                np.testing.assert_array_equal(
+                    getattr(loaded, name), getattr(batch, name)
+                )
+
+            res = seekpath.get_path(loaded[0])
+            self.assertEqual(res['bravais_lattice_extended'], 'cF2')
+            del loaded, res
+
+    def test_batch_functions(self):
+        """A batch is accepted by the batch front ends."""
+        import seekpath
+
+        structures = get_structures()
+        batch = seekpath.StructureBatch.from_structures(structures)
+        results = seekpath.get_path_batch(batch)['results']
+        results_shared = seekpath.get_path_batch_shared_memory(batch, max_workers=1)
+        for structure, res, res_shared in zip(structures, results, results_shared):
+            res_ref = seekpath.get_path(structure)
+            for key in ['bravais_lattice_extended', 'path', 'point_coords']:
+                self.assertEqual(res[key], res_ref[key])
+                self.assertEqual(res_shared[key], res_ref[key])
+            np.testing.assert_array_equal(
+                res_shared['conv_positions'], res_ref['conv_positions']
+            )
+
+    def test_invalid(self):
+        """Inconsistent arrays raise ValueError."""
+        import seekpath
+
+        batch = seekpath.StructureBatch.from_structures(get_structures())
+        with self.assertRaises(ValueError):
+            seekpath.StructureBatch(
+                batch.cells, batch.positions, batch.numbers, [0, 2, 3, 5]
+            )
+        with self.assertRaises(ValueError):
+            seekpath.StructureBatch(
+                batch.cells, batch.positions, batch.numbers, [0, 3, 2, 6]
+            )
+        with self.assertRaises(ValueError):
+            seekpath.StructureBatch(
+                batch.cells, batch.positions, batch.numbers[:-1], batch.offsets
+            )
+        with self.assertRaises(ValueError):
+            seekpath.StructureBatch(
+                batch.cells[0], batch.positions, batch.numbers, batch.offsets
+            )
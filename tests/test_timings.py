@@ -0,0 +1,89 @@
+"""Test the collection of the timings of the stages."""
+
+import threading
+import unittest
+
+CELL = [[4.0, 0.0, 0.0], [0.5, 4.2, 0.0], [0.3, 0.7, 6.0]]
+
+
+class TestTimings(unittest.TestCase):
+    """Test seekpath.timings."""
+
+    def test_collect(self):
+        """The stages run within collect_timings are timed."""
+        import seekpath
+        from seekpath.hpkot.tools import clear_lattice_cache
+        from seekpath.timings import collect_timings, format_timings
+
+        clear_lattice_cache()
+        structure = (CELL, [[0.0, 0.0, 0.0], [0.1, 0.2, 0.3]], [1, 2])
+        with collect_timings() as timings:
+            seekpath.get_explicit_k_path(structure, with_time_reversal=False)
+            seekpath.get_path_orig_cell(structure)
+        self.assertEqual(timings['hpkot.get_path']['calls'], 2)
+        self.assertEqual(timings['hpkot.spglib']['calls'], 2)
+        self.assertEqual(timings['hpkot.niggli']['calls'], 2)
+        self.assertEqual(timings['hpkot.get_primitive']['calls'], 2)
+        self.assertEqual(timings['getpaths.get_explicit_k_path']['calls'], 1)
+        self.assertEqual(timings['getpaths.get_explicit_from_implicit']['calls'], 1)
+        # get_path_orig_cell calls get_path
+        self.assertEqual(timings['getpaths.get_path']['calls'], 1)
+        self.assertEqual(timings['getpaths.get_path_orig_cell']['calls'], 1)
+        self.assertIn('hpkot.kparams', timings)
+        self.assertIn('hpkot.get_path_data', timings)
+        self.assertGreaterEqual(
+            timings['hpkot.get_path']['total'], timings['hpkot.spglib']['total']
+        )
+        self.assertIn('hpkot.spglib', format_timings(timings))
+
+        # Not collected any more
+        seekpath.get_path(structure)
+        self.assertEqual(timings['hpkot.get_path']['calls'], 2)
+
+    def test_augment_path(self):
+        """The augmentation of the path is timed, without inversion symmetry."""
+        import seekpath
+        from seekpath.hpkot.tools import clear_lattice_cache
+        from seekpath.timings import collect_timings
+
+        clear_lattice_cache()
+        # Zincblende (F-43m), without inversion symmetry
+        cell = [[0.0, 2.7, 2.7], [2.7, 0.0, 2.7], [2.7, 2.7, 0.0]]
+        structure = (cell, [[0.0, 0.0, 0.0], [0.25, 0.25, 0.25]], [30, 16])
+        with collect_timings() as timings:
+            seekpath.get_path(structure, with_time_reversal=False)
+        self.assertEqual(timings['hpkot.augment_path']['calls'], 1)
+
+    def test_nested_and_threads(self):
+        """Nested collections are merged, and other threads are not affected."""
+        from seekpath.timings import collect_timings, stage
+
+        def run_stage():
+            with stage('other'):
+                pass
+
+        with collect_timings() as outer:
+            with stage('a'):
+                pass
+            with collect_timings() as inner:
+                with stage('a'):
+                    pass
+                thread = threading.Thread(target=run_stage)
+                thread.start()
+                thread.join()
+            self.assertEqual(inner['a']['calls'], 1)
+        self.assertEqual(outer['a']['calls'], 2)
+        self.assertNotIn('other', outer)
+
+    def test_brillouin_zone(self):
+        """The construction of the Brillouin zone is timed."""
+        try:
+            import scipy  # noqa: F401
+        except ImportError:
+            self.skipTest('scipy is not installed')
+        from seekpath.brillouinzone import BZ
+        from seekpath.timings import collect_timings
+
+        with collect_timings() as timings:
+            BZ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0])
+        self.assertEqual(timings['BZ']['calls'], 1)
@@ -0,0 +1,246 @@
+"""Test the incremental k-paths along trajectories."""
+
+import unittest
+
+import numpy as np
+
+
+def get_frames(num_frames=5, seed=0):
+    """
+    Return the frames of a wurtzite-like hexagonal structure, with small
+    (symmetry-preserving, within the tolerance) noise and a rigid drift.
+    """
+    rng = np.random.default_rng(seed)
+    a, c, u = 3.2, 5.2, 0.375
+    cell = np.array([[a, 0.0, 0.0], [-a / 2.0, a * np.sqrt(3.0) / 2.0, 0.0], [0, 0, c]])
+    positions = np.array(
+        [
+            [1.0 / 3.0, 2.0 / 3.0, 0.0],
+            [2.0 / 3.0, 1.0 / 3.0, 0.5],
+            [1.0 / 3.0, 2.0 / 3.0, u],
+            [2.0 / 3.0, 1.0 / 3.0, 0.5 + u],
+        ]
+    )
+    numbers = [30, 30, 8, 8]
+    frames = []
+    for idx in range(num_frames):
+        frame_cell = cell * (1.0 + 0.001 * idx)
+        frame_positions = (
+            positions + 0.01 * idx + rng.normal(scale=1.0e-8, size=positions.shape)
+        )
+        frames.append((frame_cell.tolist(), frame_positions.tolist(), numbers))
+    return frames
+
+
+class TestGetPathTrajectory(unittest.TestCase):
+    """Test seekpath.get_path_trajectory."""
+
+    def assert_same_path(self, res, res_ref):
+        """Check that two get_path results are the same (within 1e-6)."""
+        for key in [
+            'bravais_lattice_extended',
+            'spacegroup_number',
+            'path',
+            'has_inversion_symmetry',
+        ]:
+            self.assertEqual(res[key], res_ref[key])
+        self.assertEqual(list(res['point_coords']), list(res_ref['point_coords']))
+        for label, coords in res_ref['point_coords'].items():
+            np.testing.assert_allclose(res['point_coords'][label], coords, atol=1e-6)
+        for key in [
+            'conv_lattice',
+            'primitive_lattice',
+            'reciprocal_primitive_lattice',
+            'rotation_matrix',
+            'transformation_matrix',
+        ]:
+            np.testing.assert_allclose(res[key], res_ref[key], atol=1e-6)
+        self.assertEqual(
+            sorted(
+                zip(
+                    res['conv_types'],
+                    np.round(np.round(res['conv_positions'], 5) % 1.0, 5).tolist(),
+                )
+            ),
+            sorted(
+                zip(
+                    res_ref['conv_types'],
+                    np.round(np.round(res_ref['conv_positions'], 5) % 1.0, 5).tolist(),
+                )
+            ),
+        )
+
+    def test_no_transitions(self):
+        """Only the first frame is analysed with spglib."""
+        import seekpath
+
+        frames = get_frames()
+        trajectory = seekpath.get_path_trajectory(frames)
+
+        self.assertEqual(trajectory['transition_frames'], [0])
+        self.assertEqual(trajectory['num_frames'], len(frames))
+        for frame, res in zip(frames, trajectory['results']):
+            self.assert_same_path(res, seekpath.get_path(frame))
+
+    def test_transition(self):
+        """The analysis is run again when the symmetry is broken."""
+        import seekpath
+
+        frames = get_frames()
+        cell, positions, numbers = frames[3]
+        positions = np.array(positions)
+        positions[0, 0] += 0.05
+        frames[3] = (cell, positions.tolist(), numbers)
+
+        trajectory = seekpath.get_path_trajectory(frames)
+        # Frame 4 is again symmetric, but with respect to frame 3 (the new
+        # reference, with lower symmetry) the check is passed: the increase
+        # of symmetry is not detected
+        self.assertEqual(trajectory['transition_frames'], [0, 3])
+        results = trajectory['results']
+        self.assertEqual(results[2]['spacegroup_number'], 186)
+        self.assertNotEqual(results[3]['spacegroup_number'], 186)
+        self.assert_same_path(results[3], seekpath.get_path(frames[3]))
+
+        trajectory = seekpath.get_path_trajectory(frames, recheck_interval=1)
+        self.assertEqual(trajectory['transition_frames'], [0, 1, 2, 3, 4])
+        self.assertEqual(trajectory['results'][4]['spacegroup_number'], 186)
+
+    def test_deformation(self):
+        """
+        The conventional cell follows the choice of spglib when the cell is
+        deformed, e.g. for a
+        monoclinic cell with an increasing angle, or an orthorhombic cell
+        with axes whose order of length changes.
+        """
+        import seekpath
+
+        frames = []
+        for beta in np.radians(np.linspace(95.0, 150.0, 40)):
+            cell = [
+                [4.0, 0, 0],
+                [0, 5.0, 0],
+                [6.0 * np.cos(beta), 0, 6.0 * np.sin(beta)],
+            ]
+            positions = [
+                [0.0, 0.0, 0.0],
+                [0.3, 0.0, 0.2],
+                [0.7, 0.0, 0.8],
+                [0.1, 0.5, 0.6],
+                [0.9, 0.5, 0.4],
+            ]
+            frames.append((cell, positions, [1, 2, 2, 3, 3]))
+        for c in np.linspace(3.5, 5.5, 40):
+            # Body-centred (Immm), with c crossing a
+            cell = [[4.5, 0, 0], [0, 6.0, 0], [0, 0, c]]
+            positions = [
+                [0.0, 0.0, 0.0],
+                [0.5, 0.5, 0.5],
+                [0.2, 0.0, 0.0],
+                [0.8, 0.0, 0.0],
+                [0.7, 0.5, 0.5],
+                [0.3, 0.5, 0.5],
+            ]
+            frames.append((cell, positions, [1, 1, 2, 2, 2, 2]))
+
+        trajectory = seekpath.get_path_trajectory(frames)
+        # The reference frames are still reused between the changes of setting
+        self.assertLess(len(trajectory['transition_frames']), len(frames) // 4)
+        for frame, res in zip(frames, trajectory['results']):
+            self.assert_same_path(res, seekpath.get_path(frame))
+
+    def test_strained_frames(self):
+        """
+        Every frame agrees with hpkot.get_path for random strains, also
+        when spglib picks another (e.g. rotated) conventional cell because
+        the Delaunay reduction of the primitive cell changes.
+        """
+        import glob
+        import os
+        import warnings
+
+        from test_paths_hpkot import simple_read_poscar
+
+        import seekpath
+        from seekpath import hpkot
+
+        rng = np.random.default_rng(0)
+        folder = os.path.join(
+            os.path.dirname(seekpath.__file__), 'hpkot', 'band_path_data'
+        )
+        for bravais in ['aP3', 'mC1', 'hR1', 'oI3']:
+            for path in sorted(glob.glob(os.path.join(folder, bravais, 'POSCAR*'))):
+                cell, positions, numbers = simple_read_poscar(path)
+                frames = []
+                for _ in range(15):
+                    strain = rng.normal(scale=2.0e-3, size=(3, 3))
+                    strain = (strain + strain.T) / 2.0
+                    frames.append(
+                        (np.dot(cell, np.eye(3) + strain), positions, numbers)
+                    )
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', hpkot.EdgeCaseWarning)
+                    trajectory = seekpath.get_path_trajectory(frames)
+                    for frame, res in zip(frames, trajectory['results']):
+                        with self.subTest(path=path):
+                            self.assert_same_path(res, hpkot.get_path(frame))
+
+    def test_supercell(self):
+        """
+        The symmetry reference of a large supercell is cheap to build: the
+        trajectory is not slower than get_path on each frame.
+        """
+        import time
+
+        import seekpath
+
+        positions = np.array(
+            [[0.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.5, 0.0, 0.5], [0.0, 0.5, 0.5]]
+        )
+        # A 3x3x3 supercell of the fcc conventional cell (108 atoms)
+        shifts = np.array(
+            [[i, j, k] for i in range(3) for j in range(3) for k in range(3)]
+        )
+        positions = np.reshape(positions[np.newaxis] + shifts[:, np.newaxis], (-1, 3))
+        # (Without noise on the positions: spglib would then pick the origin
+        # randomly between the sites 4a and 4b)
+        frames = [
+            (np.eye(3) * (12.0 + 0.01 * idx), positions / 3.0, [1] * len(positions))
+            for idx in range(10)
+        ]
+
+        start = time.perf_counter()
+        trajectory = seekpath.get_path_trajectory(frames)
+        trajectory_time = time.perf_counter() - start
+        start = time.perf_counter()
+        results = [seekpath.get_path(frame) for frame in frames]
+        get_path_time = time.perf_counter() - start
+
+        self.assertEqual(trajectory['transition_frames'], [0])
+        for res, res_ref in zip(trajectory['results'], results):
+            self.assert_same_path(res, res_ref)
+        self.assertLess(trajectory_time, 2.0 * get_path_time)
+
+    def test_output(self):
+        """The 'numpy' and 'result' outputs are supported."""
+        import seekpath
+
+        frames = get_frames(num_frames=2)
+        res_numpy = seekpath.get_path_trajectory(frames, output='numpy')['results'][1]
+        res_dict = seekpath.get_path_trajectory(frames)['results'][1]
+        self.assertEqual(res_numpy['point_labels'], tuple(res_dict['point_coords']))
+        np.testing.assert_array_equal(
+            res_numpy['point_coords'], list(res_dict['point_coords'].values())
+        )
+
+        res_obj = seekpath.get_path_trajectory(frames, output='result')['results'][1]
+        self.assertIsInstance(res_obj, seekpath.PathResult)
+
+    def test_invalid(self):
+        """Invalid parameters raise ValueError."""
+        import seekpath
+
+        with self.assertRaises(ValueError):
+            seekpath.get_path_trajectory(get_frames(), recipe='unknown')
+        with self.assertRaises(ValueError):
+            seekpath.get_path_trajectory(get_frames(), recheck_interval=0)
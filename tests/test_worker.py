@@ -0,0 +1,100 @@
+"""Test the JSON-lines worker."""
+
+import io
+import json
+import subprocess
+import sys
+import unittest
+
+CELL = [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 6.0]]
+
+
+def get_input_lines():
+    """Return input lines, including invalid ones."""
+    structure = [CELL, [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]], [1, 1]]
+    return [
+        json.dumps({'id': 'tI', 'structure': structure}),
+        '',
+        json.dumps(
+            {
+                'id': 7,
+                'structure': {
+                    'cell': CELL,
+                    'positions': [[0.0, 0.0, 0.0]],
+                    'numbers': [1],
+                },
+                'function': 'get_explicit_k_path',
+                'parameters': {'reference_distance': 0.1},
+            }
+        ),
+        'not json',
+        json.dumps({'structure': structure, 'function': 'get_bands'}),
+        json.dumps({'structure': structure, 'parameters': {'symprec_': 1e-3}}),
+    ]
+
+
+class TestWorker(unittest.TestCase):
+    """Test seekpath.worker."""
+
+    def check_outputs(self, outputs):
+        """Check the outputs of the lines of get_input_lines."""
+        self.assertEqual([output['index'] for output in outputs], list(range(5)))
+        self.assertEqual(
+            [output['id'] for output in outputs], ['tI', 7, None, None, None]
+        )
+        self.assertEqual(outputs[0]['result']['bravais_lattice_extended'], 'tI2')
+        self.assertIn('explicit_kpoints_rel', outputs[1]['result'])
+        self.assertEqual(outputs[2]['error']['type'], 'JSONDecodeError')
+        self.assertEqual(outputs[3]['error']['type'], 'ValueError')
+        self.assertEqual(outputs[4]['error']['type'], 'TypeError')
+
+    def test_run(self):
+        """Results and errors are written in order, also in parallel."""
+        from seekpath import worker
+
+        for jobs, ordered in [(1, True), (2, True), (2, False)]:
+            stdout = io.StringIO()
+            num_lines = worker.run(
+                io.StringIO('\n'.join(get_input_lines()) + '\n'),
+                stdout,
+                jobs=jobs,
+                ordered=ordered,
+                max_pending=2,
+            )
+            self.assertEqual(num_lines, 5)
+            outputs = [json.loads(line) for line in stdout.getvalue().splitlines()]
+            if not ordered:
+                outputs.sort(key=lambda output: output['index'])
+            self.check_outputs(outputs)
+
+        with self.assertRaises(ValueError):
+            worker.run(io.StringIO(), io.StringIO(), function='get_bands')
+
+    def test_indices(self):
+        """Empty lines are not counted, and records must be JSON objects."""
+        from seekpath import worker
+
+        stdout = io.StringIO()
+        worker.run(io.StringIO('\n[1, 2]\n\n[]\n'), stdout)
+        outputs = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([output['index'] for output in outputs], [0, 1])
+        for output in outputs:
+            self.assertEqual(output['error']['type'], 'TypeError')
+
+    def test_interactive(self):
+        """Each result is written as soon as it is computed."""
+        for jobs in ['1', '2']:
+            with subprocess.Popen(
+                [sys.executable, '-m', 'seekpath.worker', '--jobs', jobs],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            ) as process:
+                for line in get_input_lines()[:3]:
+                    process.stdin.write(line + '\n')
+                    process.stdin.flush()
+                    if line:
+                        self.assertIn('"index"', process.stdout.readline())
+                process.stdin.close()
+                self.assertEqual(process.stdout.read(), '')
+            self.assertEqual(process.returncode, 0)
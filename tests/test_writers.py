@@ -0,0 +1,131 @@
+"""Test the writers of the k-paths."""
+
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+
+def get_explicit_path(output='dict'):
+    """
+    Return the explicit path of a tI structure, whose path has
+    discontinuities.
+    """
+    import seekpath
+
+    structure = (
+        [[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 6.0]],
+        [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]],
+        [1, 1],
+    )
+    return seekpath.get_explicit_k_path(
+        structure, reference_distance=0.1, output=output
+    )
+
+
+class TestWriters(unittest.TestCase):
+    """Test seekpath.writers."""
+
+    def test_qe(self):
+        """The crystal_b points reproduce the explicit path."""
+        from seekpath import writers
+
+        res = get_explicit_path()
+        handle = io.StringIO()
+        writers.write_qe_kpoints(res, handle)
+        lines = handle.getvalue().splitlines()
+        self.assertEqual(lines[0], 'K_POINTS crystal_b')
+        self.assertEqual(int(lines[1]), len(lines) - 2)
+
+        # Rebuild the explicit path from the crystal_b points, as pw.x does
+        # (a weight of 1 is a jump to the next point)
+        points = [line.split('!')[0].split() for line in lines[2:]]
+        coords = np.array([point[:3] for point in points], dtype=float)
+        weights = [int(point[3]) for point in points]
+        kpoints = []
+        for idx in range(len(points) - 1):
+            steps = np.arange(weights[idx])[:, None] / weights[idx]
+            kpoints.extend(coords[idx] + (coords[idx + 1] - coords[idx]) * steps)
+        kpoints.append(coords[-1])
+        kpoints_ref = res['explicit_kpoints_rel']
+        self.assertEqual(len(kpoints), len(kpoints_ref))
+        np.testing.assert_allclose(kpoints, kpoints_ref, atol=1e-9)
+
+        handle = io.StringIO()
+        writers.write_qe_kpoints(res, handle, mode='crystal')
+        lines = handle.getvalue().splitlines()
+        self.assertEqual(lines[:2], ['K_POINTS crystal', str(len(kpoints_ref))])
+        np.testing.assert_allclose(np.loadtxt(lines[2:])[:, :3], kpoints_ref, atol=1e-9)
+
+    def test_explicit_chunks(self):
+        """Explicit lists longer than a chunk are written completely."""
+        from unittest import mock
+
+        from seekpath import writers
+
+        res = get_explicit_path()
+        kpoints_ref = res['explicit_kpoints_rel']
+        for writer_format in ['vasp_explicit', 'castep_list']:
+            handle = io.StringIO()
+            with mock.patch.object(writers, 'CHUNKSIZE', 7):
+                writers.write_kpoints(res, handle, writer_format)
+            lines = handle.getvalue().splitlines()
+            rows = np.loadtxt(
+                lines[3:] if writer_format == 'vasp_explicit' else lines[1:-1]
+            )
+            np.testing.assert_allclose(rows[:, :3], kpoints_ref, atol=1e-9)
+            if writer_format == 'castep_list':
+                self.assertAlmostEqual(rows[:, 3].sum(), 1.0)
+
+    def test_path_formats(self):
+        """The line-mode formats list the segments of the path."""
+        from seekpath import writers
+
+        for output in ['dict', 'numpy', 'result']:
+            res = get_explicit_path(output=output)
+            num_segments = len(res['path'])
+
+            handle = io.StringIO()
+            writers.write_kpoints(res, handle, 'vasp_line')
+            lines = handle.getvalue().splitlines()
+            self.assertEqual(lines[2:4], ['Line-mode', 'Reciprocal'])
+            self.assertEqual(
+                len([line for line in lines[4:] if '!' in line]), 2 * num_segments
+            )
+
+            handle = io.StringIO()
+            writers.write_kpoints(res, handle, 'wannier90')
+            lines = handle.getvalue().splitlines()
+            self.assertEqual(lines[0], 'begin kpoint_path')
+            self.assertEqual(lines[-1], 'end kpoint_path')
+            self.assertEqual(lines[1].split()[0], 'GAMMA')
+            self.assertEqual(len(lines), num_segments + 2)
+
+            handle = io.StringIO()
+            writers.write_kpoints(res, handle, 'castep_path')
+            lines = handle.getvalue().splitlines()
+            num_breaks = lines.count('BREAK')
+            self.assertGreater(num_breaks, 0)
+            # One point per segment, plus one at the end of each continuous part
+            self.assertEqual(len(lines) - 2 - num_breaks, num_segments + num_breaks + 1)
+
+    def test_path_and_errors(self):
+        """Writers accept paths, and invalid formats raise ValueError."""
+        from seekpath import writers
+
+        res = get_explicit_path()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'KPOINTS')
+            writers.write_kpoints(res, path, 'vasp_line')
+            with open(path) as handle:
+                self.assertEqual(handle.readline(), 'k-path generated by seekpath\n')
+
+            with self.assertRaises(ValueError):
+                writers.write_kpoints(res, path, 'abinit')
+            with self.assertRaises(ValueError):
+                writers.write_qe_kpoints(
+                    res, os.path.join(directory, 'x'), mode='tpiba'
+                )
+            self.assertFalse(os.path.exists(os.path.join(directory, 'x')))